@@ -0,0 +1,150 @@
+# Compression benchmark.
+#
+# Sends frames with a texture upload and a drawScene()-like batch
+# from a source to a sink through the relay from main.py, with and
+# without permessage-deflate and zlib on large segments. The sink
+# decodes each frame and acknowledges it. Both connections go through
+# a TCP forwarder that counts the bytes on each hop and can limit the
+# bandwidth, to stand in for a remote display.
+#
+#     python benchmarks/compression.py --count 50 --bandwidth 20
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image
+from websockets.asyncio.client import connect
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from relay import control, free_port, make_batch, start_relay  # noqa: E402
+from rpc import PROTOCOL_VERSION, TypedArray, decode_packet, encode_packet  # noqa: E402
+
+SETTINGS = [
+    ("none", None, None),
+    ("permessage-deflate", "deflate", None),
+    ("segments", None, 1024),
+    ("both", "deflate", 1024),
+]
+
+
+class Forwarder:
+    # Forwards TCP connections to the relay, counting the bytes in each
+    # direction and sleeping to stay within the bandwidth in bytes/s.
+    def __init__(self, port, bandwidth=None):
+        self.port = port
+        self.bandwidth = bandwidth
+        self.sent = 0
+        self.received = 0
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._accept, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+
+    async def _accept(self, reader, writer):
+        upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", self.port)
+        await asyncio.gather(
+            self._pipe(reader, upstream_writer, "sent"),
+            self._pipe(upstream_reader, writer, "received"))
+
+    async def _pipe(self, reader, writer, counter):
+        try:
+            while data := await reader.read(65536):
+                setattr(self, counter, getattr(self, counter) + len(data))
+                if self.bandwidth:
+                    await asyncio.sleep(len(data) / self.bandwidth)
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def make_frame():
+    with Image.open(ROOT / "debian-logo.png") as im:
+        pixels = im.convert("RGBA").resize((256, 256)).tobytes()
+    batch = make_batch()
+    batch.insert(0, {
+        "jsonrpc": PROTOCOL_VERSION,
+        "method": "texSubImage2D",
+        "params": [None, 3553, 0, 0, 0, 256, 256, 6408, 5121, TypedArray("Uint8Array", pixels)],
+    })
+    return batch
+
+
+async def measure(port, name, compression, threshold, count, bandwidth):
+    source_hop = Forwarder(port, bandwidth)
+    sink_hop = Forwarder(port, bandwidth)
+    source_uri = f"ws://127.0.0.1:{await source_hop.start()}/ws"
+    sink_uri = f"ws://127.0.0.1:{await sink_hop.start()}/ws"
+    batch = make_frame()
+    latencies = []
+    async with connect(sink_uri, compression=compression, max_size=None) as sink, \
+            connect(source_uri, compression=compression, max_size=None) as source:
+        await sink.send(encode_packet(control("__listen__", "sink")))
+        await source.send(encode_packet(control("__connect__", "sink")))
+        await asyncio.sleep(0.2)
+
+        async def acknowledge():
+            while True:
+                packet = decode_packet(await sink.recv())
+                await sink.send(encode_packet({
+                    "to": packet["from"],
+                    "body": {"jsonrpc": PROTOCOL_VERSION, "method": "__presented__", "params": [0]},
+                }))
+
+        acknowledger = asyncio.create_task(acknowledge())
+        sent, received = source_hop.sent, sink_hop.received
+        for _ in range(count):
+            start = time.perf_counter()
+            await source.send(encode_packet({"to": "sink", "body": batch}, True, threshold))
+            await source.recv()
+            latencies.append(time.perf_counter() - start)
+        sent, received = source_hop.sent - sent, sink_hop.received - received
+        acknowledger.cancel()
+    await source_hop.stop()
+    await sink_hop.stop()
+    return {
+        "setting": name,
+        "client_to_relay_bytes_per_frame": sent / count,
+        "relay_to_browser_bytes_per_frame": received / count,
+        "mean_latency_ms": statistics.mean(latencies) * 1000,
+        "p95_latency_ms": statistics.quantiles(latencies, n=20)[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--bandwidth", type=float, default=None, help="Mbit/s on each hop")
+    args = parser.parse_args()
+    bandwidth = args.bandwidth * 1e6 / 8 if args.bandwidth else None
+
+    port = free_port()
+    relay = start_relay(port)
+    try:
+        for name, compression, threshold in SETTINGS:
+            result = asyncio.run(measure(port, name, compression, threshold, args.count, bandwidth))
+            print(
+                f"{result['setting']:>18}:"
+                f" {result['client_to_relay_bytes_per_frame']:9.0f} bytes/frame up"
+                f" {result['relay_to_browser_bytes_per_frame']:9.0f} bytes/frame down"
+                f" {result['mean_latency_ms']:8.2f} ms mean"
+                f" {result['p95_latency_ms']:8.2f} ms p95")
+    finally:
+        relay.terminate()
+        relay.wait()
+
+
+if __name__ == "__main__":
+    main()
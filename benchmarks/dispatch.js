@@ -0,0 +1,97 @@
+// Browser-side dispatch benchmark.
+//
+// Runs Server.onReceive from main.js on the calls of one drawScene()
+// of test.py, once as per-call JSON-RPC objects looked up by method
+// name and once as compact calls dispatched by index, against a
+// context whose methods do nothing.
+//
+//     node benchmarks/dispatch.js [count]
+
+"use strict";
+
+const fs = require("fs");
+const path = require("path");
+const vm = require("vm");
+
+const root = path.resolve(__dirname, "..");
+vm.runInThisContext(fs.readFileSync(path.join(root, "webgl.js"), "utf8"));
+vm.runInThisContext(fs.readFileSync(path.join(root, "main.js"), "utf8"));
+
+class WebGLRenderingContext {}
+for (const name of WEBGL_METHODS) {
+    WebGLRenderingContext.prototype[name] = function () {};
+}
+
+const server = new Server("browser", null);
+server.registerDefaultMethods();
+const objects = {
+    gl: [-1, new WebGLRenderingContext()],
+    program: [-2, {}],
+    projection: [-3, {}],
+    modelView: [-4, {}],
+    sampler: [-5, {}],
+    position: [-6, {}],
+    textureCoord: [-7, {}],
+    indices: [-8, {}],
+    texture: [-9, {}],
+};
+for (const [objectId, value] of Object.values(objects)) {
+    server.storeObject(objectId, value);
+}
+const ref = (name) => ({__jsonclass__: ["Object", objects[name][0]]});
+const matrix = {__jsonclass__: ["Float32Array", {segment: 0}]};
+const segments = [new Uint8Array(64)];
+
+const frame = [
+    ["clearColor", 0.0, 0.0, 0.0, 1.0],
+    ["clearDepth", 1.0],
+    ["enable", 2929],
+    ["depthFunc", 515],
+    ["clear", 16640],
+    ["bindBuffer", 34962, ref("position")],
+    ["vertexAttribPointer", 0, 3, 5126, false, 0, 0],
+    ["enableVertexAttribArray", 0],
+    ["bindBuffer", 34962, ref("textureCoord")],
+    ["vertexAttribPointer", 1, 2, 5126, false, 0, 0],
+    ["enableVertexAttribArray", 1],
+    ["bindBuffer", 34963, ref("indices")],
+    ["useProgram", ref("program")],
+    ["uniformMatrix4fv", ref("projection"), false, matrix],
+    ["uniformMatrix4fv", ref("modelView"), false, matrix],
+    ["activeTexture", 33984],
+    ["bindTexture", 3553, ref("texture")],
+    ["uniform1i", ref("sampler"), 0],
+    ["drawElements", 4, 36, 5123, 0],
+];
+
+const legacy = frame.map(([method, ...params]) => ({
+    jsonrpc: PROTOCOL_VERSION,
+    method: method,
+    params: [ref("gl"), ...params],
+}));
+const compact = {
+    jsonrpc: PROTOCOL_VERSION,
+    calls: frame.map(([method, ...params]) =>
+        [WEBGL_METHODS.indexOf(method), ref("gl"), ...params]),
+};
+
+function measure(label, body, count) {
+    // Bodies are parsed again for each frame, like in the browser.
+    const text = JSON.stringify(body);
+    for (let i = 0; i < count / 10; i++) {
+        server.onReceive(null, JSON.parse(text), segments);
+    }
+    const start = performance.now();
+    for (let i = 0; i < count; i++) {
+        server.onReceive(null, JSON.parse(text), segments);
+    }
+    const elapsed = performance.now() - start;
+    console.log(`${label.padEnd(8)} ${String(text.length).padStart(6)} bytes/frame ` +
+                `${(elapsed / count * 1000).toFixed(2).padStart(8)} us/frame`);
+    return elapsed;
+}
+
+const count = Number(process.argv[2] || 20000);
+const before = measure("legacy", legacy, count);
+const after = measure("opcodes", compact, count);
+console.log(`         ${Math.round((1 - after / before) * 100)}% faster`);
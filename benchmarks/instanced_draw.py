@@ -0,0 +1,128 @@
+# Instanced drawing benchmark.
+#
+# Draws the same cube --count times per frame, once with a uniform
+# update and a drawElements() per cube and once through
+# instancing.InstancedRenderer, and prints the calls, the size of the
+# encoded frame and the time the script spends building and encoding
+# it, for a WebGL2 context and a WebGL1 one with ANGLE_instanced_arrays.
+#
+#     python benchmarks/instanced_draw.py --count 10000 --frames 20
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import webgl  # noqa: E402
+from glmatrix import mat4  # noqa: E402
+from glstate import StateShadowingMixin  # noqa: E402
+from instancing import ANGLEInstancedArrays, InstancedRenderer  # noqa: E402
+from rpc import ObjectProxy, ServerProxy, encode_packet  # noqa: E402
+
+GL = webgl.WebGLRenderingContextBase
+MODEL, COLOR = 2, 6
+
+
+class CaptureTransport:
+    binary = True
+
+    def __init__(self):
+        self.bodies = []
+
+    def connect(self, to_addr):
+        pass
+
+    def send(self, to_addr, body):
+        self.bodies.append(body)
+
+
+class WebGLContext(StateShadowingMixin, ObjectProxy, webgl.WebGLRenderingContext):
+    pass
+
+
+class WebGL2Context(StateShadowingMixin, ObjectProxy, webgl.WebGL2RenderingContext):
+    pass
+
+
+def make_context(context_class, constructor):
+    transport = CaptureTransport()
+    proxy = ServerProxy("browser", transport, allocate_ids=True, methods=webgl.METHODS,
+                        arguments=webgl.ARGUMENTS)
+    for k, v in webgl.INTERFACES.items():
+        class _Class(ObjectProxy, v):
+            __slots__ = ()
+        proxy.register_constructor(k, _Class)
+    gl = context_class(proxy, constructor, proxy._allocate_object_id())
+    return gl, transport
+
+
+def transforms(count, t):
+    # One translation and rotation per cube, as a batch of mat4.
+    models = mat4.create(count)
+    grid = np.arange(count)
+    offsets = np.stack([grid % 100 - 50, grid // 100 - 50, np.full(count, -150)], axis=1)
+    mat4.translate(models, models, offsets.astype(np.float32))
+    mat4.rotateY(models, models, t + grid * 0.01)
+    return models
+
+
+def per_object(gl, models, colors, locations):
+    model_location, color_location = locations
+    for model, color in zip(models, colors):
+        gl.uniformMatrix4fv(model_location, False, model)
+        gl.uniform4fv(color_location, color)
+        gl.drawElements(gl.TRIANGLES, 36, gl.UNSIGNED_SHORT, 0)
+
+
+def run(name, gl, transport, draw, frames):
+    proxy = gl.proxy
+    calls = size = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        draw(frame / 60)
+        proxy.flush()
+        # Large frames are sent in several batches.
+        for body in transport.bodies:
+            calls += body.count
+            size += len(encode_packet({"to": "browser", "body": body}))
+        transport.bodies.clear()
+    elapsed = (time.perf_counter() - start) / frames
+    print(f"{name:28} {calls / frames:10.0f} {size / frames / 1024:10.1f} {elapsed * 1000:10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    colors = np.random.default_rng(0).random((args.count, 4), dtype=np.float32)
+    print(f"{'path':28} {'calls':>10} {'KiB':>10} {'ms':>10}")
+
+    gl, transport = make_context(WebGL2Context, "WebGL2RenderingContext")
+    locations = (gl.proxy.constructors["WebGLUniformLocation"](gl.proxy, "WebGLUniformLocation", -100),
+                 gl.proxy.constructors["WebGLUniformLocation"](gl.proxy, "WebGLUniformLocation", -101))
+    run("per object", gl, transport,
+        lambda t: per_object(gl, transforms(args.count, t), colors, locations), args.frames)
+
+    renderer = InstancedRenderer(gl, {MODEL: 16, COLOR: 4})
+
+    def instanced(t):
+        renderer.update({MODEL: transforms(args.count, t), COLOR: colors})
+        renderer.draw_elements(GL.TRIANGLES, 36, GL.UNSIGNED_SHORT, 0)
+
+    run("instanced (WebGL2)", gl, transport, instanced, args.frames)
+
+    gl, transport = make_context(WebGLContext, "WebGLRenderingContext")
+    extension = ANGLEInstancedArrays(gl.proxy, "ANGLEInstancedArrays", gl.proxy._allocate_object_id())
+    renderer = InstancedRenderer(gl, {MODEL: 16, COLOR: 4}, extension=extension)
+    run("instanced (ANGLE extension)", gl, transport, instanced, args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Proxy call benchmark.
+#
+# Measures how many calls per second a WebGL context proxy appends to
+# the batch, for a few methods of drawScene() in test.py, through the
+# generated methods and through ServerProxy.invoke_procedure(), the
+# generic path that the generated methods took before they appended
+# to the batch directly.
+#
+#     python benchmarks/proxy_calls.py --count 200000
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import webgl  # noqa: E402
+from rpc import ObjectProxy, ServerProxy  # noqa: E402
+
+GL = webgl.WebGLRenderingContextBase
+
+# Calls are appended in chunks, and the batch is sent to a transport
+# that drops it in between.
+CHUNK = 1000
+
+
+class NullTransport:
+    binary = True
+
+    def connect(self, to_addr):
+        pass
+
+    def send(self, to_addr, body):
+        pass
+
+
+class WebGLContext(ObjectProxy, webgl.WebGLRenderingContext):
+    __slots__ = ()
+
+
+def make_calls(proxy):
+    def new(constructor):
+        return proxy.constructors[constructor](proxy, constructor, proxy._allocate_object_id())
+
+    location = new("WebGLUniformLocation")
+    return [
+        ("clearColor", (0.0, 0.0, 0.0, 1.0)),
+        ("enable", (GL.DEPTH_TEST,)),
+        ("bindBuffer", (GL.ARRAY_BUFFER, new("WebGLBuffer"))),
+        ("vertexAttribPointer", (0, 3, GL.FLOAT, False, 0, 0)),
+        ("uniform1i", (location, 0)),
+        ("uniformMatrix4fv", (location, False, np.eye(4, dtype=np.float32).ravel())),
+        ("drawElements", (GL.TRIANGLES, 36, GL.UNSIGNED_SHORT, 0)),
+    ]
+
+
+def measure(proxy, call, count):
+    start = time.perf_counter()
+    for _ in range(count // CHUNK):
+        for _ in range(CHUNK):
+            call()
+        proxy.flush()
+    return count // CHUNK * CHUNK / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    proxy = ServerProxy("browser", NullTransport(), allocate_ids=True, methods=webgl.METHODS)
+    for k, v in webgl.INTERFACES.items():
+        class _Class(ObjectProxy, v):
+            __slots__ = ()
+        proxy.register_constructor(k, _Class)
+    gl = WebGLContext(proxy, "WebGLRenderingContext", proxy._allocate_object_id())
+
+    print(f"{'method':20} {'generic':>12} {'generated':>12}")
+    for name, params in make_calls(proxy):
+        method = getattr(gl, name)
+        generic = measure(proxy, lambda: proxy.invoke_procedure(name, gl, *params), args.count)
+        generated = measure(proxy, lambda: method(*params), args.count)
+        print(f"{name:20} {generic:10.0f}/s {generated:10.0f}/s {generated / generic:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
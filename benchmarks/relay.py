@@ -0,0 +1,133 @@
+# Relay throughput benchmark.
+#
+# Starts the relay from main.py with uvicorn, connects a source and a
+# sink through it and pushes the same draw call batch from one to the
+# other, once as JSON text frames (parsed and re-encoded by the relay)
+# and once as binary frames (forwarded after reading the envelope).
+#
+#     python benchmarks/relay.py --count 5000
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from websockets.asyncio.client import connect
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from rpc import PROTOCOL_VERSION, TypedArray, encode_packet  # noqa: E402
+
+
+def make_batch():
+    # Roughly the calls of one drawScene() in test.py.
+    def call(method, *params):
+        return {"jsonrpc": PROTOCOL_VERSION, "method": method, "params": list(params)}
+
+    gl = {"__jsonclass__": ["WebGLRenderingContext", 1]}
+    buffer = {"__jsonclass__": ["WebGLBuffer", -3]}
+    location = {"__jsonclass__": ["WebGLUniformLocation", 5]}
+    matrix = TypedArray("Float32Array", [float(i) for i in range(16)])
+    return [
+        call("clearColor", gl, 0.0, 0.0, 0.0, 1.0),
+        call("clearDepth", gl, 1.0),
+        call("enable", gl, 2929),
+        call("depthFunc", gl, 515),
+        call("clear", gl, 16640),
+        call("bindBuffer", gl, 34962, buffer),
+        call("vertexAttribPointer", gl, 0, 3, 5126, False, 0, 0),
+        call("enableVertexAttribArray", gl, 0),
+        call("bindBuffer", gl, 34962, buffer),
+        call("vertexAttribPointer", gl, 1, 2, 5126, False, 0, 0),
+        call("enableVertexAttribArray", gl, 1),
+        call("bindBuffer", gl, 34963, buffer),
+        call("useProgram", gl, {"__jsonclass__": ["WebGLProgram", -1]}),
+        call("uniformMatrix4fv", gl, location, False, matrix),
+        call("uniformMatrix4fv", gl, location, False, matrix),
+        call("activeTexture", gl, 33984),
+        call("bindTexture", gl, 3553, {"__jsonclass__": ["WebGLTexture", -7]}),
+        call("uniform1i", gl, location, 0),
+        call("drawElements", gl, 4, 36, 5123, 0),
+    ]
+
+
+def control(method, *params):
+    return {"to": None, "body": {"jsonrpc": PROTOCOL_VERSION, "method": method, "params": list(params)}}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_relay(port):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Relay did not start")
+
+
+async def measure(uri, binary, count):
+    async with connect(uri, compression=None, max_size=None) as sink, \
+            connect(uri, compression=None, max_size=None) as source:
+        await sink.send(encode_packet(control("__listen__", "sink"), binary))
+        await source.send(encode_packet(control("__connect__", "sink"), binary))
+        await asyncio.sleep(0.2)
+        frame = encode_packet({"to": "sink", "body": make_batch()}, binary)
+
+        async def produce():
+            for _ in range(count):
+                await source.send(frame)
+
+        async def consume():
+            received = 0
+            for _ in range(count):
+                received += len(await sink.recv())
+            return received
+
+        start = time.perf_counter()
+        _, received = await asyncio.gather(produce(), consume())
+        elapsed = time.perf_counter() - start
+    return {
+        "mode": "binary" if binary else "json",
+        "messages_per_second": count / elapsed,
+        "megabytes_per_second": received / elapsed / 1e6,
+        "bytes_per_message": len(frame),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+
+    port = free_port()
+    relay = start_relay(port)
+    try:
+        uri = f"ws://127.0.0.1:{port}/ws"
+        for binary in (False, True):
+            result = asyncio.run(measure(uri, binary, args.count))
+            print(
+                f"{result['mode']:>6}: {result['messages_per_second']:10.0f} messages/s"
+                f" {result['megabytes_per_second']:8.2f} MB/s"
+                f" {result['bytes_per_message']:6d} bytes/message")
+    finally:
+        relay.terminate()
+        relay.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# End-to-end benchmark suite.
+#
+# Starts the relay from main.py and a mock page from mockgl.py, runs
+# the script side against them through the relay and writes the
+# results as one JSON document, so that runs can be compared:
+#
+#     python benchmarks/suite.py --output before.json
+#     python benchmarks/suite.py --baseline before.json
+#
+# The benchmarks are
+#
+#     batching   procedure calls per second, sent in batches and run by
+#                the page
+#     latency    round-trip time of invoke_function()
+#     scene      bytes per frame of the textured cube of test.py
+#     relay      relay CPU time per forwarded message
+#     textures   texture upload throughput of TextureStream
+#
+# A summary goes to stderr, and --baseline adds the change of each
+# result from an earlier run.
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import relay  # noqa: E402
+import test  # noqa: E402
+import webgl  # noqa: E402
+from rpc import ObjectProxy, ServerProxy, TransportWebsocket, encode_packet  # noqa: E402
+from textures import TextureStream  # noqa: E402
+
+PAGE = "bench"
+
+
+class CountingTransport(TransportWebsocket):
+    def __init__(self, uri):
+        super().__init__(uri)
+        self.bytes_sent = 0
+        self.messages_sent = 0
+
+    def send(self, to_addr, body):
+        frame = encode_packet({"to": to_addr, "body": body}, self.binary, self.compress_threshold)
+        self.bytes_sent += len(frame)
+        self.messages_sent += 1
+        self.ws.send(frame)
+        return len(frame)
+
+
+class WebGL2Context(ObjectProxy, webgl.WebGL2RenderingContext):
+    # Without the state shadow, so that every call is sent.
+    pass
+
+
+def make_proxy(transport, **kwargs):
+    proxy = ServerProxy(PAGE, transport, allocate_ids=True, methods=webgl.METHODS,
+                        arguments=webgl.ARGUMENTS, **kwargs)
+    test.registerConstructors(proxy)
+    return proxy
+
+
+def plain_context(proxy):
+    proxy.register_constructor("WebGL2RenderingContext", WebGL2Context)
+    return proxy.get_root_object().getContext("webgl2")
+
+
+def bench_batching(uri, args):
+    with CountingTransport(uri) as transport:
+        proxy = make_proxy(transport)
+        gl = plain_context(proxy)
+        location = gl.getUniformLocation(gl.createProgram(), "uColor")
+        start = time.perf_counter()
+        for i in range(args.calls // 2):
+            gl.uniform4f(location, i, 0.0, 0.0, 1.0)
+            gl.drawArrays(gl.TRIANGLES, 0, 3)
+            if i % (args.batch // 2) == 0:
+                proxy.flush()
+        # The reply comes after the page has run every call before it.
+        gl.getError()
+        elapsed = time.perf_counter() - start
+    calls = args.calls // 2 * 2
+    return {
+        "calls_per_second": calls / elapsed,
+        "bytes_per_call": transport.bytes_sent / calls,
+    }
+
+
+def bench_latency(uri, args):
+    with CountingTransport(uri) as transport:
+        proxy = make_proxy(transport)
+        gl = plain_context(proxy)
+        times = []
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            gl.getError()
+            times.append(time.perf_counter() - start)
+    times.sort()
+    return {
+        "mean_ms": statistics.fmean(times) * 1000,
+        "p50_ms": times[len(times) // 2] * 1000,
+        "p95_ms": times[int(len(times) * 0.95)] * 1000,
+        "p99_ms": times[int(len(times) * 0.99)] * 1000,
+    }
+
+
+def bench_scene(uri, args):
+    with CountingTransport(uri) as transport:
+        proxy = make_proxy(transport, asset_cache=True)
+        scene = test.setupScene(proxy)
+        textureStream = scene[-1]
+        textureStream.finish()
+        proxy.flush()
+        setup_bytes = transport.bytes_sent
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            proxy.begin_frame()
+            proxy.replay("drawScene", *test.sceneMatrices(frame / 60))
+            proxy.end_frame()
+        # The page acknowledges the last frame before it replies.
+        proxy.invoke_function("__stats__")
+        elapsed = time.perf_counter() - start
+        frame_bytes = transport.bytes_sent - setup_bytes
+    return {
+        "setup_bytes": setup_bytes,
+        "bytes_per_frame": frame_bytes / args.frames,
+        "frames_per_second": args.frames / elapsed,
+        "frame_latency_ms": proxy.frame_latency * 1000,
+    }
+
+
+def process_cpu_time(pid):
+    # User and system time of a process in seconds, from /proc on Linux.
+    try:
+        with open(f"/proc/{pid}/stat") as fp:
+            fields = fp.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def bench_relay(uri, args, relay_process):
+    results = {}
+    for binary in (True, False):
+        before = process_cpu_time(relay_process.pid)
+        result = asyncio.run(relay.measure(uri, binary, args.messages))
+        after = process_cpu_time(relay_process.pid)
+        results[result["mode"]] = {
+            "messages_per_second": result["messages_per_second"],
+            "cpu_us_per_message": None if before is None else (after - before) / args.messages * 1e6,
+        }
+    return results
+
+
+def bench_textures(uri, args):
+    pixels = np.random.default_rng(0).integers(0, 256, (args.texture_size, args.texture_size, 4), dtype=np.uint8)
+    with CountingTransport(uri) as transport:
+        proxy = make_proxy(transport)
+        gl = plain_context(proxy)
+        start = time.perf_counter()
+        stream = TextureStream(gl, gl.createTexture(), pixels)
+        while not stream.step():
+            proxy.flush()
+        gl.getError()
+        elapsed = time.perf_counter() - start
+    return {
+        "megabytes_per_second": stream.uploaded_bytes / elapsed / 1e6,
+        "seconds": elapsed,
+        "bytes_sent": transport.bytes_sent,
+    }
+
+
+BENCHMARKS = ("batching", "latency", "scene", "relay", "textures")
+
+
+def start_page(uri):
+    # Presents frames right away, so that the scene measures the stack.
+    page = subprocess.Popen(
+        [sys.executable, "mockgl.py", "--uri", uri, "--name", PAGE, "--fps", "0"],
+        cwd=ROOT, stdout=subprocess.DEVNULL)
+    port = uri.split(":")[2].split("/")[0]
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            if PAGE in json.load(response)["nodes"]:
+                return page
+        time.sleep(0.1)
+    page.kill()
+    raise RuntimeError("Mock page did not start")
+
+
+def flatten(results, prefix=""):
+    for key, value in results.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--texture-size", type=int, default=2048)
+    parser.add_argument("--output", help="write the results to this file instead of stdout")
+    parser.add_argument("--baseline", help="results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    port = relay.free_port()
+    uri = f"ws://127.0.0.1:{port}/ws"
+    relay_process = relay.start_relay(port)
+    page = None
+    results = {}
+    try:
+        page = start_page(uri)
+        for name in args.only:
+            if name == "relay":
+                results[name] = bench_relay(uri, args, relay_process)
+            else:
+                results[name] = globals()[f"bench_{name}"](uri, args)
+    finally:
+        if page is not None:
+            page.terminate()
+            page.wait()
+        relay_process.terminate()
+        relay_process.wait()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = dict(flatten(json.load(fp)["results"]))
+    for key, value in flatten(results):
+        line = f"{key:40} {value:14.3f}" if value is not None else f"{key:40} {'-':>14}"
+        if baseline.get(key) and value is not None:
+            line += f" {(value / baseline[key] - 1) * 100:+8.1f}%"
+        print(line, file=sys.stderr)
+
+    document = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(document, fp, indent=2)
+            fp.write("\n")
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
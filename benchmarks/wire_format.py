@@ -0,0 +1,113 @@
+# Wire format size benchmark.
+#
+# Records the batch that one drawScene() of test.py sends and prints
+# the size of the frame with the per-call JSON-RPC objects of earlier
+# versions, with compact calls carrying method names, and with compact
+# calls carrying indices into webgl.METHODS.
+#
+#     python benchmarks/wire_format.py --count 1000
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import test  # noqa: E402
+import webgl  # noqa: E402
+from rpc import PROTOCOL_VERSION, ObjectProxy, ServerProxy, decode_packet, encode_packet  # noqa: E402
+
+
+class CaptureTransport:
+    binary = True
+
+    def __init__(self):
+        self.bodies = []
+
+    def connect(self, to_addr):
+        pass
+
+    def send(self, to_addr, body):
+        self.bodies.append(body)
+
+
+def record_frame(methods):
+    transport = CaptureTransport()
+    proxy = ServerProxy("browser", transport, allocate_ids=True, methods=methods)
+    for k, v in webgl.INTERFACES.items():
+        class _Class(ObjectProxy, v):
+            __slots__ = ()
+        proxy.register_constructor(k, _Class)
+
+    class WebGLContext(ObjectProxy, webgl.WebGLRenderingContext):
+        pass
+
+    def new(constructor):
+        cls = WebGLContext if constructor == "WebGLRenderingContext" else proxy.constructors[constructor]
+        return cls(proxy, constructor, proxy._allocate_object_id())
+
+    gl = new("WebGLRenderingContext")
+    programInfo = {
+        "program": new("WebGLProgram"),
+        "attribLocations": {"vertexPosition": 0, "textureCoord": 1},
+        "uniformLocations": {
+            "projectionMatrix": new("WebGLUniformLocation"),
+            "modelViewMatrix": new("WebGLUniformLocation"),
+            "uSampler": new("WebGLUniformLocation"),
+        },
+    }
+    buffers = {
+        "position": new("WebGLBuffer"),
+        "textureCoord": new("WebGLBuffer"),
+        "indices": new("WebGLBuffer"),
+    }
+    texture = new("WebGLTexture")
+    test.drawScene(gl, programInfo, buffers, texture, *test.sceneMatrices(0.5))
+    proxy.flush()
+    # The batch is sent encoded, and decoded here to encode it again
+    # in each format.
+    return decode_packet(encode_packet({"to": "browser", "body": transport.bodies[-1]}))["body"]
+
+
+def legacy(body):
+    # One JSON-RPC object per call, as sent before batches were compacted.
+    calls = []
+    for call in body["calls"]:
+        method = call[0]
+        if isinstance(method, int):
+            method = webgl.METHODS[method]
+        calls.append({"jsonrpc": PROTOCOL_VERSION, "method": method, "params": call[1:]})
+    return calls
+
+
+def measure(label, body, binary, count):
+    packet = {"to": "browser", "body": body}
+    start = time.perf_counter()
+    for _ in range(count):
+        frame = encode_packet(packet, binary)
+    elapsed = time.perf_counter() - start
+    size = len(frame.encode() if isinstance(frame, str) else frame)
+    mode = "binary" if binary else "json"
+    print(f"{label:8} {mode:6} {size:6} bytes/frame {elapsed / count * 1e6:8.1f} us/encode")
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args()
+
+    names = record_frame(())
+    opcodes = record_frame(webgl.METHODS)
+    print(f"{len(opcodes['calls'])} calls per frame")
+    for binary in (False, True):
+        before = measure("legacy", legacy(names), binary, args.count)
+        measure("names", names, binary, args.count)
+        after = measure("opcodes", opcodes, binary, args.count)
+        print(f"         {1 - after / before:.0%} smaller")
+
+
+if __name__ == "__main__":
+    main()
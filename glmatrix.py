@@ -0,0 +1,321 @@
+# Matrix and vector functions after glMatrix (https://glmatrix.net/),
+# on NumPy float32 arrays that can be passed to the proxy as they are.
+#
+# As in glMatrix, matrices are column-major with 16 elements, the first
+# argument receives the result and is returned, and the arguments may
+# alias it. Every function also works on batches: a (n, 16) array holds
+# n matrices, and arguments broadcast against each other, so that
+#
+#     models = mat4.create(n)
+#     mat4.translate(models, view, offsets)     # offsets of shape (n, 3)
+#     mat4.rotate(models, models, angles, axis)  # angles of shape (n,)
+#
+# computes n model-view matrices in one call.
+
+import numpy as np
+
+
+def _matrices(a):
+    # Row-major (..., 4, 4) view of column-major matrices.
+    a = np.asarray(a, dtype=np.float32)
+    return np.swapaxes(a.reshape(a.shape[:-1] + (4, 4)), -1, -2)
+
+
+def _store(out, m):
+    out[...] = np.swapaxes(m, -1, -2).reshape(m.shape[:-2] + (16,))
+    return out
+
+
+def _normalize(v):
+    length = np.linalg.norm(v, axis=-1, keepdims=True)
+    return np.divide(v, length, out=np.zeros_like(v), where=length > 0)
+
+
+def _like(v, size):
+    # Destination for the matrices or vectors made from a batch of v.
+    return np.empty(np.shape(v)[:-1] + (size,), dtype=np.float32)
+
+
+class mat4:
+    @staticmethod
+    def create(n=None):
+        shape = (16,) if n is None else (n, 16)
+        return mat4.identity(np.zeros(shape, dtype=np.float32))
+
+    @staticmethod
+    def identity(out):
+        out[...] = 0
+        out[..., [0, 5, 10, 15]] = 1
+        return out
+
+    @staticmethod
+    def copy(out, a):
+        out[...] = a
+        return out
+
+    @staticmethod
+    def multiply(out, a, b):
+        return _store(out, _matrices(a) @ _matrices(b))
+
+    @staticmethod
+    def transpose(out, a):
+        return _store(out, np.swapaxes(_matrices(a), -1, -2))
+
+    @staticmethod
+    def invert(out, a):
+        return _store(out, np.linalg.inv(_matrices(a)))
+
+    @staticmethod
+    def perspective(out, fovy, aspect, near, far):
+        fovy, aspect, near, far = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (fovy, aspect, near, far)))
+        m = np.zeros(fovy.shape + (4, 4))
+        f = 1 / np.tan(fovy / 2)
+        m[..., 0, 0] = f / aspect
+        m[..., 1, 1] = f
+        m[..., 2, 2] = (far + near) / (near - far)
+        m[..., 2, 3] = 2 * far * near / (near - far)
+        m[..., 3, 2] = -1
+        return _store(out, m)
+
+    @staticmethod
+    def ortho(out, left, right, bottom, top, near, far):
+        left, right, bottom, top, near, far = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (left, right, bottom, top, near, far)))
+        m = np.zeros(left.shape + (4, 4))
+        m[..., 0, 0] = 2 / (right - left)
+        m[..., 1, 1] = 2 / (top - bottom)
+        m[..., 2, 2] = -2 / (far - near)
+        m[..., 0, 3] = -(right + left) / (right - left)
+        m[..., 1, 3] = -(top + bottom) / (top - bottom)
+        m[..., 2, 3] = -(far + near) / (far - near)
+        m[..., 3, 3] = 1
+        return _store(out, m)
+
+    @staticmethod
+    def lookAt(out, eye, center, up):
+        eye = np.asarray(eye, dtype=np.float64)
+        z = _normalize(eye - np.asarray(center, dtype=np.float64))
+        x = _normalize(np.cross(np.asarray(up, dtype=np.float64), z))
+        y = np.cross(z, x)
+        m = np.zeros(np.broadcast_shapes(x.shape, eye.shape)[:-1] + (4, 4))
+        m[..., 0, :3] = x
+        m[..., 1, :3] = y
+        m[..., 2, :3] = z
+        m[..., 0, 3] = -np.sum(x * eye, axis=-1)
+        m[..., 1, 3] = -np.sum(y * eye, axis=-1)
+        m[..., 2, 3] = -np.sum(z * eye, axis=-1)
+        m[..., 3, 3] = 1
+        return _store(out, m)
+
+    @staticmethod
+    def fromTranslation(out, v):
+        v = np.asarray(v, dtype=np.float64)
+        m = np.broadcast_to(np.eye(4), v.shape[:-1] + (4, 4)).copy()
+        m[..., :3, 3] = v
+        return _store(out, m)
+
+    @staticmethod
+    def fromScaling(out, v):
+        v = np.asarray(v, dtype=np.float64)
+        m = np.zeros(v.shape[:-1] + (4, 4))
+        m[..., 0, 0] = v[..., 0]
+        m[..., 1, 1] = v[..., 1]
+        m[..., 2, 2] = v[..., 2]
+        m[..., 3, 3] = 1
+        return _store(out, m)
+
+    @staticmethod
+    def fromRotation(out, rad, axis):
+        rad = np.asarray(rad, dtype=np.float64)
+        x, y, z = np.moveaxis(_normalize(np.asarray(axis, dtype=np.float64)), -1, 0)
+        s = np.sin(rad)
+        c = np.cos(rad)
+        t = 1 - c
+        shape = np.broadcast_shapes(rad.shape, x.shape)
+        m = np.zeros(shape + (4, 4))
+        m[..., 0, 0] = x * x * t + c
+        m[..., 0, 1] = x * y * t - z * s
+        m[..., 0, 2] = x * z * t + y * s
+        m[..., 1, 0] = y * x * t + z * s
+        m[..., 1, 1] = y * y * t + c
+        m[..., 1, 2] = y * z * t - x * s
+        m[..., 2, 0] = z * x * t - y * s
+        m[..., 2, 1] = z * y * t + x * s
+        m[..., 2, 2] = z * z * t + c
+        m[..., 3, 3] = 1
+        return _store(out, m)
+
+    @staticmethod
+    def fromQuat(out, q):
+        x, y, z, w = np.moveaxis(np.asarray(q, dtype=np.float64), -1, 0)
+        m = np.zeros(x.shape + (4, 4))
+        m[..., 0, 0] = 1 - 2 * (y * y + z * z)
+        m[..., 0, 1] = 2 * (x * y - w * z)
+        m[..., 0, 2] = 2 * (x * z + w * y)
+        m[..., 1, 0] = 2 * (x * y + w * z)
+        m[..., 1, 1] = 1 - 2 * (x * x + z * z)
+        m[..., 1, 2] = 2 * (y * z - w * x)
+        m[..., 2, 0] = 2 * (x * z - w * y)
+        m[..., 2, 1] = 2 * (y * z + w * x)
+        m[..., 2, 2] = 1 - 2 * (x * x + y * y)
+        m[..., 3, 3] = 1
+        return _store(out, m)
+
+    @staticmethod
+    def fromRotationTranslation(out, q, v):
+        mat4.fromQuat(out, q)
+        out[..., 12:15] = v
+        return out
+
+    @staticmethod
+    def translate(out, a, v):
+        return mat4.multiply(out, a, mat4.fromTranslation(_like(v, 16), v))
+
+    @staticmethod
+    def scale(out, a, v):
+        return mat4.multiply(out, a, mat4.fromScaling(_like(v, 16), v))
+
+    @staticmethod
+    def rotate(out, a, rad, axis):
+        shape = np.broadcast_shapes(np.shape(rad), np.shape(axis)[:-1])
+        return mat4.multiply(out, a, mat4.fromRotation(np.empty(shape + (16,), dtype=np.float32), rad, axis))
+
+    @staticmethod
+    def rotateX(out, a, rad):
+        return mat4.rotate(out, a, rad, [1, 0, 0])
+
+    @staticmethod
+    def rotateY(out, a, rad):
+        return mat4.rotate(out, a, rad, [0, 1, 0])
+
+    @staticmethod
+    def rotateZ(out, a, rad):
+        return mat4.rotate(out, a, rad, [0, 0, 1])
+
+
+class vec3:
+    @staticmethod
+    def create(n=None):
+        return np.zeros((3,) if n is None else (n, 3), dtype=np.float32)
+
+    @staticmethod
+    def fromValues(x, y, z):
+        return np.array([x, y, z], dtype=np.float32)
+
+    @staticmethod
+    def add(out, a, b):
+        out[...] = np.add(a, b)
+        return out
+
+    @staticmethod
+    def subtract(out, a, b):
+        out[...] = np.subtract(a, b)
+        return out
+
+    @staticmethod
+    def scale(out, a, s):
+        out[...] = np.multiply(a, np.asarray(s)[..., np.newaxis])
+        return out
+
+    @staticmethod
+    def dot(a, b):
+        return np.sum(np.multiply(a, b), axis=-1)
+
+    @staticmethod
+    def cross(out, a, b):
+        out[...] = np.cross(a, b)
+        return out
+
+    @staticmethod
+    def length(a):
+        return np.linalg.norm(a, axis=-1)
+
+    @staticmethod
+    def normalize(out, a):
+        out[...] = _normalize(np.asarray(a, dtype=np.float64))
+        return out
+
+    @staticmethod
+    def lerp(out, a, b, t):
+        a = np.asarray(a, dtype=np.float64)
+        out[...] = a + np.asarray(t)[..., np.newaxis] * (np.asarray(b) - a)
+        return out
+
+    @staticmethod
+    def transformMat4(out, a, m):
+        a = np.asarray(a, dtype=np.float64)
+        p = np.concatenate([a, np.ones(a.shape[:-1] + (1,))], axis=-1)
+        p = (_matrices(m) @ p[..., np.newaxis])[..., 0]
+        w = p[..., 3:]
+        out[...] = p[..., :3] / np.where(w == 0, 1, w)
+        return out
+
+    @staticmethod
+    def transformQuat(out, a, q):
+        q = np.asarray(q, dtype=np.float64)
+        u = q[..., :3]
+        w = q[..., 3:]
+        a = np.asarray(a, dtype=np.float64)
+        uv = np.cross(u, a)
+        out[...] = a + 2 * (w * uv + np.cross(u, uv))
+        return out
+
+
+class quat:
+    @staticmethod
+    def create(n=None):
+        return quat.identity(np.zeros((4,) if n is None else (n, 4), dtype=np.float32))
+
+    @staticmethod
+    def identity(out):
+        out[...] = [0, 0, 0, 1]
+        return out
+
+    @staticmethod
+    def setAxisAngle(out, axis, rad):
+        rad = np.asarray(rad, dtype=np.float64)[..., np.newaxis] / 2
+        axis = _normalize(np.asarray(axis, dtype=np.float64))
+        out[..., :3] = axis * np.sin(rad)
+        out[..., 3:] = np.cos(rad)
+        return out
+
+    @staticmethod
+    def multiply(out, a, b):
+        ax, ay, az, aw = np.moveaxis(np.asarray(a, dtype=np.float64), -1, 0)
+        bx, by, bz, bw = np.moveaxis(np.asarray(b, dtype=np.float64), -1, 0)
+        out[...] = np.stack([
+            ax * bw + aw * bx + ay * bz - az * by,
+            ay * bw + aw * by + az * bx - ax * bz,
+            az * bw + aw * bz + ax * by - ay * bx,
+            aw * bw - ax * bx - ay * by - az * bz,
+        ], axis=-1)
+        return out
+
+    @staticmethod
+    def conjugate(out, a):
+        out[...] = np.asarray(a) * [-1, -1, -1, 1]
+        return out
+
+    @staticmethod
+    def normalize(out, a):
+        out[...] = _normalize(np.asarray(a, dtype=np.float64))
+        return out
+
+    @staticmethod
+    def slerp(out, a, b, t):
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+        cosom = np.sum(a * b, axis=-1, keepdims=True)
+        # Take the shorter way around.
+        b = np.where(cosom < 0, -b, b)
+        cosom = np.abs(cosom)
+        omega = np.arccos(np.clip(cosom, -1, 1))
+        sinom = np.sin(omega)
+        close = 1 - cosom < 1e-6
+        safe = np.where(close, 1, sinom)
+        scale0 = np.where(close, 1 - t, np.sin((1 - t) * omega) / safe)
+        scale1 = np.where(close, t, np.sin(t * omega) / safe)
+        out[...] = scale0 * a + scale1 * b
+        return out
@@ -0,0 +1,152 @@
+from webgl import WebGLRenderingContextBase
+
+
+# Procedures whose arguments are the whole state they set.
+SIMPLE_STATE = {
+    "activeTexture",
+    "blendColor",
+    "blendEquation",
+    "blendEquationSeparate",
+    "blendFunc",
+    "blendFuncSeparate",
+    "clearColor",
+    "clearDepth",
+    "clearStencil",
+    "colorMask",
+    "cullFace",
+    "depthFunc",
+    "depthMask",
+    "depthRange",
+    "frontFace",
+    "lineWidth",
+    "polygonOffset",
+    "scissor",
+    "stencilMask",
+    "bindVertexArray",
+    "useProgram",
+    "viewport",
+}
+
+# Procedures that set the state named by their first argument.
+BIND_STATE = {
+    "bindBuffer",
+    "bindFramebuffer",
+    "bindRenderbuffer",
+    "pixelStorei",
+    "vertexAttribDivisor",
+}
+
+UNIFORM_STATE = {
+    "uniform1f", "uniform2f", "uniform3f", "uniform4f",
+    "uniform1i", "uniform2i", "uniform3i", "uniform4i",
+}
+
+DELETE_METHODS = {
+    "deleteBuffer",
+    "deleteFramebuffer",
+    "deleteProgram",
+    "deleteQuery",
+    "deleteRenderbuffer",
+    "deleteSampler",
+    "deleteSync",
+    "deleteTexture",
+    "deleteTransformFeedback",
+    "deleteVertexArray",
+}
+
+
+class StateShadowingMixin:
+    # Keeps a copy of the GL state set through this context and drops
+    # the procedures that would not change it, before they reach the
+    # batch. Put it first in the bases of the context proxy:
+    #
+    #     class WebGLContext(StateShadowingMixin, ObjectProxy,
+    #                        webgl.WebGLRenderingContext):
+    #         pass
+    #
+    # Calls made behind its back, such as through extension objects,
+    # must be followed by reset_state().
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.elided_calls = 0
+        self.sent_calls = 0
+        self.reset_state()
+
+    def reset_state(self):
+        self._state = {}
+        # A replayed command list leaves the state unknown.
+        self._replay_count = self.proxy.replay_count
+
+    def _append_procedure(self, name, args):
+        if self.proxy.recording is not None:
+            # Recorded commands run later, in whatever state the
+            # context has then, so nothing can be dropped or learned.
+            super()._append_procedure(name, args)
+            return
+        if self._replay_count != self.proxy.replay_count:
+            self.reset_state()
+
+        entry = self._state_entry(name, args)
+        if entry is None:
+            if name in DELETE_METHODS:
+                self._forget(args[0])
+                if name == "deleteVertexArray":
+                    self._forget_vertex_array()
+            elif name == "linkProgram":
+                self._forget_uniforms()
+            elif name == "bindBufferBase" or name == "bindBufferRange":
+                # Indexed bindings also set the generic binding.
+                self._state[("bindBuffer", args[0])] = args[2]
+            elif name == "vertexAttribIPointer":
+                self._state.pop(("vertexAttribPointer", args[0]), None)
+            super()._append_procedure(name, args)
+            return
+
+        key, value = entry
+        if key in self._state and self._state[key] == value:
+            self.elided_calls += 1
+            return
+        self._state[key] = value
+        if name == "bindVertexArray":
+            self._forget_vertex_array()
+        self.sent_calls += 1
+        super()._append_procedure(name, args)
+
+    def _state_entry(self, name, args):
+        if name in SIMPLE_STATE:
+            return name, args
+        if name in BIND_STATE:
+            return (name, args[0]), args[1]
+        if name == "bindTexture":
+            return (name, self._state.get("activeTexture"), args[0]), args[1]
+        if name == "enable" or name == "disable":
+            return ("enable", args[0]), name == "enable"
+        if name == "enableVertexAttribArray" or name == "disableVertexAttribArray":
+            return ("vertexAttribArray", args[0]), name == "enableVertexAttribArray"
+        if name == "vertexAttribPointer":
+            # The attribute also takes the buffer bound at the time.
+            buffer = self._state.get(("bindBuffer", WebGLRenderingContextBase.ARRAY_BUFFER))
+            return (name, args[0]), (args[1:], buffer)
+        if name in UNIFORM_STATE:
+            return ("uniform", args[0]), (name, args[1:])
+        return None
+
+    def _forget(self, obj):
+        # Deleting an object unbinds it.
+        for key, value in list(self._state.items()):
+            if value is obj or (isinstance(value, tuple) and obj in value):
+                del self._state[key]
+
+    def _forget_vertex_array(self):
+        # The attributes and the element array buffer belong to the
+        # vertex array object.
+        element_array = ("bindBuffer", WebGLRenderingContextBase.ELEMENT_ARRAY_BUFFER)
+        for key in list(self._state):
+            if key == element_array or (isinstance(key, tuple) and key[0] in ("vertexAttribArray", "vertexAttribPointer", "vertexAttribDivisor")):
+                del self._state[key]
+
+    def _forget_uniforms(self):
+        # Linking resets the uniforms of the program.
+        for key in list(self._state):
+            if isinstance(key, tuple) and key[0] == "uniform":
+                del self._state[key]
@@ -0,0 +1,126 @@
+import numpy as np
+
+from rpc import AsyncServerProxy, ObjectProxy
+from webgl import WebGL2RenderingContextBase
+
+
+class ANGLEInstancedArrays(ObjectProxy):
+    # The WebGL1 extension object, which browsers name either way.
+    __slots__ = ()
+    NAMES = ("ANGLEInstancedArrays", "ANGLE_instanced_arrays")
+    VERTEX_ATTRIB_ARRAY_DIVISOR_ANGLE = 0x88FE
+
+    def drawArraysInstancedANGLE(self, mode, first, count, primcount):
+        self._append_procedure("drawArraysInstancedANGLE", (mode, first, count, primcount))
+
+    def drawElementsInstancedANGLE(self, mode, count, type, offset, primcount):
+        self._append_procedure("drawElementsInstancedANGLE", (mode, count, type, offset, primcount))
+
+    def vertexAttribDivisorANGLE(self, index, divisor):
+        self._append_procedure("vertexAttribDivisorANGLE", (index, divisor))
+
+
+def _columns(size):
+    # Attribute locations taken by a per-instance value of size floats:
+    # one for a vector, one per column for a mat3 or mat4.
+    if 1 <= size <= 4:
+        return 1
+    if size in (9, 16):
+        return int(size ** 0.5)
+    raise ValueError(f"Unsupported instance attribute size {size}")
+
+
+class InstancedRenderer:
+    # Draws many copies of a mesh with per-instance attributes, from one
+    # buffer and one draw call:
+    #
+    #     renderer = InstancedRenderer(gl, {modelLocation: 16, colorLocation: 4})
+    #     renderer.update({modelLocation: models, colorLocation: colors})
+    #     renderer.draw_elements(gl.TRIANGLES, 36, gl.UNSIGNED_SHORT, 0)
+    #
+    # The attributes map a location to the number of floats per
+    # instance: 1 to 4 for a float or vector, 9 or 16 for a mat3 or mat4
+    # attribute, which takes one location per column. update() takes
+    # arrays of shape (n, size), such as the batches of glmatrix.mat4,
+    # and interleaves them into one float32 buffer. The mesh attributes
+    # and index buffer are set up as for a single draw.
+    #
+    # WebGL2 contexts draw with drawElementsInstanced, WebGL1 ones
+    # through the ANGLE_instanced_arrays extension. The instance
+    # locations keep their divisor after a draw, so other draws should
+    # not use them for per-vertex data. With an AsyncServerProxy, the
+    # proxy must allocate object ids, and a WebGL1 context needs the
+    # extension passed in, as getExtension() returns a future.
+    def __init__(self, gl, attributes, usage=None, extension=None):
+        is_async = isinstance(gl.proxy, AsyncServerProxy)
+        if is_async and not gl.proxy.allocate_ids:
+            raise ValueError("InstancedRenderer needs an AsyncServerProxy with allocate_ids")
+        self.gl = gl
+        self.attributes = list(attributes.items())
+        for _, size in self.attributes:
+            _columns(size)
+        self.stride = sum(size for _, size in self.attributes) * 4
+        # Streamed data is not kept by the asset cache.
+        self.usage = gl.STREAM_DRAW if usage is None else usage
+        self.buffer = gl.createBuffer()
+        self.count = 0
+        self.extension = None
+        if not isinstance(gl, WebGL2RenderingContextBase):
+            proxy = gl.proxy
+            for name in ANGLEInstancedArrays.NAMES:
+                proxy.constructors.setdefault(name, ANGLEInstancedArrays)
+            if extension is None and is_async:
+                raise ValueError("Pass the ANGLE_instanced_arrays extension with an AsyncServerProxy")
+            self.extension = extension or gl.getExtension("ANGLE_instanced_arrays")
+            if self.extension is None:
+                raise RuntimeError("ANGLE_instanced_arrays is not supported")
+
+    def update(self, instances):
+        # Uploads the per-instance values, with the same number of
+        # instances for every attribute.
+        columns = []
+        for location, size in self.attributes:
+            values = np.asarray(instances[location], dtype=np.float32)
+            columns.append(values.reshape(-1, size))
+        counts = {len(values) for values in columns}
+        if len(counts) != 1:
+            raise ValueError(f"Attributes have different instance counts: {sorted(counts)}")
+        data = np.concatenate(columns, axis=1) if len(columns) > 1 else columns[0]
+        self.count = len(data)
+        gl = self.gl
+        gl.bindBuffer(gl.ARRAY_BUFFER, self.buffer)
+        gl.bufferData(gl.ARRAY_BUFFER, np.ascontiguousarray(data), self.usage)
+
+    def draw_elements(self, mode, count, type, offset, instance_count=None):
+        self._bind()
+        instance_count = self.count if instance_count is None else instance_count
+        if self.extension is None:
+            self.gl.drawElementsInstanced(mode, count, type, offset, instance_count)
+        else:
+            self.extension.drawElementsInstancedANGLE(mode, count, type, offset, instance_count)
+
+    def draw_arrays(self, mode, first, count, instance_count=None):
+        self._bind()
+        instance_count = self.count if instance_count is None else instance_count
+        if self.extension is None:
+            self.gl.drawArraysInstanced(mode, first, count, instance_count)
+        else:
+            self.extension.drawArraysInstancedANGLE(mode, first, count, instance_count)
+
+    def _bind(self):
+        # Points the instance locations into the buffer. Through a
+        # StateShadowingMixin context, the calls that don't change
+        # anything since the last draw are dropped.
+        gl = self.gl
+        gl.bindBuffer(gl.ARRAY_BUFFER, self.buffer)
+        offset = 0
+        for location, size in self.attributes:
+            columns = _columns(size)
+            for column in range(columns):
+                gl.vertexAttribPointer(location + column, size // columns, gl.FLOAT, False, self.stride, offset)
+                gl.enableVertexAttribArray(location + column)
+                if self.extension is None:
+                    gl.vertexAttribDivisor(location + column, 1)
+                else:
+                    self.extension.vertexAttribDivisorANGLE(location + column, 1)
+                offset += size // columns * 4
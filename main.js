@@ -2,6 +2,127 @@
 
 const PROTOCOL_VERSION = "2.0";
 const ERROR_INTERNAL = -32603;
+const FRAME_ALIGNMENT = 8;
+// Segments compressed with zlib have the top bit of their length set.
+const SEGMENT_DEFLATED = 0x80000000;
+
+const TYPED_ARRAYS = {
+    Int8Array,
+    Uint8Array,
+    Int16Array,
+    Uint16Array,
+    Int32Array,
+    Uint32Array,
+    Float32Array,
+    Float64Array,
+};
+
+// Bytes of typed arrays kept for the asset cache.
+const MAX_ASSET_BYTES = 256 * 1024 * 1024;
+
+// Methods that free the GPU resource of a released object.
+const DELETE_METHODS = {
+    WebGLBuffer: "deleteBuffer",
+    WebGLFramebuffer: "deleteFramebuffer",
+    WebGLProgram: "deleteProgram",
+    WebGLQuery: "deleteQuery",
+    WebGLRenderbuffer: "deleteRenderbuffer",
+    WebGLSampler: "deleteSampler",
+    WebGLShader: "deleteShader",
+    WebGLSync: "deleteSync",
+    WebGLTexture: "deleteTexture",
+    WebGLTransformFeedback: "deleteTransformFeedback",
+    WebGLVertexArrayObject: "deleteVertexArray",
+};
+
+// Binary frame layout, with integers in little-endian:
+//   uint16 to length, uint16 from length, to, from, padding,
+//   uint32 header length, uint32 segment count, uint32 segment lengths...,
+//   header JSON, padding, (segment, padding)...
+// The relay only looks at the addresses. Segments are aligned so that
+// typed arrays can view them in place. Compressed segments are listed
+// in packet.deflated and must be inflated before the body is used.
+function decodeFrame(buffer) {
+    const view = new DataView(buffer);
+    const decoder = new TextDecoder();
+    const toLength = view.getUint16(0, true);
+    const fromLength = view.getUint16(2, true);
+    const packet = {
+        to: decoder.decode(new Uint8Array(buffer, 4, toLength)) || null,
+        from: decoder.decode(new Uint8Array(buffer, 4 + toLength, fromLength)) || null,
+    };
+    let offset = 4 + toLength + fromLength;
+    offset += -offset & (FRAME_ALIGNMENT - 1);
+    const headerLength = view.getUint32(offset, true);
+    const segmentCount = view.getUint32(offset + 4, true);
+    const lengths = offset + 8;
+    offset += 8 + 4 * segmentCount;
+    packet.body = JSON.parse(decoder.decode(new Uint8Array(buffer, offset, headerLength)));
+    offset += headerLength;
+    offset += -offset & (FRAME_ALIGNMENT - 1);
+    packet.segments = [];
+    packet.deflated = [];
+    for (let i = 0; i < segmentCount; i++) {
+        let length = view.getUint32(lengths + 4 * i, true);
+        if (length & SEGMENT_DEFLATED) {
+            length &= ~SEGMENT_DEFLATED;
+            packet.deflated.push(i);
+        }
+        packet.segments.push(new Uint8Array(buffer, offset, length));
+        offset += length;
+        offset += -offset & (FRAME_ALIGNMENT - 1);
+    }
+    return packet;
+}
+
+async function inflateSegments(packet) {
+    for (const i of packet.deflated) {
+        const stream = new Blob([packet.segments[i]]).stream()
+            .pipeThrough(new DecompressionStream("deflate"));
+        packet.segments[i] = new Uint8Array(await new Response(stream).arrayBuffer());
+    }
+}
+
+function encodeFrame(to, body) {
+    const encoder = new TextEncoder();
+    const toBytes = encoder.encode(to ?? "");
+    const header = encoder.encode(JSON.stringify(body));
+    let offset = 4 + toBytes.length;
+    offset += -offset & (FRAME_ALIGNMENT - 1);
+    const buffer = new ArrayBuffer(offset + 8 + header.length);
+    const view = new DataView(buffer);
+    view.setUint16(0, toBytes.length, true);
+    new Uint8Array(buffer, 4).set(toBytes);
+    view.setUint32(offset, header.length, true);
+    new Uint8Array(buffer, offset + 8).set(header);
+    return buffer;
+}
+
+class CommandPlaceholder {
+    constructor(index) {
+        this.index = index;
+    }
+}
+
+// Plain objects and arrays are sent by value, other objects by reference.
+function isRemoteObject(value) {
+    if (value === null || typeof(value) !== "object") {
+        return false;
+    }
+    const prototype = Object.getPrototypeOf(value);
+    return prototype !== Object.prototype && prototype !== Array.prototype;
+}
+
+// A marshalled object proxy, as opposed to placeholders, assets and
+// typed arrays.
+function isObjectReference(value) {
+    if (!(value instanceof Object) || value.__jsonclass__ === undefined) {
+        return false;
+    }
+    const constructor = value.__jsonclass__[0];
+    return constructor != "__placeholder__" && constructor != "__asset__" &&
+        !TYPED_ARRAYS.hasOwnProperty(constructor);
+}
 
 class TransportWebSocket {
     constructor(uri) {
@@ -9,11 +130,15 @@ class TransportWebSocket {
         this.ws = null;
         this.server = null;
         this.logging = false;
+        // Messages wait here while an earlier one is being inflated,
+        // so that they are handled in order.
+        this.inflating = null;
     }
 
     start(server) {
         this.server = server;
         this.ws = new WebSocket(this.uri);
+        this.ws.binaryType = "arraybuffer";
 
         this.ws.onopen = (event) => {
             this.send(null, {
@@ -24,9 +149,28 @@ class TransportWebSocket {
         };
         
         this.ws.onmessage = (event) => {
-            const packet = JSON.parse(event.data);
-            if (this.logging) console.log('<--', packet.body);
-            this.server.onReceive(packet.from, packet.body);
+            let packet;
+            if (event.data instanceof ArrayBuffer) {
+                packet = decodeFrame(event.data);
+            } else {
+                packet = JSON.parse(event.data);
+                packet.segments = [];
+                packet.deflated = [];
+            }
+            if (this.inflating === null && packet.deflated.length == 0) {
+                this.receive(packet);
+                return;
+            }
+            const inflating = (this.inflating ?? Promise.resolve())
+                .then(() => inflateSegments(packet))
+                .then(() => this.receive(packet))
+                .catch((e) => console.error(e))
+                .finally(() => {
+                    if (this.inflating === inflating) {
+                        this.inflating = null;
+                    }
+                });
+            this.inflating = inflating;
         };
 
         this.ws.onclose = (event) => {
@@ -38,13 +182,14 @@ class TransportWebSocket {
         }
     }
 
+    receive(packet) {
+        if (this.logging) console.log('<--', packet.body);
+        this.server.onReceive(packet.from, packet.body, packet.segments);
+    }
+
     send(to, body) {
         if (this.logging) console.log('-->', body);
-        const packet = {
-            to: to,
-            body: body
-        };
-        this.ws.send(JSON.stringify(packet));
+        this.ws.send(encodeFrame(to, body));
     }
 }
 
@@ -54,8 +199,33 @@ class Server {
         this.transport = transport;
         this.nextObjectId = 0;
         this.liveObjects = {};
+        this.liveObjectCount = 0;
+        this.releasedObjectCount = 0;
+        this.owners = new WeakMap();
+        this.deleteOnRelease = false;
+        this.commandLists = {};
+        this.currentSegments = [];
+        this.currentFrom = null;
+        // Latest frame received from each client and not presented yet.
+        this.pendingFrames = new Map();
         this.rootObject = {};
         this.methods = {}
+        // Methods sent as an index into the table generated from the
+        // IDL are dispatched through functions bound once per target.
+        this.methodTable = WEBGL_METHODS;
+        this.dispatchTables = new WeakMap();
+        this.lastTarget = null;
+        this.lastDispatchTable = null;
+        // Typed arrays tagged with a digest by the clients, kept for
+        // the session in least recently used order, so that clients
+        // can refer to them instead of sending them again. A client
+        // asks which digests are here before each batch that uses
+        // assets, and an asset evicted within the batch makes the call
+        // that refers to it fail, so maxAssetBytes must hold what a
+        // batch uses.
+        this.assets = new Map();
+        this.assetBytes = 0;
+        this.maxAssetBytes = MAX_ASSET_BYTES;
     }
 
     registerDefaultMethods() {
@@ -69,6 +239,44 @@ class Server {
             (target, name) => {
                 return target[name];
             });
+        this.registerMethod(
+            "__release__",
+            (...objectIds) => {
+                for (const objectId of objectIds) {
+                    this.releaseObject(objectId);
+                }
+            });
+        this.registerMethod(
+            "__record__",
+            (name, commands) => {
+                this.commandLists[name] = commands.map(
+                    (data) => this.compileCommand(data, this.currentSegments));
+            });
+        this.registerMethod(
+            "__replay__",
+            (name, ...args) => {
+                this.replay(this.commandLists[name], args);
+            });
+        this.registerMethod(
+            "__frame__",
+            (frameId) => {
+                this.queueFrame(this.currentFrom, frameId);
+            });
+        this.registerMethod(
+            "__has_assets__",
+            (digests) => {
+                return digests.map((digest) => this.getAsset(digest) !== undefined);
+            });
+        this.registerMethod(
+            "__stats__",
+            () => {
+                return {
+                    liveObjects: this.liveObjectCount,
+                    releasedObjects: this.releasedObjectCount,
+                    assets: this.assets.size,
+                    assetBytes: this.assetBytes,
+                };
+            });
     }
 
     registerMethod(name, method) {
@@ -83,19 +291,34 @@ class Server {
         this.transport.start(this);
     }
 
-    onReceive(fromAddr, body) {
-        if (!(body instanceof Array)) {
-            body = [body];
+    // A batch is {jsonrpc, calls}, where a call is either
+    // [method, ...params] for a notification or a request object
+    // without jsonrpc. A single message or an array of messages is
+    // accepted too.
+    onReceive(fromAddr, body, segments) {
+        let calls = body.calls;
+        if (calls === undefined) {
+            calls = body instanceof Array ? body : [body];
         }
-        for (const data of body) {
+        this.currentSegments = segments;
+        this.currentFrom = fromAddr;
+        for (const data of calls) {
+            if (data instanceof Array) {
+                try {
+                    this.invoke(data[0], this.unmarshalParams(data, segments, 1));
+                } catch (e) {
+                    console.error(e);
+                }
+                continue;
+            }
             try {
-                const params = this.unmarshalParams(data.params);
-                let result;
-                if (this.methods.hasOwnProperty(data.method)) {
-                    result = this.methods[data.method](...params);
-                } else {
-                    const target = params.shift();
-                    result = target[data.method].apply(target, params);
+                const params = this.unmarshalParams(data.params, segments);
+                const result = this.invoke(data.method, params);
+                if (data.objectId !== undefined &&
+                    (data.id === undefined || (isRemoteObject(result) && result._objectId === undefined))) {
+                    // The client chose the id of the new object, so that
+                    // every server in a group uses the same one.
+                    this.storeObject(data.objectId, result);
                 }
                 if (data.id !== undefined)
                 {
@@ -110,6 +333,7 @@ class Server {
                 if (data.id !== undefined)
                 {
                     this.transport.send(fromAddr, {
+                        jsonrpc: PROTOCOL_VERSION,
                         id: data.id,
                         error: {
                             code: ERROR_INTERNAL,
@@ -121,53 +345,238 @@ class Server {
         }
     }
 
-    unmarshalParams(params) {
-        return params.map((value) => {
-            if (value instanceof Array) {
-                return value;
+    invoke(method, params) {
+        let result;
+        if (typeof(method) === "number") {
+            const target = params.shift();
+            result = this.dispatchTable(target)[method](...params);
+            if (result instanceof Object) {
+                this.owners.set(result, target);
             }
-            if (value instanceof Object) {
-                if (value.__jsonclass__ !== undefined) {
-                    const constructor = value.__jsonclass__[0];
-                    const objectId = value.__jsonclass__[1];
-                    if (constructor == "Float32Array") {
-                        return new Float32Array(objectId);
-                    } else if (constructor == "Uint16Array") {
-                        return new Uint16Array(objectId);
-                    } else if (constructor == "Uint8Array") {
-                        return new Uint8Array(objectId);
+            return result;
+        }
+        if (this.methods.hasOwnProperty(method)) {
+            return this.methods[method](...params);
+        }
+        const target = params.shift();
+        result = target[method].apply(target, params);
+        if (result instanceof Object) {
+            this.owners.set(result, target);
+        }
+        return result;
+    }
+
+    // Frames are acknowledged from requestAnimationFrame, once the
+    // calls before them are presented. When several frames arrive
+    // within one animation frame, only the latest is acknowledged.
+    queueFrame(fromAddr, frameId) {
+        if (this.pendingFrames.size == 0) {
+            requestAnimationFrame(() => this.presentFrames());
+        }
+        this.pendingFrames.set(fromAddr, frameId);
+    }
+
+    presentFrames() {
+        for (const [fromAddr, frameId] of this.pendingFrames) {
+            this.transport.send(fromAddr, {
+                jsonrpc: PROTOCOL_VERSION,
+                method: "__presented__",
+                params: [frameId]
+            });
+        }
+        this.pendingFrames.clear();
+    }
+
+    dispatchTable(target) {
+        if (target === this.lastTarget) {
+            return this.lastDispatchTable;
+        }
+        let table = this.dispatchTables.get(target);
+        if (table === undefined) {
+            table = this.methodTable.map((name) =>
+                typeof(target[name]) === "function" ? target[name].bind(target) : undefined);
+            this.dispatchTables.set(target, table);
+        }
+        this.lastTarget = target;
+        this.lastDispatchTable = table;
+        return table;
+    }
+
+    // Parameters of a recorded command are resolved once. Only the
+    // placeholders are filled in by each replay, and the objects looked
+    // up, as they may be created by the list itself.
+    compileCommand(data, segments) {
+        if (data instanceof Array) {
+            data = {method: data[0], params: data.slice(1)};
+        }
+        const refs = [];
+        const params = data.params.map((value, i) => {
+            if (isObjectReference(value)) {
+                refs.push([i, value.__jsonclass__[1]]);
+                return undefined;
+            }
+            return this.unmarshalValue(value, segments);
+        });
+        const slots = [];
+        params.forEach((value, i) => {
+            if (value instanceof CommandPlaceholder) {
+                slots.push([i, value.index]);
+            }
+        });
+        return {
+            method: data.method,
+            params: params,
+            slots: slots,
+            refs: refs,
+            objectId: data.objectId,
+        };
+    }
+
+    replay(commands, args) {
+        if (commands === undefined) {
+            throw new Error("Unknown command list");
+        }
+        for (const command of commands) {
+            const params = command.params.slice();
+            for (const [i, index] of command.slots) {
+                params[i] = args[index];
+            }
+            for (const [i, objectId] of command.refs) {
+                params[i] = this.liveObjects[objectId];
+            }
+            const result = this.invoke(command.method, params);
+            if (command.objectId !== undefined) {
+                const previous = this.liveObjects[command.objectId];
+                if (previous !== undefined && previous !== result) {
+                    // Created by the previous replay, and only used by it.
+                    this.releaseObject(command.objectId);
+                }
+                this.storeObject(command.objectId, result);
+            }
+        }
+    }
+
+    unmarshalParams(params, segments, start = 0) {
+        const values = new Array(params.length - start);
+        for (let i = start; i < params.length; i++) {
+            values[i - start] = this.unmarshalValue(params[i], segments);
+        }
+        return values;
+    }
+
+    unmarshalValue(value, segments) {
+        if (value instanceof Array) {
+            return value;
+        }
+        if (value instanceof Object) {
+            if (value.__jsonclass__ !== undefined) {
+                const constructor = value.__jsonclass__[0];
+                const objectId = value.__jsonclass__[1];
+                if (constructor == "__placeholder__") {
+                    return new CommandPlaceholder(objectId);
+                } else if (constructor == "__asset__") {
+                    const asset = this.getAsset(objectId);
+                    if (asset === undefined) {
+                        throw new Error("Unknown asset " + objectId);
+                    }
+                    return asset;
+                } else if (TYPED_ARRAYS.hasOwnProperty(constructor)) {
+                    const typedArray = TYPED_ARRAYS[constructor];
+                    let array;
+                    if (objectId instanceof Array) {
+                        array = new typedArray(objectId);
                     } else {
-                        return this.liveObjects[objectId];
+                        const segment = segments[objectId.segment];
+                        array = new typedArray(
+                            segment.buffer,
+                            segment.byteOffset,
+                            segment.byteLength / typedArray.BYTES_PER_ELEMENT);
                     }
+                    if (value.asset !== undefined) {
+                        // The segment is a view of the whole message.
+                        this.putAsset(value.asset, array.slice());
+                    }
+                    return array;
+                } else {
+                    return this.liveObjects[objectId];
                 }
-                return value;
             }
-            // number, string, null
             return value;
-        });
+        }
+        // number, string, null
+        return value;
+    }
+
+    getAsset(digest) {
+        const asset = this.assets.get(digest);
+        if (asset !== undefined) {
+            this.assets.delete(digest);
+            this.assets.set(digest, asset);
+        }
+        return asset;
+    }
+
+    putAsset(digest, array) {
+        if (this.assets.has(digest)) {
+            this.getAsset(digest);
+            return;
+        }
+        this.assets.set(digest, array);
+        this.assetBytes += array.byteLength;
+        for (const [oldest, asset] of this.assets) {
+            if (this.assetBytes <= this.maxAssetBytes || oldest === digest) {
+                break;
+            }
+            this.assets.delete(oldest);
+            this.assetBytes -= asset.byteLength;
+        }
     }
 
     marshalResult(value) {
         if (value === undefined || value == null) {
             return null;
         }
-        if (typeof(value) !== "object") {
-            return value;
-        }
-        if (Object.getPrototypeOf(value) === Object.prototype) {
-            return value;
-        }
-        if (Object.getPrototypeOf(value) === Array.prototype) {
+        if (!isRemoteObject(value)) {
             return value;
         }
         if (value._objectId === undefined) {
-            const objectId = this.nextObjectId++;
-            this.liveObjects[objectId] = value;
-            value._objectId = objectId;
+            this.storeObject(this.nextObjectId++, value);
         }
         const constructor = Object.getPrototypeOf(value).constructor.name;
         return {
             __jsonclass__: [constructor, value._objectId]
         };
     }
+
+    storeObject(objectId, value) {
+        if (!this.liveObjects.hasOwnProperty(objectId)) {
+            this.liveObjectCount++;
+        }
+        this.liveObjects[objectId] = value;
+        if (value instanceof Object) {
+            value._objectId = objectId;
+        }
+    }
+
+    releaseObject(objectId) {
+        if (!this.liveObjects.hasOwnProperty(objectId)) {
+            return;
+        }
+        const value = this.liveObjects[objectId];
+        delete this.liveObjects[objectId];
+        this.liveObjectCount--;
+        this.releasedObjectCount++;
+        if (!(value instanceof Object) || value._objectId !== objectId) {
+            return;
+        }
+        // The object gets a new id if it is ever returned again.
+        delete value._objectId;
+        if (this.deleteOnRelease) {
+            const owner = this.owners.get(value);
+            const method = DELETE_METHODS[Object.getPrototypeOf(value).constructor.name];
+            if (owner !== undefined && method !== undefined) {
+                owner[method](value);
+            }
+        }
+    }
 }
@@ -1,18 +1,184 @@
-from typing import Mapping, Any
+from typing import Mapping, Any, Optional, Set, Tuple, Union
+import asyncio
+import json
 import logging
+import os
+import struct
+import time
 import uuid
+from collections import deque
 from pathlib import Path
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 
 logger = logging.getLogger(__name__)
 
 PROTOCOL_VERSION = "2.0"
+FRAME_ALIGNMENT = 8
 
-nodes: Mapping[str, WebSocket] = {}
+# Each node gets a bounded queue of outbound messages. When it is full,
+# the sender either waits until there is room or the node closes
+# ("block"), the oldest message is dropped ("drop_oldest"), or the
+# slow node is disconnected ("disconnect").
+QUEUE_SIZE = int(os.environ.get("RELAY_QUEUE_SIZE", "64"))
+QUEUE_POLICY = os.environ.get("RELAY_QUEUE_POLICY", "block")
+QUEUE_POLICIES = ("block", "drop_oldest", "disconnect")
+CLOSE_TRY_AGAIN_LATER = 1013
+# Seconds over which /metrics averages the message and byte rates.
+RATE_WINDOW = 10
+
+
+class RateMeter:
+    # Counts messages and bytes, in total and per second over the last
+    # RATE_WINDOW complete seconds.
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        self.window = window
+        self.messages = 0
+        self.bytes = 0
+        self.seconds = deque(maxlen=window + 1)
+
+    def add(self, size: int) -> None:
+        self.messages += 1
+        self.bytes += size
+        second = int(time.monotonic())
+        if not self.seconds or self.seconds[-1][0] != second:
+            self.seconds.append([second, 0, 0])
+        counts = self.seconds[-1]
+        counts[1] += 1
+        counts[2] += size
+
+    def rates(self) -> Tuple[float, float]:
+        now = int(time.monotonic())
+        messages = size = 0
+        for second, second_messages, second_bytes in self.seconds:
+            if now - self.window <= second < now:
+                messages += second_messages
+                size += second_bytes
+        return messages / self.window, size / self.window
+
+
+class Node:
+    def __init__(self, websocket: WebSocket, queue_size: int = QUEUE_SIZE, policy: str = QUEUE_POLICY) -> None:
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        self.websocket = websocket
+        self.policy = policy
+        self.addrs = set()
+        self.queue = asyncio.Queue(queue_size)
+        self.closed = False
+        # Done when the node closes, to release the senders blocked on
+        # its full queue.
+        self.closing = asyncio.get_running_loop().create_future()
+        self.sent = RateMeter()
+        self.received = RateMeter()
+        self.dropped_messages = 0
+        self.max_queue_depth = 0
+        self.writer = asyncio.create_task(self._write())
+
+    async def send(self, message: Union[bytes, str]) -> None:
+        if self.closed:
+            self.dropped_messages += 1
+            return
+        if self.queue.full():
+            if self.policy == "drop_oldest":
+                self.queue.get_nowait()
+                self.dropped_messages += 1
+            elif self.policy == "disconnect":
+                self.dropped_messages += 1
+                await self.close(CLOSE_TRY_AGAIN_LATER)
+                return
+            else:
+                put = asyncio.ensure_future(self.queue.put(message))
+                await asyncio.wait((put, self.closing), return_when=asyncio.FIRST_COMPLETED)
+                if self.closed:
+                    # A put that got through after all is dropped from
+                    # the queue.
+                    if put.cancel():
+                        self.dropped_messages += 1
+                    self._drop_queued()
+                    return
+                self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+                return
+        self.queue.put_nowait(message)
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+
+    def _set_closed(self) -> None:
+        self.closed = True
+        if not self.closing.done():
+            self.closing.set_result(None)
+        self._drop_queued()
+
+    def _drop_queued(self) -> None:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped_messages += 1
+
+    async def close(self, code: int = 1000) -> None:
+        if self.closed:
+            return
+        self._set_closed()
+        self.writer.cancel()
+        try:
+            await self.websocket.close(code)
+        except (RuntimeError, WebSocketDisconnect):
+            # Already closed by the peer.
+            pass
+
+    def stats(self) -> Any:
+        sent_messages, sent_bytes = self.sent.rates()
+        received_messages, received_bytes = self.received.rates()
+        return {
+            "queue_depth": self.queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "sent_messages": self.sent.messages,
+            "sent_bytes": self.sent.bytes,
+            "received_messages": self.received.messages,
+            "received_bytes": self.received.bytes,
+            "dropped_messages": self.dropped_messages,
+            "sent_messages_per_second": sent_messages,
+            "sent_bytes_per_second": sent_bytes,
+            "received_messages_per_second": received_messages,
+            "received_bytes_per_second": received_bytes,
+        }
+
+    async def _write(self) -> None:
+        try:
+            while True:
+                message = await self.queue.get()
+                if isinstance(message, bytes):
+                    await self.websocket.send_bytes(message)
+                else:
+                    await self.websocket.send_text(message)
+                self.sent.add(len(message))
+        except Exception:
+            logger.exception("Failed to write to a node")
+            self._set_closed()
+
+
+# Nodes listening on the same address form a group, and a message
+# sent to the address goes to all of them.
+nodes: Mapping[str, Set[Node]] = {}
+# Messages for an address that nobody listens to, such as replies to
+# a client that has gone, which are dropped.
+undeliverable_messages = 0
 app = FastAPI()
 
 
+def join(addr: str, node: Node) -> None:
+    nodes.setdefault(addr, set()).add(node)
+    node.addrs.add(addr)
+
+
+def leave(node: Node) -> None:
+    for addr in node.addrs:
+        members = nodes.get(addr)
+        if members is not None:
+            members.discard(node)
+            if not members:
+                del nodes[addr]
+    node.addrs.clear()
+
+
 @app.get("/")
 async def root():
     with open(Path(__file__).parent / 'main.html') as fp:
@@ -28,23 +194,123 @@ async def script():
     return HTMLResponse(js, media_type="text/javascript")
 
 
-async def route_message(packet: Any) -> None:
-    to_addr = packet['to']
-    websocket = nodes.get(to_addr)
-    if websocket is None:
-        raise ValueError("Unknown address")
-    await websocket.send_json(packet)
+@app.get("/webgl.js")
+async def webgl_script():
+    with open(Path(__file__).parent / 'webgl.js') as fp:
+        js = fp.read()
+    return HTMLResponse(js, media_type="text/javascript")
+
+
+@app.get("/metrics")
+async def metrics():
+    return {
+        "nodes": {addr: [node.stats() for node in members] for addr, members in nodes.items()},
+        "undeliverable_messages": undeliverable_messages,
+    }
+
+
+def _padding(length: int) -> int:
+    return -length % FRAME_ALIGNMENT
+
+
+# Binary frames start with a routing envelope, with integers in
+# little-endian:
+#
+#     uint16 to length, uint16 from length, to, from, padding
+#
+# The relay only decodes the envelope and forwards the rest of the
+# frame as it is.
+def parse_envelope(frame: bytes) -> Tuple[Optional[str], int]:
+    to_length, from_length = struct.unpack_from("<HH", frame)
+    to_addr = frame[4:4 + to_length].decode()
+    offset = 4 + to_length + from_length
+    return to_addr or None, offset + _padding(offset)
+
+
+def build_envelope(to_addr: str, from_addr: str) -> bytes:
+    to_addr = to_addr.encode()
+    from_addr = from_addr.encode()
+    envelope = struct.pack("<HH", len(to_addr), len(from_addr)) + to_addr + from_addr
+    return envelope + bytes(_padding(len(envelope)))
+
+
+def parse_body(payload: memoryview) -> Any:
+    header_length, segment_count = struct.unpack_from("<II", payload)
+    offset = 8 + 4 * segment_count
+    return json.loads(bytes(payload[offset:offset + header_length]))
+
+
+def unknown_address_frame(to_addr: str, from_addr: str, binary: bool) -> Union[bytes, str]:
+    # Tells a client that nobody listens to an address it connected to,
+    # such as a page that isn't open or has gone, as a notification from
+    # that address. The other sessions on its connection go on.
+    body = {
+        "jsonrpc": PROTOCOL_VERSION,
+        "method": "__unknown_address__",
+        "params": [from_addr],
+    }
+    if not binary:
+        return json.dumps({"to": to_addr, "from": from_addr, "body": body})
+    header = json.dumps(body).encode()
+    return build_envelope(to_addr, from_addr) + struct.pack("<II", len(header), 0) + header
+
+
+async def route_message(packet: Any) -> bool:
+    return await route_frame(packet['to'], json.dumps(packet))
+
+
+async def route_frame(to_addr: str, frame: Union[bytes, str]) -> bool:
+    # Returns whether anybody listens to to_addr. Messages for an
+    # address that nobody listens to are dropped.
+    global undeliverable_messages
+    members = nodes.get(to_addr)
+    if not members:
+        undeliverable_messages += 1
+        logger.debug("Dropping a message for unknown address %s", to_addr)
+        return False
+    if len(members) == 1:
+        for node in members:
+            await node.send(frame)
+    else:
+        # The frame is encoded once and shared by all the members.
+        await asyncio.gather(*(node.send(frame) for node in members))
+    return True
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
+    node = Node(websocket)
     from_addr = None
-    to_addr = None
+    # A client may connect to several addresses, to run a session with
+    # each of them over the same WebSocket.
+    to_addrs = set()
+    envelopes = {}
 
     try:
         while True:
-            packet = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            frame = message.get("bytes")
+            node.received.add(len(frame) if frame is not None else len(message["text"]))
+            if frame is not None:
+                packet_to_addr, offset = parse_envelope(frame)
+                payload = memoryview(frame)[offset:]
+                if packet_to_addr is not None:
+                    if from_addr is None:
+                        raise ValueError("Not connected yet")
+                    if to_addrs and packet_to_addr not in to_addrs:
+                        raise ValueError("Unexpected address")
+                    envelope = envelopes.get(packet_to_addr)
+                    if envelope is None:
+                        envelope = envelopes[packet_to_addr] = build_envelope(packet_to_addr, from_addr)
+                    if not await route_frame(packet_to_addr, envelope + payload) and packet_to_addr in to_addrs:
+                        await node.send(unknown_address_frame(from_addr, packet_to_addr, True))
+                    continue
+                packet = {"to": None, "body": parse_body(payload)}
+            else:
+                packet = json.loads(message["text"])
             if packet.get('to') is None:
                 body = packet['body']
                 if not isinstance(body, list):
@@ -56,20 +322,24 @@ async def websocket_endpoint(websocket: WebSocket):
                         raise ValueError("ID is not allowed")
                     if data["method"] == "__listen__":
                         from_addr, = data['params']
-                        nodes[from_addr] = websocket
+                        join(from_addr, node)
                     elif data["method"] == "__connect__":
-                        from_addr = str(uuid.uuid1())
-                        nodes[from_addr] = websocket
+                        if from_addr is None:
+                            from_addr = str(uuid.uuid1())
+                            join(from_addr, node)
                         to_addr, = data['params']
+                        to_addrs.add(to_addr)
                     else:
                         raise ValueError("Unknown method")
+                    envelopes.clear()
             else:
                 if from_addr is None:
                     raise ValueError("Not connected yet")
-                if to_addr is not None and packet["to"] != to_addr:
+                if to_addrs and packet["to"] not in to_addrs:
                     raise ValueError("Unexpected address")
                 packet["from"] = from_addr
-                await route_message(packet)
+                if not await route_message(packet) and packet["to"] in to_addrs:
+                    await node.send(unknown_address_frame(from_addr, packet["to"], False))
     finally:
-        if from_addr:
-            del nodes[from_addr]
+        leave(node)
+        await node.close()
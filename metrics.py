@@ -0,0 +1,100 @@
+import bisect
+from collections import Counter
+
+from rpc import ProxyHooks
+
+
+def exponential_bounds(start, factor, count):
+    return [start * factor ** i for i in range(count)]
+
+
+class Histogram:
+    # Counts values into buckets with the given upper bounds, and one
+    # more for larger values. Percentiles are estimated as the upper
+    # bound of the bucket they fall in.
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0
+        self.max = 0
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q):
+        if not self.count:
+            return 0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + [self.max], self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+            # Bucket upper bounds, in order, with their counts.
+            "buckets": [[bound, count] for bound, count in zip(self.bounds + ["+Inf"], self.counts) if count],
+        }
+
+
+class ProxyMetrics(ProxyHooks):
+    # Counts the calls sent per method, and keeps histograms of the
+    # calls and bytes per message, of the round-trip time of requests
+    # and of the frame latency, in seconds. Calls in a recorded command
+    # list count as the __record__ call that stores it:
+    #
+    #     metrics = ProxyMetrics()
+    #     proxy = ServerProxy("browser", transport, hooks=metrics)
+    #     ...
+    #     print(json.dumps(metrics.snapshot()))
+    def __init__(self):
+        self.calls = Counter()
+        self.requests = Counter()
+        self.batch_calls = Histogram(exponential_bounds(1, 2, 16))
+        self.batch_bytes = Histogram(exponential_bounds(64, 2, 20))
+        self.round_trip = Histogram(exponential_bounds(0.0001, 2, 18))
+        self.frame_latency = Histogram(exponential_bounds(0.001, 2, 14))
+        self._opcodes = None
+        self._names = {}
+
+    def on_flush(self, proxy, batch, size):
+        if proxy.opcodes is not self._opcodes:
+            self._opcodes = proxy.opcodes
+            self._names = {i: method for method, i in proxy.opcodes.items()}
+        names = self._names
+        for method, count in batch.methods.items():
+            self.calls[names.get(method, method)] += count
+        self.batch_calls.add(batch.count)
+        if size is not None:
+            self.batch_bytes.add(size)
+
+    def on_reply(self, proxy, method, seconds):
+        self.requests[method] += 1
+        self.round_trip.add(seconds)
+
+    def on_frame(self, proxy, frame_id, seconds):
+        self.frame_latency.add(seconds)
+
+    def snapshot(self):
+        return {
+            "calls": dict(self.calls.most_common()),
+            "requests": dict(self.requests.most_common()),
+            "batch_calls": self.batch_calls.snapshot(),
+            "batch_bytes": self.batch_bytes.snapshot(),
+            "round_trip": self.round_trip.snapshot(),
+            "frame_latency": self.frame_latency.snapshot(),
+        }
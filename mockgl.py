@@ -0,0 +1,261 @@
+# A stand-in for the browser page, for load tests without a GPU. It
+# listens on the relay like main.html, and its canvas hands out mock
+# WebGL contexts that record the calls made to them and answer queries
+# with fixed results. Several of them listening on the same name form
+# a group, like pages opened with the same name:
+#
+#     python mockgl.py --uri ws://127.0.0.1:8000/ws --name browser --count 8
+
+import argparse
+import logging
+import multiprocessing
+import typing
+from collections import Counter
+
+import webgl
+from rpc import Server, TransportWebsocket, TypedArray
+
+GL = webgl.WebGL2RenderingContext
+
+# Answers to getParameter(). Other parameters are 0.
+PARAMETERS = {
+    GL.VENDOR: "pywebgl",
+    GL.RENDERER: "mockgl",
+    GL.MAX_TEXTURE_SIZE: 4096,
+    GL.MAX_CUBE_MAP_TEXTURE_SIZE: 4096,
+    GL.MAX_RENDERBUFFER_SIZE: 4096,
+    GL.MAX_VIEWPORT_DIMS: [4096, 4096],
+    GL.MAX_VERTEX_ATTRIBS: 16,
+    GL.MAX_VERTEX_UNIFORM_VECTORS: 1024,
+    GL.MAX_FRAGMENT_UNIFORM_VECTORS: 1024,
+    GL.MAX_VARYING_VECTORS: 30,
+    GL.MAX_TEXTURE_IMAGE_UNITS: 16,
+    GL.MAX_VERTEX_TEXTURE_IMAGE_UNITS: 16,
+    GL.MAX_COMBINED_TEXTURE_IMAGE_UNITS: 32,
+}
+
+CONTEXT_ATTRIBUTES = {
+    "alpha": True,
+    "antialias": True,
+    "depth": True,
+    "desynchronized": False,
+    "failIfMajorPerformanceCaveat": False,
+    "powerPreference": "default",
+    "premultipliedAlpha": True,
+    "preserveDrawingBuffer": False,
+    "stencil": False,
+}
+
+
+class MockObject:
+    # The server sends results by reference under the name of their
+    # class, so each interface gets a class of the same name.
+    pass
+
+
+OBJECT_CLASSES = {
+    name: type(name, (MockObject,), {})
+    for name, interface in webgl.INTERFACES.items()
+    if issubclass(interface, (webgl.WebGLObject, webgl.WebGLUniformLocation))
+}
+
+
+def _returned_class(method):
+    # The mock class for methods that return a WebGL object.
+    annotation = getattr(GL, method).__annotations__.get("return")
+    for cls in (annotation, *typing.get_args(annotation)):
+        name = getattr(cls, "__name__", None)
+        if name in OBJECT_CLASSES:
+            return OBJECT_CLASSES[name]
+    return None
+
+
+def _attrib_location(gl, program, name):
+    # Attributes get consecutive locations in the order they are asked for.
+    locations = program.__dict__.setdefault("attrib_locations", {})
+    return locations.setdefault(name, len(locations))
+
+
+# Answers to the queries, from the context and the arguments. Methods
+# not listed return a new object when their IDL return type is one, and
+# None otherwise.
+ANSWERS = {
+    "getError": lambda gl, args: GL.NO_ERROR,
+    "isContextLost": lambda gl, args: False,
+    "getContextAttributes": lambda gl, args: dict(CONTEXT_ATTRIBUTES),
+    "getSupportedExtensions": lambda gl, args: list(gl.EXTENSIONS),
+    "getExtension": lambda gl, args: gl.get_extension(args[0]),
+    "getParameter": lambda gl, args: PARAMETERS.get(args[0], 0),
+    "checkFramebufferStatus": lambda gl, args: GL.FRAMEBUFFER_COMPLETE,
+    "getShaderParameter": lambda gl, args: args[1] == GL.COMPILE_STATUS or 0,
+    "getProgramParameter": lambda gl, args: args[1] in (GL.LINK_STATUS, GL.VALIDATE_STATUS) or 0,
+    "getShaderInfoLog": lambda gl, args: "",
+    "getProgramInfoLog": lambda gl, args: "",
+    "getShaderPrecisionFormat": lambda gl, args: {"rangeMin": 127, "rangeMax": 127, "precision": 23},
+    "getAttribLocation": lambda gl, args: _attrib_location(gl, *args),
+    "getFragDataLocation": lambda gl, args: 0,
+    "getUniformBlockIndex": lambda gl, args: 0,
+    "isEnabled": lambda gl, args: args[0] in gl.enabled,
+    "clientWaitSync": lambda gl, args: GL.CONDITION_SATISFIED,
+    "getSyncParameter": lambda gl, args: GL.SIGNALED if args[1] == GL.SYNC_STATUS else 0,
+    "getQueryParameter": lambda gl, args: True if args[1] == GL.QUERY_RESULT_AVAILABLE else 0,
+}
+for _name in ("isBuffer", "isFramebuffer", "isProgram", "isQuery", "isRenderbuffer", "isSampler",
+              "isShader", "isSync", "isTexture", "isTransformFeedback", "isVertexArray"):
+    ANSWERS[_name] = lambda gl, args: isinstance(args[0], MockObject)
+
+
+def _mock_method(name):
+    answer = ANSWERS.get(name)
+    cls = _returned_class(name)
+
+    def method(self, *args):
+        self.record(name, args)
+        if answer is not None:
+            return answer(self, args)
+        if cls is not None:
+            return cls()
+        return None
+    method.__name__ = name
+    return method
+
+
+class MockContext:
+    # Counts the calls and the typed array bytes passed to them. With
+    # keep_calls, the calls are kept in order in calls.
+    EXTENSIONS = ()
+
+    def __init__(self, keep_calls=False):
+        self.calls = [] if keep_calls else None
+        self.call_count = 0
+        self.call_counts = Counter()
+        self.array_bytes = 0
+        self.enabled = set()
+        self.extensions = {}
+
+    def record(self, name, args):
+        self.call_count += 1
+        self.call_counts[name] += 1
+        if self.calls is not None:
+            self.calls.append((name, args))
+        for value in args:
+            if isinstance(value, TypedArray):
+                self.array_bytes += len(value.data)
+        if name == "enable":
+            self.enabled.add(args[0])
+        elif name == "disable":
+            self.enabled.discard(args[0])
+
+    def get_extension(self, name):
+        if name not in self.EXTENSIONS:
+            return None
+        if name not in self.extensions:
+            self.extensions[name] = self.EXTENSIONS[name](self)
+        return self.extensions[name]
+
+
+for _name in webgl.METHODS:
+    setattr(MockContext, _name, _mock_method(_name))
+
+
+class ANGLEInstancedArrays(MockObject):
+    # Calls made through the extension are recorded by the context.
+    def __init__(self, gl):
+        self.gl = gl
+
+    def drawArraysInstancedANGLE(self, *args):
+        self.gl.record("drawArraysInstancedANGLE", args)
+
+    def drawElementsInstancedANGLE(self, *args):
+        self.gl.record("drawElementsInstancedANGLE", args)
+
+    def vertexAttribDivisorANGLE(self, *args):
+        self.gl.record("vertexAttribDivisorANGLE", args)
+
+
+class WebGLRenderingContext(MockContext):
+    EXTENSIONS = {"ANGLE_instanced_arrays": ANGLEInstancedArrays}
+
+
+class WebGL2RenderingContext(MockContext):
+    pass
+
+
+class CanvasObject:
+    # Like a canvas element, the first getContext() decides the kind
+    # of context, and asking for another kind returns None.
+    CONTEXTS = {
+        "webgl": WebGLRenderingContext,
+        "experimental-webgl": WebGLRenderingContext,
+        "webgl2": WebGL2RenderingContext,
+    }
+
+    def __init__(self, max_version=2, keep_calls=False):
+        self.max_version = max_version
+        self.keep_calls = keep_calls
+        self.context = None
+
+    def getContext(self, context_id):
+        cls = self.CONTEXTS.get(context_id)
+        if cls is None or (cls is WebGL2RenderingContext and self.max_version < 2):
+            return None
+        if self.context is None:
+            self.context = cls(self.keep_calls)
+        return self.context if type(self.context) is cls else None
+
+
+def make_server(name, transport, max_version=2, frame_interval=1 / 60, keep_calls=False):
+    server = Server(name, transport, methods=webgl.METHODS, frame_interval=frame_interval)
+    server.register_default_methods()
+    server.register_root_object(CanvasObject(max_version, keep_calls))
+    return server
+
+
+def serve(uri, name, max_version=2, frame_interval=1 / 60):
+    # Runs one page until the relay closes the connection.
+    server = make_server(name, TransportWebsocket(uri), max_version, frame_interval)
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+    gl = server.root_object.context
+    if gl is not None:
+        print(f"{name}: {gl.call_count} calls, {gl.array_bytes} array bytes, "
+              f"{server.live_object_count} live objects", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uri", default="ws://127.0.0.1:8000/ws")
+    parser.add_argument("--name", default="browser")
+    parser.add_argument("--count", type=int, default=1, help="pages to run, each in its own process")
+    parser.add_argument("--distinct", action="store_true", help="listen on name-0, name-1, ... instead of a group")
+    parser.add_argument("--webgl", type=int, choices=(1, 2), default=2, help="highest WebGL version offered")
+    parser.add_argument("--fps", type=float, default=60, help="frame presentation rate, 0 to present right away")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    if args.verbose:
+        logging.getLogger("rpc").setLevel(logging.INFO)
+        logging.basicConfig()
+
+    frame_interval = 1 / args.fps if args.fps else None
+    names = [f"{args.name}-{i}" if args.distinct else args.name for i in range(args.count)]
+    if len(names) == 1:
+        serve(args.uri, names[0], args.webgl, frame_interval)
+        return
+    processes = [
+        multiprocessing.Process(target=serve, args=(args.uri, name, args.webgl, frame_interval))
+        for name in names
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
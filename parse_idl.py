@@ -1,15 +1,407 @@
+import keyword
 import re
 
 
+IDL_FILES = ['webgl.idl', 'webgl2.idl']
+
+# Tokens of the WebIDL grammar, https://webidl.spec.whatwg.org/#idl-grammar
+TOKENS = re.compile(r'''
+    (?P<space>[\t\n\r ]+|//[^\n]*|/\*.*?\*/)
+  | (?P<decimal>-?(?:(?:[0-9]+\.[0-9]*|[0-9]*\.[0-9]+)(?:[Ee][+-]?[0-9]+)?|[0-9]+[Ee][+-]?[0-9]+))
+  | (?P<integer>-?(?:0[Xx][0-9A-Fa-f]+|[1-9][0-9]*|0[0-7]*))
+  | (?P<identifier>[_-]?[A-Za-z][0-9A-Z_a-z-]*)
+  | (?P<string>"[^"]*")
+  | (?P<other>\.\.\.|[^\t\n\r 0-9A-Za-z])
+''', re.VERBOSE | re.DOTALL)
+
+# Keywords that start a type of two words, like "unsigned short".
+PRIMITIVE_PREFIXES = {"unsigned", "unrestricted"}
+
+# Python annotations of the IDL types, after typedefs are resolved.
+ANNOTATIONS = {
+    "boolean": "bool",
+    "byte": "int",
+    "octet": "int",
+    "short": "int",
+    "unsigned short": "int",
+    "long": "int",
+    "unsigned long": "int",
+    "long long": "int",
+    "unsigned long long": "int",
+    "float": "float",
+    "unrestricted float": "float",
+    "double": "float",
+    "unrestricted double": "float",
+    "DOMString": "str",
+}
+
+# Default values that can be written as Python literals.
+DEFAULTS = {"true": "True", "false": "False", "null": "None"}
+
+
+class IdlError(Exception):
+    pass
+
+
+class Interface:
+    def __init__(self, name, parent, mixin):
+        self.name = name
+        self.parent = parent
+        self.mixin = mixin
+        self.includes = []
+        self.members = []
+
+
+class Constant:
+    def __init__(self, name, type, value):
+        self.name = name
+        self.type = type
+        self.value = value
+
+
+class Attribute:
+    def __init__(self, name, type, readonly):
+        self.name = name
+        self.type = type
+        self.readonly = readonly
+
+
+class Operation:
+    def __init__(self, name, type, arguments):
+        self.name = name
+        self.type = type
+        self.arguments = arguments
+
+
+class Argument:
+    def __init__(self, name, type, optional=False, variadic=False, default=None):
+        self.name = name
+        self.type = type
+        self.optional = optional
+        self.variadic = variadic
+        self.default = default
+
+
+def tokenize(text):
+    tokens = []
+    position = 0
+    while position < len(text):
+        m = TOKENS.match(text, position)
+        if m is None:
+            raise IdlError(f"Unexpected character {text[position]!r} at {position}")
+        if m.lastgroup != "space":
+            tokens.append(m.group())
+        position = m.end()
+    return tokens
+
+
+class Parser:
+    # Recursive descent parser for the part of WebIDL that the WebGL
+    # specifications use. Types are kept as their normalized text, such
+    # as "sequence<GLenum>" or "WebGLBuffer?", and extended attributes
+    # are skipped.
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.position = 0
+        self.interfaces = {}
+        self.typedefs = {}
+        self.enums = {}
+
+    def parse(self):
+        while not self._at_end():
+            self._definition()
+        return self
+
+    def _at_end(self):
+        return self.position >= len(self.tokens)
+
+    def _peek(self, offset=0):
+        position = self.position + offset
+        return self.tokens[position] if position < len(self.tokens) else None
+
+    def _next(self):
+        if self._at_end():
+            raise IdlError("Unexpected end of input")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _accept(self, token):
+        if self._peek() == token:
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, token):
+        found = self._next()
+        if found != token:
+            raise IdlError(f"Expected {token!r}, found {found!r} near {' '.join(self.tokens[self.position - 5:self.position + 5])}")
+
+    def _identifier(self):
+        token = self._next()
+        if not re.match(r'[_-]?[A-Za-z]', token):
+            raise IdlError(f"Expected an identifier, found {token!r}")
+        return token.lstrip('_')
+
+    def _extended_attributes(self):
+        if self._peek() != '[':
+            return
+        depth = 0
+        while True:
+            token = self._next()
+            if token in '[(':
+                depth += 1
+            elif token in '])':
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _definition(self):
+        self._extended_attributes()
+        token = self._next()
+        if token == "typedef":
+            self._extended_attributes()
+            type = self._type()
+            self.typedefs[self._identifier()] = type
+            self._expect(';')
+        elif token == "enum":
+            name = self._identifier()
+            self._expect('{')
+            values = []
+            while not self._accept('}'):
+                values.append(self._next().strip('"'))
+                self._accept(',')
+            self.enums[name] = values
+            self._expect(';')
+        elif token == "dictionary":
+            # Only passed by value, so the members don't matter here.
+            self._identifier()
+            if self._accept(':'):
+                self._identifier()
+            self._skip_block()
+            self._expect(';')
+        elif token == "interface":
+            mixin = self._accept("mixin")
+            name = self._identifier()
+            parent = self._identifier() if self._accept(':') else None
+            interface = Interface(name, parent, mixin)
+            self.interfaces[name] = interface
+            self._expect('{')
+            while not self._accept('}'):
+                member = self._member()
+                if member is not None:
+                    interface.members.append(member)
+            self._expect(';')
+        elif self._peek() == "includes":
+            self._next()
+            self.interfaces[token].includes.append(self._identifier())
+            self._expect(';')
+        else:
+            raise IdlError(f"Unsupported definition {token!r}")
+
+    def _skip_block(self):
+        self._expect('{')
+        depth = 1
+        while depth:
+            token = self._next()
+            if token == '{':
+                depth += 1
+            elif token == '}':
+                depth -= 1
+
+    def _member(self):
+        self._extended_attributes()
+        if self._accept("const"):
+            type = self._type()
+            name = self._identifier()
+            self._expect('=')
+            value = self._next()
+            self._expect(';')
+            return Constant(name, type, value)
+        if self._accept("constructor"):
+            self._arguments()
+            self._expect(';')
+            return None
+        readonly = self._accept("readonly")
+        if self._accept("attribute"):
+            type = self._type()
+            name = self._identifier()
+            # The WebGL IDL gives some attributes their initial value.
+            if self._accept('='):
+                self._next()
+            self._expect(';')
+            return Attribute(name, type, readonly)
+        type = self._type()
+        name = self._identifier()
+        arguments = self._arguments()
+        self._expect(';')
+        return Operation(name, type, arguments)
+
+    def _arguments(self):
+        self._expect('(')
+        arguments = []
+        while not self._accept(')'):
+            self._extended_attributes()
+            optional = self._accept("optional")
+            self._extended_attributes()
+            type = self._type()
+            variadic = self._accept("...")
+            name = self._identifier()
+            default = self._default() if self._accept('=') else None
+            arguments.append(Argument(name, type, optional, variadic, default))
+            self._accept(',')
+        return arguments
+
+    def _default(self):
+        token = self._next()
+        if token in '[{':
+            self._next()
+            return token + {'[': ']', '{': '}'}[token]
+        return token
+
+    def _type(self):
+        self._extended_attributes()
+        if self._accept('('):
+            members = [self._type()]
+            while self._accept("or"):
+                members.append(self._type())
+            self._expect(')')
+            type = f"({' or '.join(members)})"
+        else:
+            words = [self._next()]
+            if words[0] in PRIMITIVE_PREFIXES:
+                words.append(self._next())
+            if words[-1] == "long" and self._peek() == "long":
+                words.append(self._next())
+            type = " ".join(words)
+            if self._accept('<'):
+                parameters = [self._type()]
+                while self._accept(','):
+                    parameters.append(self._type())
+                self._expect('>')
+                type += f"<{', '.join(parameters)}>"
+        if self._accept('?'):
+            type += '?'
+        return type
+
+
+def resolve(type, typedefs):
+    while type.rstrip('?') in typedefs:
+        type = typedefs[type.rstrip('?')] + ('?' if type.endswith('?') else '')
+    return type
+
+
+def annotation(type, typedefs, defined):
+    nullable = type.endswith('?')
+    base = resolve(type, typedefs).rstrip('?')
+    if base in ANNOTATIONS:
+        result = ANNOTATIONS[base]
+    elif base in defined:
+        result = base
+    else:
+        return "Any"
+    return f"Optional[{result}]" if nullable else result
+
+
+def signature(overloads, typedefs, defined):
+    # Parameters of the Python method for the overloads of an operation,
+    # as (name, annotation, default), or None when they differ in their
+    # number of arguments or take optional arguments without a default
+    # that Python can spell.
+    if len({len(arguments) for arguments in overloads}) != 1:
+        return None
+    params = []
+    for overload_arguments in zip(*overloads):
+        if any(argument.variadic for argument in overload_arguments):
+            return None
+        default = None
+        if any(argument.optional for argument in overload_arguments):
+            if len(overloads) != 1:
+                return None
+            default = overload_arguments[0].default
+            if default is None or default in ('[]', '{}'):
+                return None
+            default = DEFAULTS.get(default, default)
+        elif params and params[-1][2] is not None:
+            return None
+        names = []
+        annotations = []
+        for argument in overload_arguments:
+            if argument.name not in names:
+                names.append(argument.name)
+            argument_annotation = annotation(argument.type, typedefs, defined)
+            if argument_annotation not in annotations:
+                annotations.append(argument_annotation)
+        name = "_or_".join(names)
+        if keyword.iskeyword(name):
+            name += "_"
+        params.append((name, annotations[0] if len(annotations) == 1 else "Any", default))
+    return params
+
+
+def write_method(fp, operation, overloads, interface_names, typedefs, defined):
+    func = operation.name
+    params = signature(overloads, typedefs, defined)
+    if params is None:
+        params = "self, *args"
+        args = "*args"
+        arg_tuple = "args"
+    else:
+        args = ", ".join(name for name, _, _ in params)
+        # (a) isn't a tuple.
+        arg_tuple = f"({args},)" if len(params) == 1 else f"({args})"
+        params = ", ".join(["self"] + [
+            f"{name}: {param_annotation}" + ("" if default is None else f" = {default}")
+            for name, param_annotation, default in params])
+    call_args = f", {args}" if args else ""
+    return_type = operation.type
+    optional = return_type.endswith('?')
+    return_type = return_type.rstrip('?')
+    if return_type == "undefined":
+        # Procedures go straight into the batch.
+        fp.write(f'    def {func}({params}) -> None:\n')
+        fp.write(f'        self._append_procedure(\"{func}\", {arg_tuple})\n')
+        return
+    if return_type in interface_names:
+        constructor = return_type
+        if optional:
+            return_type = f"Optional[{return_type}]"
+        if func.startswith("create"):
+            fp.write(f'    def {func}({params}) -> {return_type}:\n')
+            fp.write(f'        return self._invoke_constructor(\"{func}\", \"{constructor}\"{call_args})\n')
+            return
+    else:
+        return_type = "Any"
+    fp.write(f'    def {func}({params}) -> {return_type}:\n')
+    fp.write(f'        return self._invoke_function(\"{func}\"{call_args})\n')
+
+
 def main():
-    with open('webgl.idl') as fp:
-        x = fp.read()
+    interfaces = {}
+    typedefs = {}
+    for path in IDL_FILES:
+        with open(path) as fp:
+            parser = Parser(fp.read()).parse()
+        for name, interface in parser.interfaces.items():
+            if name in interfaces:
+                interfaces[name].includes += interface.includes
+            else:
+                interfaces[name] = interface
+        typedefs.update(parser.typedefs)
+
+    # The proxies need the objects, and the contexts with their mixins.
+    def is_object(interface):
+        while interface.parent in interfaces:
+            interface = interfaces[interface.parent]
+        return interface.name == "WebGLObject"
 
-    x = re.sub(r'//.*\n', '', x)
-    x = re.sub(r'/\*.*\*/', '', x)
-    x = re.sub(r'\[[^]]*\]', '', x)
-    x = re.sub(r'\([^\)]*\)', '()', x)
-    x = re.sub(r'typedef[^;]*;', '', x)
+    mixins = {mixin for interface in interfaces.values() for mixin in interface.includes}
+    emitted = [
+        interface for interface in interfaces.values()
+        if is_object(interface) or interface.name == "WebGLUniformLocation"
+        or interface.name in mixins or interface.includes
+    ]
+    interface_names = {interface.name for interface in emitted}
 
     with open('webgl.py', 'w') as fp:
         fp.write("""
@@ -17,8 +409,8 @@ def main():
 #
 # WebGL IDL definitions scraped from the Khronos specification:
 # https://www.khronos.org/registry/webgl/specs/latest/
-                 
-from typing import Any, Optional                 
+
+from typing import Any, Optional
 from abc import ABC, abstractmethod
 
 
@@ -31,6 +423,9 @@ def register(cls):
 
 
 class ProxyInterfaceBase(ABC):
+    # Interfaces hold no state, so that proxy classes can use __slots__.
+    __slots__ = ()
+
     @abstractmethod
     def _get_attribute(self, name) -> Any: NotImplemented
     @abstractmethod
@@ -39,67 +434,79 @@ class ProxyInterfaceBase(ABC):
     def _invoke_function(self, name, *args) -> Any: NotImplemented
     @abstractmethod
     def _invoke_procedure(self, name, *args) -> None: NotImplemented
+    @abstractmethod
+    def _append_procedure(self, name, args) -> None: NotImplemented
+    @abstractmethod
+    def _invoke_constructor(self, name, constructor, *args) -> Any: NotImplemented
 """)
 
-        interfaces = set()
-        for m in re.finditer(r'interface\s+(?:mixin\s+)?(\S+)\s*(?::\s+(\S+)\s*)?\{([^\}]*)\}', x):
-            interface = m.group(1)
-            parent_interface = m.group(2)
-            if interface not in ("WebGLUniformLocation", "WebGLRenderingContextBase", "WebGLRenderingContextOverloads", "WebGLObject") and parent_interface != "WebGLObject":
-                continue
-
+        defined = set()
+        methods = []
+        arguments = {}
+        for interface in emitted:
             fp.write("\n\n")
-
-            body = m.group(3)
             fp.write("@register\n")
-            if parent_interface:
-                fp.write(f"class {interface}({parent_interface}): \n")
+            if interface.includes:
+                fp.write(f"class {interface.name}({', '.join(interface.includes)}):\n")
+            elif interface.parent:
+                fp.write(f"class {interface.name}({interface.parent}): \n")
             else:
-                fp.write(f"class {interface}(ProxyInterfaceBase):\n")
-            has_decl = False
+                fp.write(f"class {interface.name}(ProxyInterfaceBase):\n")
+            fp.write("    __slots__ = ()\n")
+            defined.add(interface.name)
+
+            overloads = {}
+            for member in interface.members:
+                if isinstance(member, Operation):
+                    overloads.setdefault(member.name, []).append(member.arguments)
             funcs = set()
-            interfaces.add(interface)
-            for decl in body.split(';'):
-                decl = decl.strip()
-                if decl:
-                    has_decl = True
-                    s = decl.split()
-                    if "const" in s:
-                        x, _, z = decl.partition("=")
-                        x = x.strip().split()
-                        z = z.strip()
-                        fp.write(f"    {x[-1]} = {z}\n")
-                    elif "attribute" in s:
-                        x, _, _ = decl.partition("=")
-                        attr = x.split()[-1]
-                        fp.write("    @property\n")
-                        fp.write(f"    def {attr}(self): return self._get_attribute(\"{attr}\")\n")
-                        if "readonly" not in s:
-                            fp.write(f"    @{attr}.setter\n")
-                            fp.write(f"    def {attr}(self, value): self._set_attribute(\"{attr}\", value)\n")
-                    elif "()" in decl:
-                        x = decl.replace('()', '').split()
-                        func = x[-1]
-                        if func in funcs:
-                            continue
-                        return_type = x[0]
-                        optional = False
-                        if return_type.endswith('?'):
-                            optional = True
-                            return_type = return_type[:-1]
-                        if 'undefined' in x:
-                            fp.write(f'    def {func}(self, *args) -> None: self._invoke_procedure(\"{func}\", *args)\n')
-                        elif return_type in interfaces:
-                            if optional:
-                                return_type = f"Optional[{return_type}]"
-                            fp.write(f'    def {func}(self, *args) -> {return_type}: return self._invoke_function(\"{func}\", *args)\n')
-                        else:
-                            fp.write(f'    def {func}(self, *args) -> Any: return self._invoke_function(\"{func}\", *args)\n')
-                        funcs.add(func)
-                    else:
-                        raise ValueError(decl)
-            if not has_decl:
-                fp.write("    pass\n")
+            for member in interface.members:
+                if isinstance(member, Constant):
+                    fp.write(f"    {member.name} = {member.value}\n")
+                elif isinstance(member, Attribute):
+                    attr = member.name
+                    fp.write("    @property\n")
+                    fp.write(f"    def {attr}(self): return self._get_attribute(\"{attr}\")\n")
+                    if not member.readonly:
+                        fp.write(f"    @{attr}.setter\n")
+                        fp.write(f"    def {attr}(self, value): self._set_attribute(\"{attr}\", value)\n")
+                elif member.name not in funcs:
+                    funcs.add(member.name)
+                    write_method(fp, member, overloads[member.name], interface_names, typedefs, defined)
+                    if member.name not in methods:
+                        methods.append(member.name)
+                    known = arguments.setdefault(member.name, [])
+                    for overload in overloads[member.name]:
+                        overload = tuple((argument.name, argument.type, argument.optional) for argument in overload)
+                        if overload not in known:
+                            known.append(overload)
+
+        # Methods are sent as their index in this table, which is
+        # shared with the browser through webgl.js.
+        fp.write("\n\nMETHODS = [\n")
+        for func in methods:
+            fp.write(f'    "{func}",\n')
+        fp.write("]\n")
+
+        # The arguments of each overload of the methods, as (name, IDL
+        # type, optional), for the marshaller.
+        fp.write("\n\nARGUMENTS = {\n")
+        for func in methods:
+            fp.write(f'    "{func}": (\n')
+            for overload in arguments[func]:
+                fp.write(f'        {overload!r},\n')
+            fp.write('    ),\n')
+        fp.write("}\n")
+
+    with open('webgl.js', 'w') as fp:
+        fp.write("""// AUTOGENERATED FILE -- DO NOT EDIT -- See parse_idl.py
+"use strict";
+
+const WEBGL_METHODS = [
+""")
+        for func in methods:
+            fp.write(f'    "{func}",\n')
+        fp.write("];\n")
 
 
 if __name__ == "__main__":
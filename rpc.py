@@ -1,5 +1,16 @@
 from websockets.sync.client import connect
+from websockets.asyncio.client import connect as async_connect
+from websockets.exceptions import ConnectionClosed
+import array
+import asyncio
+import hashlib
 import json
+import struct
+import sys
+import time
+import weakref
+import zlib
+from collections import Counter, OrderedDict, deque
 from functools import partial
 import logging
 
@@ -8,20 +19,419 @@ logger.setLevel(logging.ERROR)
 
 
 PROTOCOL_VERSION = "2.0"
+ERROR_INTERNAL = -32603
+
+# Typed arrays that can travel as raw little-endian bytes, with
+# the array module typecode of their element.
+TYPED_ARRAYS = {
+    "Int8Array": "b",
+    "Uint8Array": "B",
+    "Int16Array": "h",
+    "Uint16Array": "H",
+    "Int32Array": "i",
+    "Uint32Array": "I",
+    "Float32Array": "f",
+    "Float64Array": "d",
+}
+
+# Typed arrays for buffers of a given kind and item size, where the
+# kind is "i" for signed, "u" for unsigned integers and "f" for floats.
+BUFFER_TYPED_ARRAYS = {
+    ("i", 1): "Int8Array",
+    ("u", 1): "Uint8Array",
+    ("i", 2): "Int16Array",
+    ("u", 2): "Uint16Array",
+    ("i", 4): "Int32Array",
+    ("u", 4): "Uint32Array",
+    ("f", 4): "Float32Array",
+    ("f", 8): "Float64Array",
+}
+
+BUFFER_KINDS = {
+    "b": "i", "h": "i", "i": "i", "l": "i", "q": "i",
+    "B": "u", "H": "u", "I": "u", "L": "u", "Q": "u",
+    "f": "f", "d": "f",
+}
+
+# Segments sent with zlib are flagged by the top bit of their length.
+SEGMENT_DEFLATED = 0x80000000
+SEGMENT_COMPRESSION_LEVEL = 1
+
+# Payloads of these methods are cached by the server when the proxy
+# has asset_cache set and they are at least ASSET_MIN_BYTES long.
+ASSET_METHODS = {"bufferData", "bufferSubData", "texImage2D", "texSubImage2D"}
+ASSET_MIN_BYTES = 1024
+# Bytes of typed arrays kept for the asset cache by Server.
+MAX_ASSET_BYTES = 256 * 1024 * 1024
+# Buffers with a stream or dynamic usage are refilled every frame or
+# so, and their data is not worth keeping.
+STREAMING_USAGES = {0x88E0, 0x88E1, 0x88E2, 0x88E8, 0x88E9, 0x88EA}
+
+# Typed arrays that the IDL list types are sent as. WebGL rejects
+# typed arrays of another type, so these and sequences are converted.
+LIST_TYPES = {
+    "Float32List": "Float32Array",
+    "Int32List": "Int32Array",
+    "Uint32List": "Uint32Array",
+}
+
+# Arguments that are sent as they are.
+PLAIN_TYPES = {int, float, bool, str, type(None)}
+
+# Frames presented in the window that fps and frame_latency average.
+FRAME_WINDOW = 60
+
+# Default limits of a batch, over which ServerProxy sends it without
+# waiting for flush(). The bytes are the ones of the typed arrays.
+MAX_BATCH_CALLS = 4096
+MAX_BATCH_BYTES = 16 * 1024 * 1024
+# With max_batch_age, the batch age is looked at every so many calls.
+BATCH_CHECK_CALLS = 64
+# Calls are kept as objects until there are this many, and then
+# encoded into the batch.
+ENCODE_CALLS = 256
+
+# Binary segments are aligned so that the browser can wrap them
+# with typed array views without copying.
+FRAME_ALIGNMENT = 8
 
 
 class ProxyException(Exception):
     pass
 
 
+class Placeholder:
+    # Stands for the argument at the given index of replay() in a
+    # recorded command list.
+    def __init__(self, index):
+        self.index = index
+
+
+class Asset:
+    # A typed array that the server keeps by digest. It is sent as a
+    # reference once the server is known to hold it.
+    def __init__(self, array):
+        self.array = array
+        self.digest = hashlib.blake2b(
+            array.constructor.encode() + array.data, digest_size=16).hexdigest()
+        self.cached = False
+
+
+def is_asset_call(method, args):
+    # args follow the target; bufferData(target, data, usage) tells
+    # whether its data is streamed.
+    if method not in ASSET_METHODS:
+        return False
+    return not (method == "bufferData" and len(args) > 2 and args[2] in STREAMING_USAGES)
+
+
+class TypedArray:
+    def __init__(self, constructor, values):
+        if constructor not in TYPED_ARRAYS:
+            raise ValueError(f"Unknown typed array: {constructor}")
+        if isinstance(values, (list, tuple)):
+            values = array.array(TYPED_ARRAYS[constructor], values)
+            if sys.byteorder == "big":
+                values.byteswap()
+        self.constructor = constructor
+        self.data = memoryview(values).cast("B")
+
+    def tolist(self):
+        values = array.array(TYPED_ARRAYS[self.constructor])
+        values.frombytes(self.data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+
+    def __len__(self):
+        return len(self.data) // array.array(TYPED_ARRAYS[self.constructor]).itemsize
+
+    def __repr__(self):
+        return f"<{self.constructor} of {len(self)} elements>"
+
+
+def typed_array_from_buffer(value):
+    # Converts a NumPy array, array.array, memoryview or any other
+    # object with the buffer protocol. The bytes are copied, because
+    # the batch is encoded later and the caller may reuse the buffer.
+    view = memoryview(value)
+    byteorder = view.format[0] if view.format[0] in "@=<>!" else "@"
+    constructor = BUFFER_TYPED_ARRAYS.get(
+        (BUFFER_KINDS.get(view.format.lstrip("@=<>!")), view.itemsize))
+    if constructor is None:
+        raise ValueError(f"No typed array for buffer format {view.format!r}")
+    data = view.tobytes()
+    if view.itemsize > 1 and (byteorder in ">!" or (byteorder in "@=" and sys.byteorder == "big")):
+        values = array.array(TYPED_ARRAYS[constructor])
+        values.frombytes(data)
+        values.byteswap()
+        data = values
+    return TypedArray(constructor, data)
+
+
+def list_arguments(arguments):
+    # {method: ((index, typed array), ...)} for the arguments that have
+    # an IDL list type in every overload of the method, from the
+    # ARGUMENTS table of webgl.py.
+    result = {}
+    for method, overloads in arguments.items():
+        types = {}
+        for overload in overloads:
+            for i, (_, idl_type, _) in enumerate(overload):
+                types.setdefault(i, set()).add(LIST_TYPES.get(idl_type))
+        lists = tuple(
+            (i, constructors.pop()) for i, constructors in types.items()
+            if len(constructors) == 1 and None not in constructors)
+        if lists:
+            result[method] = lists
+    return result
+
+
+def typed_list(value, constructor):
+    if isinstance(value, TypedArray):
+        if value.constructor == constructor:
+            return value
+        return TypedArray(constructor, value.tolist())
+    if isinstance(value, (list, tuple)):
+        return TypedArray(constructor, value)
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return value
+    if view.ndim == 0:
+        return value
+    try:
+        # In native byte order, whatever the order of the buffer.
+        converted = typed_array_from_buffer(view)
+    except ValueError:
+        # Formats without a typed array, such as bool.
+        return TypedArray(constructor, memoryview(view.tobytes()).cast(view.format).tolist())
+    if converted.constructor == constructor:
+        return converted
+    return TypedArray(constructor, converted.tolist())
+
+
+def _padding(length):
+    return -length % FRAME_ALIGNMENT
+
+
+# With binary framing, every packet is sent as a binary frame so that
+# the relay only has to look at the addresses. With integers in
+# little-endian, the layout is
+#
+#     uint16 to length, uint16 from length, to, from, padding,
+#     uint32 header length, uint32 segment count,
+#     uint32 segment lengths..., header JSON, padding,
+#     (segment, padding)...
+#
+# where the header is the JSON encoded body and typed arrays in it
+# refer to their segment by index. Segments of at least
+# compress_threshold bytes are compressed with zlib when that makes
+# them smaller, and their length has the SEGMENT_DEFLATED bit set.
+# Without binary framing, the packet is sent as a JSON text frame and
+# typed arrays as lists.
+#
+# The body may also be an EncodedBatch, whose calls are already
+# encoded in the same framing.
+def encode_packet(packet, binary=True, compress_threshold=None):
+    body = packet["body"]
+    if isinstance(body, EncodedBatch):
+        if body.binary != binary:
+            raise ValueError("The batch was encoded for another framing")
+        if not binary:
+            return (f'{{"to":{json.dumps(packet.get("to"))},"body":{{"jsonrpc":"{PROTOCOL_VERSION}","calls":['
+                    f'{body.calls.decode()}]}}}}')
+        header = [BATCH_PREFIX, body.calls, BATCH_SUFFIX]
+        segments = list(body.segments)
+    else:
+        segments = []
+        default = partial(_encode_value, segments, binary)
+        if not binary:
+            return json.dumps(packet, default=default)
+        header = [json.dumps(body, default=default).encode()]
+    header_length = sum(len(part) for part in header)
+
+    parts = [encode_envelope(packet.get("to"), packet.get("from"))]
+    lengths = []
+    for i, segment in enumerate(segments):
+        if compress_threshold is not None and len(segment) >= compress_threshold:
+            deflated = zlib.compress(segment, SEGMENT_COMPRESSION_LEVEL)
+            if len(deflated) < len(segment):
+                segments[i] = segment = deflated
+                lengths.append(len(segment) | SEGMENT_DEFLATED)
+                continue
+        lengths.append(len(segment))
+    prefix = struct.pack(f"<II{len(segments)}I", header_length, len(segments), *lengths)
+    parts += [prefix, *header, bytes(_padding(len(prefix) + header_length))]
+    for segment in segments:
+        parts.append(segment)
+        parts.append(bytes(_padding(len(segment))))
+    return b"".join(parts)
+
+
+def _encode_value(segments, binary, value):
+    # The JSON default for assets and typed arrays, which go to
+    # segments with binary framing.
+    if isinstance(value, Asset):
+        if value.cached:
+            return {"__jsonclass__": ["__asset__", value.digest]}
+        return dict(_encode_value(segments, binary, value.array), asset=value.digest)
+    if isinstance(value, TypedArray):
+        if not binary:
+            return {"__jsonclass__": [value.constructor, value.tolist()]}
+        segments.append(value.data)
+        return {"__jsonclass__": [value.constructor, {"segment": len(segments) - 1}]}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+BATCH_PREFIX = f'{{"jsonrpc":"{PROTOCOL_VERSION}","calls":['.encode()
+BATCH_SUFFIX = b"]}"
+
+
+class EncodedBatch:
+    # A batch ready for encode_packet(): the JSON of its calls, without
+    # the brackets, and the segments they refer to. methods counts the
+    # calls per method when the encoder was asked to.
+    __slots__ = ("binary", "calls", "segments", "count", "methods")
+
+    def __init__(self, binary, calls, segments, count, methods=None):
+        self.binary = binary
+        self.calls = calls
+        self.segments = segments
+        self.count = count
+        self.methods = methods
+
+
+class BatchEncoder:
+    # Encodes calls into a batch as they come, so that a large batch
+    # is held as its JSON and typed arrays rather than as call objects,
+    # and sending it doesn't encode it all at once.
+    def __init__(self, binary=True, count_methods=False):
+        self.binary = binary
+        self.count_methods = count_methods
+        self._start()
+
+    def _start(self):
+        self.calls = bytearray()
+        self.segments = []
+        self.segment_bytes = 0
+        self.count = 0
+        self.methods = Counter() if self.count_methods else None
+
+    @property
+    def size(self):
+        # Bytes of the batch so far, without the framing.
+        return len(self.calls) + self.segment_bytes
+
+    def encode(self, calls):
+        first_segment = len(self.segments)
+        text = json.dumps(calls, default=partial(_encode_value, self.segments, self.binary),
+                          separators=(",", ":"))
+        if self.calls:
+            self.calls += b","
+        self.calls += text[1:-1].encode()
+        self.count += len(calls)
+        for segment in self.segments[first_segment:]:
+            self.segment_bytes += len(segment)
+        if self.methods is not None:
+            for call in calls:
+                self.methods[call["method"] if isinstance(call, dict) else call[0]] += 1
+
+    def take(self):
+        batch = EncodedBatch(self.binary, self.calls, self.segments, self.count, self.methods)
+        self._start()
+        return batch
+
+
+def encode_envelope(to_addr, from_addr):
+    to_addr = (to_addr or "").encode()
+    from_addr = (from_addr or "").encode()
+    envelope = struct.pack("<HH", len(to_addr), len(from_addr)) + to_addr + from_addr
+    return envelope + bytes(_padding(len(envelope)))
+
+
+def decode_envelope(frame):
+    to_length, from_length = struct.unpack_from("<HH", frame)
+    to_addr = bytes(frame[4:4 + to_length]).decode()
+    from_addr = bytes(frame[4 + to_length:4 + to_length + from_length]).decode()
+    offset = 4 + to_length + from_length
+    return to_addr or None, from_addr or None, offset + _padding(offset)
+
+
+def decode_packet(frame):
+    if isinstance(frame, str):
+        return json.loads(frame, object_hook=partial(_decode_typed_array, []))
+
+    frame = memoryview(frame)
+    to_addr, from_addr, offset = decode_envelope(frame)
+    header_length, segment_count = struct.unpack_from("<II", frame, offset)
+    lengths = struct.unpack_from(f"<{segment_count}I", frame, offset + 8)
+    offset += 8 + 4 * segment_count
+    header = bytes(frame[offset:offset + header_length])
+    offset += header_length
+    offset += _padding(offset)
+    segments = []
+    for length in lengths:
+        deflated = length & SEGMENT_DEFLATED
+        length &= ~SEGMENT_DEFLATED
+        segment = frame[offset:offset + length]
+        segments.append(memoryview(zlib.decompress(segment)) if deflated else segment)
+        offset += length + _padding(length)
+    return {
+        "to": to_addr,
+        "from": from_addr,
+        "body": json.loads(header, object_hook=partial(_decode_typed_array, segments)),
+    }
+
+
+def batch_calls(body):
+    # A batch is {"jsonrpc": ..., "calls": [...]}, where a call is
+    # either [method, *params] for a notification or a request object
+    # without the "jsonrpc" member. Methods are names or indices in
+    # the method table of the proxy.
+    if isinstance(body, dict) and "calls" in body:
+        return body["calls"]
+    return body if isinstance(body, list) else [body]
+
+
+def _log_calls(prefix, body):
+    # Only formats the calls when they are logged.
+    if logger.isEnabledFor(logging.INFO):
+        if isinstance(body, EncodedBatch):
+            logger.info("%s %s", prefix, body.calls.decode())
+            return
+        for data in batch_calls(body):
+            logger.info("%s %s", prefix, data)
+
+
+def _decode_typed_array(segments, value):
+    jsonclass = value.get("__jsonclass__")
+    if jsonclass is None or jsonclass[0] not in TYPED_ARRAYS:
+        return value
+    data = jsonclass[1]
+    if isinstance(data, dict):
+        data = segments[data["segment"]]
+    array = TypedArray(jsonclass[0], data)
+    if "asset" in value:
+        # The digest the client tagged the array with, for Server.
+        array.asset = value["asset"]
+    return array
+
+
 class TransportWebsocket:
-    def __init__(self, uri: str) -> None:
+    # compression chooses the permessage-deflate offer ("deflate" or
+    # None). compress_threshold enables zlib on typed arrays of at least
+    # that many bytes, which works through the relay either way.
+    def __init__(self, uri: str, binary: bool = True, compression="deflate", compress_threshold=None) -> None:
         self.uri = uri
+        self.binary = binary
+        self.compression = compression
+        self.compress_threshold = compress_threshold
         self.ws = None
         self.server = None
 
     def __enter__(self):
-        self.ws = connect(self.uri).__enter__()
+        self.ws = connect(self.uri, compression=self.compression).__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -42,100 +452,504 @@ class TransportWebsocket:
         })
 
     def run(self, server):
+        # Listens on the name of the server and passes it the packets
+        # until the connection closes. Between packets, the server
+        # presents the frames that are due.
         self.server = server
-        with connect(self.uri) as self.ws:
+        with connect(self.uri, compression=self.compression) as self.ws:
             self.listen(server.name)
             while True:
-                self.wait_until(None)
+                timeout = server.animation_frame_timeout()
+                if timeout == 0:
+                    server.present_frames()
+                    continue
+                try:
+                    frame = self.ws.recv(timeout)
+                except TimeoutError:
+                    continue
+                except ConnectionClosed:
+                    return
+                packet = decode_packet(frame)
+                _log_calls("<--", packet["body"])
+                server.onReceive(packet["from"], packet["body"])
 
     def recv(self):
         packet = self.ws.recv()
-        packet = json.loads(packet)
+        packet = decode_packet(packet)
         body = packet["body"]
-        if isinstance(body, list):
-            for data in body:
-                logger.info('<-- %s', data)
-        else:
-            logger.info('<-- %s', body)
+        _log_calls("<--", body)
         return body
 
     def send(self, to_addr, body):
-        if isinstance(body, list):
-            for msg in body:
-                logger.info("--> %s", msg)
-        else:
-            logger.info("--> %s", body)
-        self.ws.send(json.dumps({
+        # Returns the size of the frame.
+        _log_calls("-->", body)
+        frame = encode_packet({
+            "to": to_addr,
+            "body": body
+        }, self.binary, self.compress_threshold)
+        self.ws.send(frame)
+        return len(frame)
+
+
+class AsyncTransportWebsocket:
+    # Frames are written by a writer task and read by a reader task.
+    # Packets from an address with a registered receiver, such as an
+    # AsyncServerProxy, go to its onReceive() and the others to recv(),
+    # so that many sessions can share one connection.
+    def __init__(self, uri: str, binary: bool = True, compression="deflate", compress_threshold=None) -> None:
+        self.uri = uri
+        self.binary = binary
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.ws = None
+        self.queue = None
+        self.writer = None
+        self.reader = None
+        self.receivers = {}
+        self.inbox = None
+        # Why the connection closed, once the reader has ended.
+        self.error = None
+
+    async def __aenter__(self):
+        self.ws = await async_connect(self.uri, compression=self.compression)
+        self.queue = asyncio.Queue()
+        self.inbox = asyncio.Queue()
+        self.writer = asyncio.create_task(self._write())
+        self.reader = asyncio.create_task(self._read())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.queue.join()
+        self.writer.cancel()
+        self.reader.cancel()
+        await self.ws.close()
+
+    def register(self, from_addr, receiver):
+        if from_addr in self.receivers:
+            raise ProxyException(f"Already connected to {from_addr}")
+        self.receivers[from_addr] = receiver
+
+    def unregister(self, from_addr):
+        self.receivers.pop(from_addr, None)
+
+    def connect(self, to_addr):
+        self.send(None, {
+            "jsonrpc": PROTOCOL_VERSION,
+            "method": "__connect__",
+            "params": [to_addr]
+        })
+
+    def listen(self, from_addr):
+        self.send(None, {
+            "jsonrpc": PROTOCOL_VERSION,
+            "method": "__listen__",
+            "params": [from_addr]
+        })
+
+    async def recv(self):
+        body = await self.inbox.get()
+        if isinstance(body, Exception):
+            self.inbox.put_nowait(body)
+            raise body
+        return body
+
+    def send(self, to_addr, body):
+        # Frames are encoded right away and written in order by the
+        # writer task, so that senders never wait for the socket.
+        if self.error is not None:
+            raise self.error
+        _log_calls("-->", body)
+        frame = encode_packet({
             "to": to_addr,
             "body": body
-        }))
+        }, self.binary, self.compress_threshold)
+        self.queue.put_nowait(frame)
+        return len(frame)
+
+    async def _read(self):
+        error = ProxyException("Connection closed")
+        try:
+            async for frame in self.ws:
+                packet = decode_packet(frame)
+                body = packet["body"]
+                _log_calls("<--", body)
+                receiver = self.receivers.get(packet["from"])
+                if receiver is None:
+                    self.inbox.put_nowait(body)
+                    continue
+                for data in batch_calls(body):
+                    receiver.onReceive(data)
+        except Exception as e:
+            error = e
+        finally:
+            self.error = error
+            self.inbox.put_nowait(error)
+            for receiver in list(self.receivers.values()):
+                receiver.onClose(error)
+
+    async def _write(self):
+        while True:
+            frame = await self.queue.get()
+            try:
+                await self.ws.send(frame)
+            except ConnectionClosed:
+                # The reader reports the closed connection, and send()
+                # raises from then on. Frames queued before are dropped.
+                pass
+            finally:
+                self.queue.task_done()
+
+
+# Methods that free the GPU resource of a released object.
+DELETE_METHODS = {
+    "WebGLBuffer": "deleteBuffer",
+    "WebGLFramebuffer": "deleteFramebuffer",
+    "WebGLProgram": "deleteProgram",
+    "WebGLQuery": "deleteQuery",
+    "WebGLRenderbuffer": "deleteRenderbuffer",
+    "WebGLSampler": "deleteSampler",
+    "WebGLShader": "deleteShader",
+    "WebGLSync": "deleteSync",
+    "WebGLTexture": "deleteTexture",
+    "WebGLTransformFeedback": "deleteTransformFeedback",
+    "WebGLVertexArrayObject": "deleteVertexArray",
+}
+
+
+def _is_remote_object(value):
+    # Plain values, lists and dicts are sent by value, other objects by
+    # reference.
+    return value is not None and type(value) not in (int, float, str, bool, list, tuple, dict)
+
+
+def _is_object_reference(value):
+    # A marshalled ObjectProxy, as opposed to placeholders and assets.
+    return (isinstance(value, dict) and "__jsonclass__" in value
+            and value["__jsonclass__"][0] not in ("__placeholder__", "__asset__"))
 
 
 class Server:
-    def __init__(self, name, transport):
+    # The Server of main.js, for running the objects of a Python root
+    # object instead of a browser page, such as the mock WebGL context
+    # of mockgl.py. It speaks the same protocol: batches of compact
+    # calls and requests, method tables, command lists, frames, assets
+    # and releases. Frames are presented every frame_interval seconds,
+    # or right after the message that ended them when it is None.
+    def __init__(self, name, transport, methods=(), frame_interval=1 / 60):
         self.name = name
         self.transport = transport
-        self.nextobject_id = 0
+        self.next_object_id = 0
         self.liveObjects = {}
-        self.global_ = None
+        self.released_object_count = 0
+        self.owners = weakref.WeakKeyDictionary()
+        self.delete_on_release = False
+        self.command_lists = {}
+        self.current_from = None
+        # Latest frame received from each client and not presented yet.
+        self.pending_frames = {}
+        self.frame_interval = frame_interval
+        self.next_animation_frame = 0.0
+        self.root_object = None
+        self.methods = {}
+        self.method_table = list(methods)
+        # Typed arrays tagged with a digest by the clients, in least
+        # recently used order.
+        self.assets = OrderedDict()
+        self.asset_bytes = 0
+        self.max_asset_bytes = MAX_ASSET_BYTES
+
+    def register_default_methods(self):
+        self.register_method("__root__", lambda: self.root_object)
+        self.register_method("__getter__", lambda target, name: getattr(target, name))
+        self.register_method("__release__", self._release_objects)
+        self.register_method("__record__", self._record)
+        self.register_method("__replay__", lambda name, *args: self.replay(self.command_lists.get(name), args))
+        self.register_method("__frame__", lambda frame_id: self.queue_frame(self.current_from, frame_id))
+        self.register_method("__has_assets__", lambda digests: [self.get_asset(d) is not None for d in digests])
+        self.register_method("__stats__", lambda: {
+            "liveObjects": self.live_object_count,
+            "releasedObjects": self.released_object_count,
+            "assets": len(self.assets),
+            "assetBytes": self.asset_bytes,
+        })
+
+    def register_method(self, name, method):
+        self.methods[name] = method
+
+    def register_root_object(self, obj):
+        self.root_object = obj
 
-    def serve(self, app):
-        self.global_ = app
+    def serve(self):
         self.transport.run(self)
 
-    def onReceive(self, data):
-        params = self.unmarshalParams(data["params"])
-        target = params.pop(0)
-        if target is None:
-            target = self.global_
-
-        if data["method"] == "__getter__":
-            name = params[1]
-            result = getattr(target, name)
-        else:
-            method = getattr(target, data["method"])
-            result = method(*params)
+    @property
+    def live_object_count(self):
+        return len(self.liveObjects)
+
+    def onReceive(self, from_addr, body):
+        self.current_from = from_addr
+        for data in batch_calls(body):
+            if isinstance(data, list):
+                try:
+                    self.invoke(data[0], self.unmarshalParams(data[1:]))
+                except Exception:
+                    logger.exception("Procedure %s failed", data[0])
+                continue
+            try:
+                params = self.unmarshalParams(data["params"])
+                result = self.invoke(data["method"], params)
+                if "objectId" in data and ("id" not in data or (
+                        _is_remote_object(result) and getattr(result, "_object_id", None) is None)):
+                    # The client chose the id of the new object, so that
+                    # every server in a group uses the same one.
+                    self.store_object(data["objectId"], result)
+                if "id" in data:
+                    self.transport.send(from_addr, {
+                        "jsonrpc": PROTOCOL_VERSION,
+                        "id": data["id"],
+                        "result": self.marshalResult(result),
+                    })
+            except Exception as e:
+                logger.exception("Request %s failed", data.get("method"))
+                if "id" in data:
+                    self.transport.send(from_addr, {
+                        "jsonrpc": PROTOCOL_VERSION,
+                        "id": data["id"],
+                        "error": {"code": ERROR_INTERNAL, "message": str(e)},
+                    })
+
+    def invoke(self, method, params):
+        if isinstance(method, int):
+            method = self.method_table[method]
+        elif method in self.methods:
+            return self.methods[method](*params)
+        target = params[0]
+        result = getattr(target, method)(*params[1:])
+        if _is_remote_object(result):
+            try:
+                self.owners[result] = target
+            except TypeError:
+                # Not weakly referenceable.
+                pass
+        return result
+
+    # Frames are acknowledged once the calls before them are presented.
+    # When several frames arrive within one animation frame, only the
+    # latest is acknowledged.
+    def queue_frame(self, from_addr, frame_id):
+        if not self.pending_frames and self.frame_interval:
+            now = time.monotonic()
+            self.next_animation_frame = now + self.frame_interval - now % self.frame_interval
+        self.pending_frames[from_addr] = frame_id
+
+    def animation_frame_timeout(self):
+        # Seconds until present_frames() is due, or None when no frame
+        # is waiting.
+        if not self.pending_frames:
+            return None
+        if not self.frame_interval:
+            return 0.0
+        return max(0.0, self.next_animation_frame - time.monotonic())
+
+    def present_frames(self):
+        for from_addr, frame_id in self.pending_frames.items():
+            self.transport.send(from_addr, {
+                "jsonrpc": PROTOCOL_VERSION,
+                "method": "__presented__",
+                "params": [frame_id],
+            })
+        self.pending_frames.clear()
 
-        self.transport.send(
-            data["source"],
-            {
-                "id": data["id"],
-                "result": self.marshalResult(result)
-            }
-        )
+    def _record(self, name, commands):
+        self.command_lists[name] = [self._compile_command(data) for data in commands]
+
+    def _compile_command(self, data):
+        # Parameters of a recorded command are resolved once. Only the
+        # placeholders are filled in by each replay, and the objects
+        # looked up, as they may be created by the list itself.
+        if isinstance(data, list):
+            data = {"method": data[0], "params": data[1:]}
+        params = []
+        refs = []
+        for i, value in enumerate(data["params"]):
+            if _is_object_reference(value):
+                refs.append((i, value["__jsonclass__"][1]))
+                value = None
+            params.append(self.unmarshalValue(value))
+        slots = [(i, value.index) for i, value in enumerate(params) if isinstance(value, Placeholder)]
+        return data["method"], params, slots, refs, data.get("objectId")
+
+    def replay(self, commands, args):
+        if commands is None:
+            raise ProxyException("Unknown command list")
+        liveObjects = self.liveObjects
+        for method, params, slots, refs, object_id in commands:
+            params = list(params)
+            for i, index in slots:
+                params[i] = args[index]
+            for i, ref in refs:
+                params[i] = liveObjects[ref]
+            result = self.invoke(method, params)
+            if object_id is not None:
+                previous = liveObjects.get(object_id)
+                if previous is not None and previous is not result:
+                    # Created by the previous replay, and only used by it.
+                    self.release_object(object_id)
+                self.store_object(object_id, result)
 
     def unmarshalParams(self, params):
-        def f(value):
-            if isinstance(value, dict):
-                return self.liveObjects[value.id]
-            else:
-                return value
-        return [f(value) for value in params]
+        return [self.unmarshalValue(value) for value in params]
 
-    def marshalResult(self, result):
-        if result is None or type(result) in (int, float, str, bool):
-            return result
+    def unmarshalValue(self, value):
+        if isinstance(value, TypedArray):
+            digest = getattr(value, "asset", None)
+            if digest is not None:
+                # The segment is a view of the whole message.
+                self.put_asset(digest, TypedArray(value.constructor, bytes(value.data)))
+            return value
+        if not isinstance(value, dict) or "__jsonclass__" not in value:
+            return value
+        constructor, object_id = value["__jsonclass__"]
+        if constructor == "__placeholder__":
+            return Placeholder(object_id)
+        if constructor == "__asset__":
+            asset = self.get_asset(object_id)
+            if asset is None:
+                raise ProxyException(f"Unknown asset {object_id}")
+            return asset
+        return self.liveObjects[object_id]
 
-        if not hasattr(result, "_object_id"):
-            object_id = self.nextobject_id
-            self.nextobject_id += 1
-            self.liveObjects[object_id] = result
-            result._object_id = object_id
+    def get_asset(self, digest):
+        asset = self.assets.get(digest)
+        if asset is not None:
+            self.assets.move_to_end(digest)
+        return asset
 
-        return {
-            "id": result._object_id,
-            "class": "object",
-        }
+    def put_asset(self, digest, array):
+        if digest in self.assets:
+            self.assets.move_to_end(digest)
+            return
+        self.assets[digest] = array
+        self.asset_bytes += len(array.data)
+        while self.asset_bytes > self.max_asset_bytes and len(self.assets) > 1:
+            _, oldest = self.assets.popitem(last=False)
+            self.asset_bytes -= len(oldest.data)
+
+    def marshalResult(self, value):
+        if not _is_remote_object(value):
+            return value
+        if getattr(value, "_object_id", None) is None:
+            self.store_object(self.next_object_id, value)
+            self.next_object_id += 1
+        return {"__jsonclass__": [type(value).__name__, value._object_id]}
+
+    def store_object(self, object_id, value):
+        self.liveObjects[object_id] = value
+        if _is_remote_object(value):
+            value._object_id = object_id
+
+    def _release_objects(self, *object_ids):
+        for object_id in object_ids:
+            self.release_object(object_id)
+
+    def release_object(self, object_id):
+        if object_id not in self.liveObjects:
+            return
+        value = self.liveObjects.pop(object_id)
+        self.released_object_count += 1
+        if getattr(value, "_object_id", None) != object_id:
+            return
+        # The object gets a new id if it is ever returned again.
+        del value._object_id
+        if self.delete_on_release:
+            owner = self.owners.get(value)
+            method = DELETE_METHODS.get(type(value).__name__)
+            if owner is not None and method is not None:
+                getattr(owner, method)(value)
+
+
+class ProxyHooks:
+    # Instrumentation of a ServerProxy, passed as its hooks. The proxy
+    # only calls them when it has hooks, and per message rather than per
+    # call, so that it costs next to nothing otherwise.
+    # metrics.ProxyMetrics turns them into counters and histograms.
+    def on_flush(self, proxy, batch, size):
+        # The EncodedBatch was sent in a message of size bytes. Its
+        # methods count its calls per method.
+        pass
+
+    def on_reply(self, proxy, method, seconds):
+        # The reply to a request came seconds after it was sent.
+        pass
+
+    def on_frame(self, proxy, frame_id, seconds):
+        # The server presented a frame seconds after end_frame().
+        pass
 
 
 class ServerProxy:
-    def __init__(self, to_addr, transport):
+    def __init__(self, to_addr, transport, allocate_ids=False, methods=(), max_frames_in_flight=1,
+                 asset_cache=False, arguments=None, hooks=None, max_batch_calls=MAX_BATCH_CALLS,
+                 max_batch_bytes=MAX_BATCH_BYTES, max_batch_age=None):
         self.to_addr = to_addr
         self.transport = transport
+        self.allocate_ids = allocate_ids
+        # Methods found in the table are sent as their index. The
+        # server must know the same table, such as webgl.METHODS.
+        self.opcodes = {method: i for i, method in enumerate(methods)}
+        # With the arguments of webgl.py, sequences and typed arrays
+        # passed for IDL lists are sent as the typed array they need.
+        self.list_arguments = list_arguments(arguments or {})
         self.next_request_id = 0
+        # Object ids allocated by the proxy are negative so that they
+        # never collide with the ones allocated by the server.
+        self.next_object_id = -1
         self.pendingRequests = {}
         self.constructors = {}
+        # Calls not encoded into the batch yet.
         self.buffers = []
+        self.encoder = BatchEncoder(transport.binary, hooks is not None)
+        # One proxy per remote object, so that the server is told to
+        # release it when the last reference on this side goes away.
+        self.proxies = weakref.WeakValueDictionary()
+        self.releases = []
+        self.released_object_count = 0
+        self.recording = None
+        self.replay_count = 0
+        # The proxies of the objects each command list uses or creates,
+        # which must live as long as the list.
+        self.command_list_objects = {}
+        # Frames sent by end_frame() that the server hasn't presented
+        # yet, with the time they were sent.
+        self.max_frames_in_flight = max_frames_in_flight
+        self.next_frame_id = 0
+        self.frames_in_flight = {}
+        self.presented_frames = deque(maxlen=FRAME_WINDOW)
+        self.dropped_frames = 0
+        # Whether the server holds the assets with these digests, as
+        # checked or sent in this batch, and the assets of the pending
+        # calls. The server may evict assets between batches, so this
+        # is forgotten when the batch is sent.
+        self.asset_cache = asset_cache
+        self.assets = {}
+        self.pending_assets = []
+        self.hooks = hooks
+        # Method and send time of the requests in flight, with hooks.
+        self.request_times = {}
+        # The batch is sent once it has max_batch_calls calls or
+        # max_batch_bytes bytes, or its first call is max_batch_age
+        # seconds old. None turns a limit off.
+        self.max_batch_calls = max_batch_calls or sys.maxsize
+        self.max_batch_bytes = max_batch_bytes or sys.maxsize
+        self.max_batch_age = max_batch_age
+        # Encoded bytes of the batch and typed array bytes of buffers.
+        self.batch_bytes = 0
+        self.batch_start = None
+        self.in_frame = False
+        # Length of buffers at which they are encoded and the limits
+        # are checked next.
+        self.next_check = self._next_check()
         self.transport.connect(to_addr)
 
     def register_constructor(self, name: str, func) -> None:
@@ -150,101 +964,565 @@ class ServerProxy:
     def invoke_procedure(self, method, *params):
         self._invoke(True, method, *params)
 
+    def invoke_constructor(self, method, constructor, *params):
+        if not self.allocate_ids:
+            return self.invoke_function(method, *params)
+
+        # The server stores the result under the id we chose, so the
+        # call doesn't need to wait for a reply.
+        object_id = self._allocate_object_id()
+        marshalled = self.marshalParams(params)
+        self.buffers.append({
+            "method": self.opcodes.get(method, method),
+            "params": marshalled,
+            "objectId": object_id,
+        })
+        self._count_bytes(marshalled)
+        if len(self.buffers) >= self.next_check or self.batch_bytes >= self.max_batch_bytes:
+            self._check_batch()
+        obj = self._track(self.constructors[constructor](self, constructor, object_id))
+        if self.recording is not None:
+            self.recording[2].append(obj)
+        return obj
+
+    def begin_record(self, name):
+        # Procedures invoked until end_record() are stored in the
+        # server as a command list instead of being run.
+        if self.recording is not None:
+            raise ProxyException("Already recording")
+        self._encode_calls()
+        self.recording = (name, self.buffers, [])
+        self.buffers = []
+        # The command list is sent whole by end_record().
+        self.next_check = sys.maxsize
+
+    def end_record(self):
+        if self.recording is None:
+            raise ProxyException("Not recording")
+        (name, buffers, created), self.recording = self.recording, None
+        commands, self.buffers = self.buffers, buffers
+        self.next_check = 0
+        # The typed arrays of the list count toward max_batch_bytes as
+        # arguments of __record__, on top of the batch before it.
+        self.batch_bytes = self.encoder.size
+        for data in commands:
+            self._count_bytes(data["params"] if isinstance(data, dict) else data[1:])
+        # Objects whose proxies were collected while recording are kept
+        # too, before their release is sent ahead of the list.
+        self.command_list_objects[name] = created + self._command_objects(commands)
+        self.invoke_procedure("__record__", name, commands)
+
+    def _command_objects(self, commands):
+        objects = []
+        for data in commands:
+            for value in data["params"] if isinstance(data, dict) else data[1:]:
+                if _is_object_reference(value):
+                    objects.append(self._revive(*value["__jsonclass__"]))
+        return objects
+
+    def replay(self, name, *params):
+        self.invoke_procedure("__replay__", name, *params)
+        self.replay_count += 1
+
+    @property
+    def live_object_count(self):
+        return len(self.proxies)
+
+    # A render loop calls begin_frame() before drawing and end_frame()
+    # after. The server acknowledges each frame once it has been
+    # presented, and begin_frame() waits while max_frames_in_flight
+    # frames are not acknowledged yet.
+    def begin_frame(self):
+        while len(self.frames_in_flight) >= self.max_frames_in_flight:
+            body = self.transport.recv()
+            for data in batch_calls(body):
+                if "method" in data:
+                    self.onNotification(data)
+        self._enter_frame()
+
+    def _enter_frame(self):
+        # The calls of a frame are sent together by end_frame(), so
+        # that the browser doesn't present half of it. Only
+        # max_batch_bytes still applies, and splits a larger frame.
+        self.in_frame = True
+        self.next_check = self._next_check()
+
+    def end_frame(self):
+        if self.recording is not None:
+            raise ProxyException("Frames can't be recorded")
+        frame_id = self.next_frame_id
+        self.next_frame_id += 1
+        self.in_frame = False
+        self.invoke_procedure("__frame__", frame_id)
+        self.frames_in_flight[frame_id] = time.monotonic()
+        self.flush()
+
+    @property
+    def fps(self):
+        if len(self.presented_frames) < 2:
+            return 0.0
+        elapsed = self.presented_frames[-1][0] - self.presented_frames[0][0]
+        return (len(self.presented_frames) - 1) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def frame_latency(self):
+        # Average time from end_frame() to the acknowledgement.
+        if not self.presented_frames:
+            return 0.0
+        return sum(latency for _, latency in self.presented_frames) / len(self.presented_frames)
+
+    def onNotification(self, data):
+        if data["method"] == "__presented__":
+            self._frame_presented(data["params"][0])
+        elif data["method"] == "__unknown_address__":
+            # From the relay, when nobody listens to to_addr. The calls
+            # sent are lost, and their frames never presented.
+            self.frames_in_flight.clear()
+            self._fail(ProxyException(f"Nobody listens to {data['params'][0]}"))
+
+    def _fail(self, error):
+        raise error
+
+    def _frame_presented(self, frame_id):
+        # Frames sent before the presented one were replaced before
+        # the browser got to show them.
+        now = time.monotonic()
+        for sent_frame_id in [i for i in self.frames_in_flight if i <= frame_id]:
+            sent = self.frames_in_flight.pop(sent_frame_id)
+            if sent_frame_id == frame_id:
+                self.presented_frames.append((now, now - sent))
+                if self.hooks is not None:
+                    self.hooks.on_frame(self, frame_id, now - sent)
+            else:
+                self.dropped_frames += 1
+
     def flush(self):
-        if not self.buffers:
+        # While recording, the buffer holds the command list.
+        if self.recording is not None:
+            return
+        if not self.buffers and not self.releases and not self.encoder.count:
             return
 
-        body = self.buffers[0] if len(self.buffers) == 1 else self.buffers[:]
-        self.buffers.clear()
+        self._send(self._take_batch())
 
-        self.transport.send(self.to_addr, body)
+    def _send(self, batch):
+        size = self.transport.send(self.to_addr, batch)
+        if self.hooks is not None:
+            self.hooks.on_flush(self, batch, size)
 
-    def _invoke(self, no_wait, method, *params):
-        data = {
-            "jsonrpc": PROTOCOL_VERSION,
-            "method": method,
-            "params": self.marshalParams(params),
-        }
-        self.buffers.append(data)
-        if no_wait:
+    def _take_batch(self):
+        self._encode_calls()
+        batch = self.encoder.take()
+        self._reset_batch()
+        return batch
+
+    def _encode_calls(self):
+        if self.pending_assets:
+            self._resolve_assets()
+        calls, self.buffers = self.buffers, []
+        if self.releases:
+            # Each release goes after the calls made before the object
+            # was collected, which may still use it, and before the ones
+            # made after, such as a request that returns it again.
+            releases, self.releases = self.releases, []
+            positions = {}
+            for position, object_id in releases:
+                positions.setdefault(min(position, len(calls)), []).append(object_id)
+            for position in sorted(positions, reverse=True):
+                calls.insert(position, ["__release__", *positions[position]])
+        if calls:
+            self.encoder.encode(calls)
+        self.batch_bytes = self.encoder.size
+
+    def _reset_batch(self):
+        self.assets.clear()
+        self.batch_bytes = 0
+        self.batch_start = None
+        self.next_check = self._next_check()
+
+    def _next_check(self):
+        calls = ENCODE_CALLS
+        if not self.in_frame:
+            calls = min(calls, self.max_batch_calls - self.encoder.count)
+            if self.max_batch_age is not None:
+                calls = min(calls, 1 if self.batch_start is None else BATCH_CHECK_CALLS)
+        return max(calls, 1)
+
+    def _count_bytes(self, args):
+        for value in args:
+            if isinstance(value, TypedArray):
+                self.batch_bytes += len(value.data)
+            elif isinstance(value, Asset):
+                self.batch_bytes += len(value.array.data)
+
+    def _check_batch(self):
+        # Called when buffers reach next_check calls or the batch
+        # max_batch_bytes bytes. It encodes the calls, and sends the
+        # batch when it is over a limit or else sets when to check
+        # again.
+        if self.recording is not None:
+            return
+        self._encode_calls()
+        if self.batch_bytes >= self.max_batch_bytes:
+            self.flush()
             return
-        print(method)
+        if not self.in_frame:
+            if self.encoder.count >= self.max_batch_calls:
+                self.flush()
+                return
+            if self.max_batch_age is not None:
+                if self.batch_start is None:
+                    self._start_batch()
+                elif time.monotonic() - self.batch_start >= self.max_batch_age:
+                    self.flush()
+                    return
+        self.next_check = self._next_check()
 
+    def _start_batch(self):
+        self.batch_start = time.monotonic()
+
+    def _resolve_assets(self):
+        # Assets the server holds are sent as references, the others
+        # with their data, once per batch. The server keeps what one
+        # batch uses as long as max_batch_bytes is below its
+        # max_asset_bytes.
+        pending, self.pending_assets = self.pending_assets, []
+        unknown = list({asset.digest for asset in pending if asset.digest not in self.assets})
+        if unknown:
+            for digest, cached in zip(unknown, self._query_assets(unknown)):
+                self.assets[digest] = cached
+        for asset in pending:
+            asset.cached = self.assets.get(asset.digest, False)
+            self.assets[asset.digest] = True
+
+    def _query_assets(self, digests):
+        # Sent ahead of the batch, which is still being assembled. The
+        # members of a group have run the same batches and evicted the
+        # same assets, so the first answer holds for all of them.
         request_id = self.next_request_id
         self.next_request_id += 1
-        data["id"] = request_id
+        encoder = BatchEncoder(self.encoder.binary, self.hooks is not None)
+        encoder.encode([{"id": request_id, "method": "__has_assets__", "params": [digests]}])
+        start = time.perf_counter()
+        self._send(encoder.take())
+        result = self._wait_reply(request_id)
+        if self.hooks is not None:
+            self.hooks.on_reply(self, "__has_assets__", time.perf_counter() - start)
+        return result
+
+    def _track(self, obj):
+        self.proxies[obj.object_id] = obj
+        weakref.finalize(obj, self._release, obj.object_id)
+        return obj
 
-        # Copy self.buffers
-        body = self.buffers[0] if len(self.buffers) == 1 else self.buffers[:]
-        self.buffers.clear()
+    def _release(self, object_id):
+        # Called by the garbage collector. The notification goes out
+        # with the next batch, at the current position.
+        buffers = self.buffers if self.recording is None else self.recording[1]
+        self.releases.append((len(buffers), object_id))
+        self.released_object_count += 1
+
+    def _invoke(self, no_wait, method, *params):
+        request_id = self._append_request(no_wait, method, params)
+        if no_wait:
+            return
 
-        self.transport.send(self.to_addr, body)
+        body = self._take_batch()
+        start = time.perf_counter()
+        self._send(body)
+        result = self._wait_reply(request_id)
+        if self.hooks is not None:
+            self.hooks.on_reply(self, method, time.perf_counter() - start)
+        return result
 
+    def _wait_reply(self, request_id):
         while True:
             body = self.transport.recv()
-            if not isinstance(body, list):
-                body = [body]
-            error_data = None
-            return_data = None
-            for data in body:
+            for data in batch_calls(body):
+                if "method" in data:
+                    self.onNotification(data)
+                    continue
+                # Replies to earlier requests may still come from the
+                # other members of a group.
+                if data.get("id") != request_id:
+                    continue
                 assert data["jsonrpc"] == PROTOCOL_VERSION
                 if "error" in data:
-                    error_data = data
-                if request_id is not None and data["id"] == request_id:
-                    return_data = data
-            if error_data is not None:
-                error = error_data["error"]
-                raise ProxyException(error["code"], error["message"])
-            if return_data is not None:
-                return self.unmarshalResult(return_data["result"])
+                    error = data["error"]
+                    raise ProxyException(error["code"], error["message"])
+                return self.unmarshalResult(data["result"])
+
+    def _append_request(self, no_wait, method, params):
+        if not no_wait and self.recording is not None:
+            raise ProxyException("Functions can't be recorded")
+        if method in self.list_arguments:
+            # After the target.
+            params = self._convert_lists(method, params, 1)
+        marshalled = self.marshalParams(params)
+        if self.asset_cache and is_asset_call(method, marshalled[1:]):
+            marshalled = [self._asset(value) for value in marshalled]
+        method = self.opcodes.get(method, method)
+        self._count_bytes(marshalled)
+        if no_wait:
+            self.buffers.append([method, *marshalled])
+            if len(self.buffers) >= self.next_check or self.batch_bytes >= self.max_batch_bytes:
+                self._check_batch()
+            return None
+
+        data = {
+            "method": method,
+            "params": marshalled,
+        }
+        self.buffers.append(data)
+        request_id = self.next_request_id
+        self.next_request_id += 1
+        data["id"] = request_id
+        if self.allocate_ids:
+            # An object returned by the call is stored under an id we
+            # chose, so that all the members of a group agree on it.
+            data["objectId"] = self._allocate_object_id()
+        return request_id
+
+    def append_procedure(self, method, target, args):
+        # invoke_procedure() on a remote object, for the generated proxy
+        # methods: target is already marshalled, and calls with plain
+        # arguments are appended as they are.
+        for value in args:
+            if type(value) not in PLAIN_TYPES:
+                if method in self.list_arguments:
+                    args = self._convert_lists(method, args, 0)
+                args = self.marshalParams(args)
+                if self.asset_cache and is_asset_call(method, args):
+                    args = [self._asset(value) for value in args]
+                self._count_bytes(args)
+                break
+        buffers = self.buffers
+        buffers.append((self.opcodes.get(method, method), target, *args))
+        if len(buffers) >= self.next_check or self.batch_bytes >= self.max_batch_bytes:
+            self._check_batch()
+
+    def _convert_lists(self, method, args, start):
+        args = list(args)
+        for i, constructor in self.list_arguments[method]:
+            if start + i < len(args):
+                args[start + i] = typed_list(args[start + i], constructor)
+        return args
+
+    def _asset(self, value):
+        if not isinstance(value, TypedArray) or len(value.data) < ASSET_MIN_BYTES:
+            return value
+        asset = Asset(value)
+        self.pending_assets.append(asset)
+        return asset
+
+    def _allocate_object_id(self):
+        object_id = self.next_object_id
+        self.next_object_id -= 1
+        return object_id
 
     def onReceive(self, data):
-        fut = self.pendingRequests[data["id"]]
-        del self.pendingRequests[data["id"]]
-        fut.set_result()
+        if "method" in data:
+            self.onNotification(data)
+            return
+        fut = self.pendingRequests.pop(data["id"], None)
+        if self.hooks is not None and data["id"] in self.request_times:
+            method, start = self.request_times.pop(data["id"])
+            self.hooks.on_reply(self, method, time.perf_counter() - start)
+        if fut is None or fut.done():
+            return
+        if "error" in data:
+            error = data["error"]
+            fut.set_exception(ProxyException(error["code"], error["message"]))
+            return
+        try:
+            result = self.unmarshalResult(data["result"])
+        except Exception as e:
+            fut.set_exception(e)
+        else:
+            fut.set_result(result)
 
     def unmarshalResult(self, result):
         if result is None or type(result) in (int, float, str, bool):
             return result
+        if isinstance(result, list):
+            return [self.unmarshalResult(value) for value in result]
         assert isinstance(result, dict)
         if "__jsonclass__" not in result:
             return result
         jsonclass = result['__jsonclass__']
         constructor = jsonclass[0]
         object_id = jsonclass[1]
-        print("Class:", constructor)
-        print("object_id:", object_id)
-        return self.constructors[constructor](self, constructor, object_id)
+        return self._revive(constructor, object_id)
+
+    def _revive(self, constructor, object_id):
+        # The proxy of an object the server still holds.
+        obj = self.proxies.get(object_id)
+        if obj is not None:
+            return obj
+        for release in self.releases:
+            if release[1] == object_id:
+                # The previous proxy was collected, but the server has
+                # not been told yet.
+                self.releases.remove(release)
+                self.released_object_count -= 1
+                break
+        return self._track(self.constructors[constructor](self, constructor, object_id))
 
     def marshalParams(self, params):
-        def f(value):
-            if isinstance(value, ObjectProxy):
-                return {"__jsonclass__": [value.constructor, value.object_id]}
-            return value
-        return [f(value) for value in params]
+        return [marshal_value(value) for value in params]
+
+
+def marshal_value(value):
+    if type(value) in PLAIN_TYPES:
+        return value
+    if isinstance(value, ObjectProxy):
+        return value._ref
+    if isinstance(value, Placeholder):
+        return {"__jsonclass__": ["__placeholder__", value.index]}
+    if type(value) in (list, tuple, dict):
+        return value
+    if isinstance(value, TypedArray):
+        return value
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return value
+    if view.ndim == 0:
+        # NumPy scalars
+        return view.tolist()
+    return typed_array_from_buffer(view)
+
+
+class AsyncServerProxy(ServerProxy):
+    # Functions return futures instead of blocking on the reply, so
+    # that many requests can be in flight at the same time:
+    #
+    #     locations = await asyncio.gather(
+    #         gl.getUniformLocation(program, "uProjectionMatrix"),
+    #         gl.getUniformLocation(program, "uModelViewMatrix"))
+    #
+    # The transport must be an AsyncTransportWebsocket. It passes the
+    # replies from to_addr to onReceive(), so that proxies for many
+    # addresses can share it. With max_batch_age, a timer sends the
+    # batch even when no more calls come. With allocate_ids, create*
+    # calls return the proxy of the new object instead of a future, as
+    # its id is known without a reply.
+    #
+    # asset_cache is ignored: the proxy can't wait for the page to tell
+    # which assets it has, so every asset would be sent with its data.
+    def __init__(self, to_addr, transport, allocate_ids=False, methods=(), max_frames_in_flight=1,
+                 asset_cache=False, arguments=None, hooks=None, max_batch_calls=MAX_BATCH_CALLS,
+                 max_batch_bytes=MAX_BATCH_BYTES, max_batch_age=None):
+        super().__init__(to_addr, transport, allocate_ids, methods, max_frames_in_flight, False,
+                         arguments, hooks, max_batch_calls, max_batch_bytes, max_batch_age)
+        self.frame_waiter = None
+        self.flush_timer = None
+        self.transport.register(to_addr, self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.flush()
+        self.transport.unregister(self.to_addr)
+        for fut in self.pendingRequests.values():
+            fut.cancel()
+        self.pendingRequests.clear()
+        self.request_times.clear()
+
+    def onClose(self, error):
+        self._fail(error)
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+
+    def _fail(self, error):
+        # Fails the requests and the frame waiting for a reply.
+        for fut in self.pendingRequests.values():
+            if not fut.done():
+                fut.set_exception(error)
+        self.pendingRequests.clear()
+        self.request_times.clear()
+        if self.frame_waiter is not None and not self.frame_waiter.done():
+            self.frame_waiter.set_exception(error)
+
+    async def begin_frame(self):
+        while len(self.frames_in_flight) >= self.max_frames_in_flight:
+            self.frame_waiter = asyncio.get_running_loop().create_future()
+            await self.frame_waiter
+        self._enter_frame()
+
+    def _start_batch(self):
+        super()._start_batch()
+        self.flush_timer = asyncio.get_running_loop().call_later(self.max_batch_age, self._flush_timeout)
+
+    def _flush_timeout(self):
+        self.flush_timer = None
+        # end_frame() sends the frame.
+        if not self.in_frame:
+            self.flush()
+
+    def _reset_batch(self):
+        super()._reset_batch()
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+
+    def _frame_presented(self, frame_id):
+        super()._frame_presented(frame_id)
+        if self.frame_waiter is not None and not self.frame_waiter.done():
+            self.frame_waiter.set_result(None)
+
+    def _invoke(self, no_wait, method, *params):
+        request_id = self._append_request(no_wait, method, params)
+        if no_wait:
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self.pendingRequests[request_id] = fut
+        if self.hooks is not None:
+            self.request_times[request_id] = (method, time.perf_counter())
+        try:
+            self.flush()
+        except Exception as e:
+            # Such as the connection having closed.
+            self.pendingRequests.pop(request_id, None)
+            self.request_times.pop(request_id, None)
+            fut.set_exception(e)
+        return fut
 
 
 class ObjectProxy:
+    # Subclasses that add attributes, like the ones combined with
+    # StateShadowingMixin, get a __dict__ by not declaring __slots__.
+    __slots__ = ("proxy", "constructor", "object_id", "_ref", "__weakref__")
+
     def __init__(self, proxy, constructor, object_id):
         self.proxy = proxy
         self.constructor = constructor
         self.object_id = object_id
+        # The marshalled reference, sent as the target of each call.
+        self._ref = None if object_id is None else {"__jsonclass__": [constructor, object_id]}
 
     def _invoke_function(self, name, *args):
-        args = list(args)
-        args.insert(0, None if self.object_id is None else self)
-        return self.proxy.invoke_function(name, *args)
+        return self.proxy.invoke_function(name, self._ref, *args)
 
     def _invoke_procedure(self, name, *args):
-        args = list(args)
-        args.insert(0, None if self.object_id is None else self)
-        self.proxy.invoke_procedure(name, *args)
+        self._append_procedure(name, args)
+
+    def _append_procedure(self, name, args):
+        self.proxy.append_procedure(name, self._ref, args)
+
+    def _invoke_constructor(self, name, constructor, *args):
+        return self.proxy.invoke_constructor(name, constructor, self._ref, *args)
 
     def _get_attribute(self, name):
         constructor = self.constructor
         while constructor:
             spec = self.proxy.constructors[constructor]
-            print(spec)
             if name in spec["properties"]:
                 return self.invoke("__getter__", name)
             if name in spec["methods"]:
@@ -255,4 +1533,4 @@ class ObjectProxy:
         pass
 
     def __str__(self):
-        return f"<ObjectProxy object; proxy={self.proxy.name}, constructor={self.constructor}, object_id={self.object_id}>"
+        return f"<ObjectProxy object; proxy={self.proxy.to_addr}, constructor={self.constructor}, object_id={self.object_id}>"
@@ -6,8 +6,13 @@ from typing import Any
 import math
 import time
 import logging
+from pathlib import Path
+import numpy as np
 from PIL import Image
-from rpc import TransportWebsocket, ObjectProxy, ServerProxy
+from rpc import TransportWebsocket, ObjectProxy, ServerProxy, TypedArray, Placeholder
+from glstate import StateShadowingMixin
+from glmatrix import mat4
+from textures import TextureStream
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,78 +20,16 @@ logger = logging.getLogger(__name__)
 
 # arrays
 
-def make_array(n, v):
-    return {
-        "__jsonclass__": [n, v]
-    }
-
-
 def Uint8Array(v):
-    return make_array("Uint8Array", v)
+    return TypedArray("Uint8Array", v)
 
 
 def Uint16Array(v):
-    return make_array("Uint16Array", v)
+    return TypedArray("Uint16Array", v)
 
 
 def Float32Array(v):
-    return make_array("Float32Array", v)
-
-
-# glmatrix.js stub
-
-class mat4:
-    @staticmethod
-    def create():
-        out = [0] * 16
-        out[0] = out[5] = out[10] = out[15] = 1
-        return out
-
-    @staticmethod
-    def perspective(out, fovy, aspect, near, far):
-        f = 1 / math.tan(fovy / 2)
-        out[:] = [0] * 16
-        out[0] = f / aspect
-        out[5] = f
-        out[10] = (near + far) / (near - far)
-        out[11] = -1
-        out[14] = 2 * far * near / (near - far)
-        return out
-
-    @staticmethod
-    def translate(out, a, v):
-        out[:] = a
-        out[12] += v[0]
-        out[13] += v[1]
-        out[14] += v[2]
-        return out
-
-    @staticmethod
-    def rotate(out, a, rad, axis):
-        a = a[:]
-        x, y, z = axis
-        c = math.cos(rad)
-        s = math.sin(rad)
-        a11 = x * x * (1 - c) + c
-        a21 = y * x * (1 - c) + z * s
-        a31 = x * z * (1 - c) - y * s
-        a12 = x * y * (1 - c) - z * s
-        a22 = y * y * (1 - c) + c
-        a32 = y * z * (1 - c) + x * s
-        a13 = x * z * (1 - c) + y * s
-        a23 = y * z * (1 - c) - x * s
-        a33 = z * z * (1 - c) + c
-        out[0] = a11 * a[0] + a21 * a[4] + a31 * a[8]
-        out[1] = a12 * a[0] + a22 * a[4] + a32 * a[8]
-        out[2] = a13 * a[0] + a23 * a[4] + a33 * a[8]
-        out[4] = a11 * a[1] + a21 * a[5] + a31 * a[9]
-        out[5] = a12 * a[1] + a22 * a[5] + a32 * a[9]
-        out[6] = a13 * a[1] + a23 * a[5] + a33 * a[9]
-        out[8] = a11 * a[2] + a21 * a[6] + a31 * a[10]
-        out[9] = a12 * a[2] + a22 * a[6] + a32 * a[10]
-        out[10] = a13 * a[2] + a23 * a[6] + a33 * a[10]
-        out[15] = a[15]
-        return out
+    return TypedArray("Float32Array", v)
 
 
 # WebGL Test
@@ -342,52 +285,15 @@ def initTextureBuffer(gl):
 #
 def loadTexture(gl, url):
     texture = gl.createTexture()
-    gl.bindTexture(gl.TEXTURE_2D, texture)
 
-    # Because images have to be downloaded over the internet
-    # they might take a moment until they are ready.
-    # Until then put a single pixel in the texture so we can
-    # use it immediately. When the image has finished downloading
-    # we'll update the texture with the contents of the image.
-    level = 0
-    internalFormat = gl.RGBA
-    border = 0
-    srcFormat = gl.RGBA
-    srcType = gl.UNSIGNED_BYTE
+    # Large images would hold back the frames while they are sent,
+    # so the image is streamed in tiles from the render loop, after
+    # a scaled down preview.
     with Image.open(url) as im:
-        # im = im.resize(size=(64, 64))
-        pixel = [y for x in im.getdata() for y in x]
-        width, height = im.size
-    gl.texImage2D(
-        gl.TEXTURE_2D,
-        level,
-        internalFormat,
-        width,
-        height,
-        border,
-        srcFormat,
-        srcType,
-        Uint8Array(pixel),
-    )
-
-    # WebGL1 has different requirements for power of 2 images
-    # vs. non power of 2 images so check if the image is a
-    # power of 2 in both dimensions.
-    if isPowerOf2(width) and isPowerOf2(height):
-        # Yes, it's a power of 2. Generate mips.
-        gl.generateMipmap(gl.TEXTURE_2D)
-    else:
-        # No, it's not a power of 2. Turn off mips and set
-        # wrapping to clamp to edge
-        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_S, gl.CLAMP_TO_EDGE)
-        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_T, gl.CLAMP_TO_EDGE)
-        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, gl.LINEAR)
-
-    return texture
-
-
-def isPowerOf2(value):
-    return (value & (value - 1)) == 0
+        pixels = np.asarray(im.convert("RGBA"))
+    stream = TextureStream(gl, texture, pixels)
+    stream.step()
+    return texture, stream
 
 
 # Tell WebGL how to pull out the colors from the color buffer
@@ -410,7 +316,7 @@ def setColorAttribute(gl, buffers, programInfo):
     gl.enableVertexAttribArray(programInfo["attribLocations"]["vertexColor"])
 
 
-def drawScene(gl, programInfo, buffers, texture, cubeRotation):
+def drawScene(gl, programInfo, buffers, texture, projectionMatrix, modelViewMatrix):
     gl.clearColor(0.0, 0.0, 0.0, 1.0)  # Clear to black, fully opaque
     gl.clearDepth(1.0)  # Clear everything
     gl.enable(gl.DEPTH_TEST)  # Enable depth testing
@@ -420,6 +326,46 @@ def drawScene(gl, programInfo, buffers, texture, cubeRotation):
 
     gl.clear(gl.COLOR_BUFFER_BIT | gl.DEPTH_BUFFER_BIT)
 
+    # Tell WebGL how to pull out the positions from the position
+    # buffer into the vertexPosition attribute.
+    setPositionAttribute(gl, buffers, programInfo)
+    # setColorAttribute(gl, buffers, programInfo)
+    setTextureAttribute(gl, buffers, programInfo)
+
+    # Tell WebGL which indices to use to index the vertices
+    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, buffers["indices"])
+
+    # Tell WebGL to use our program when drawing
+    gl.useProgram(programInfo["program"])
+
+    # Set the shader uniforms
+    gl.uniformMatrix4fv(
+        programInfo["uniformLocations"]["projectionMatrix"],
+        False,
+        projectionMatrix,
+    )
+    gl.uniformMatrix4fv(
+        programInfo["uniformLocations"]["modelViewMatrix"],
+        False,
+        modelViewMatrix,
+    )
+
+    # Tell WebGL we want to affect texture unit 0
+    gl.activeTexture(gl.TEXTURE0)
+
+    # Bind the texture to texture unit 0
+    gl.bindTexture(gl.TEXTURE_2D, texture)
+
+    # Tell the shader we bound the texture to texture unit 0
+    gl.uniform1i(programInfo["uniformLocations"]["uSampler"], 0)
+
+    vertexCount = 36
+    type = gl.UNSIGNED_SHORT
+    offset = 0
+    gl.drawElements(gl.TRIANGLES, vertexCount, type, offset)
+
+
+def sceneMatrices(cubeRotation):
     # Create a perspective matrix, a special matrix that is
     # used to simulate the distortion of perspective in a camera.
     # Our field of view is 45 degrees, with a width/height
@@ -465,43 +411,7 @@ def drawScene(gl, programInfo, buffers, texture, cubeRotation):
         [0, 1, 0],
     )  # axis to rotate around (Y)
 
-    # Tell WebGL how to pull out the positions from the position
-    # buffer into the vertexPosition attribute.
-    setPositionAttribute(gl, buffers, programInfo)
-    # setColorAttribute(gl, buffers, programInfo)
-    setTextureAttribute(gl, buffers, programInfo)
-
-    # Tell WebGL which indices to use to index the vertices
-    gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER, buffers["indices"])
-
-    # Tell WebGL to use our program when drawing
-    gl.useProgram(programInfo["program"])
-
-    # Set the shader uniforms
-    gl.uniformMatrix4fv(
-        programInfo["uniformLocations"]["projectionMatrix"],
-        False,
-        Float32Array(projectionMatrix),
-    )
-    gl.uniformMatrix4fv(
-        programInfo["uniformLocations"]["modelViewMatrix"],
-        False,
-        Float32Array(modelViewMatrix),
-    )
-
-    # Tell WebGL we want to affect texture unit 0
-    gl.activeTexture(gl.TEXTURE0)
-
-    # Bind the texture to texture unit 0
-    gl.bindTexture(gl.TEXTURE_2D, texture)
-
-    # Tell the shader we bound the texture to texture unit 0
-    gl.uniform1i(programInfo["uniformLocations"]["uSampler"], 0)
-
-    vertexCount = 36
-    type = gl.UNSIGNED_SHORT
-    offset = 0
-    gl.drawElements(gl.TRIANGLES, vertexCount, type, offset)
+    return projectionMatrix, modelViewMatrix
 
 
 # tell webgl how to pull out the texture coordinates from buffer
@@ -544,9 +454,9 @@ def setPositionAttribute(gl, buffers, programInfo):
     gl.enableVertexAttribArray(programInfo["attribLocations"]["vertexPosition"])
 
 
-def test(proxy):
+def setupScene(proxy):
     canvas = proxy.get_root_object()
-    gl = canvas.getContext("webgl")
+    gl = canvas.getContext("webgl2") or canvas.getContext("webgl")
     gl.clearColor(0.0, 0.0, 1.0, 1.0)
     gl.clear(gl.COLOR_BUFFER_BIT)
 
@@ -574,55 +484,79 @@ def test(proxy):
     buffers = initBuffers(gl)
 
     # Load texture
-    texture = loadTexture(gl, "debian-logo.png")
-    # Flip image pixels into the bottom-to-top order that WebGL expects.
-    gl.pixelStorei(gl.UNPACK_FLIP_Y_WEBGL, True)
+    texture, textureStream = loadTexture(gl, Path(__file__).with_name("debian-logo.png"))
+
+    # Record the draw calls once. Only the matrices change from
+    # frame to frame, so they are left as placeholders.
+    proxy.begin_record("drawScene")
+    drawScene(gl, programInfo, buffers, texture, Placeholder(0), Placeholder(1))
+    proxy.end_record()
+    return programInfo, buffers, texture, textureStream
+
+
+def test(proxy):
+    programInfo, buffers, texture, textureStream = setupScene(proxy)
 
     squareRotation = 0
     then = time.time()
     while True:
+        # Wait until the browser has presented enough of the frames
+        # sent so far.
+        proxy.begin_frame()
         now = time.time()
 
         deltaTime = now - then
         then = now
 
+        if not textureStream.done:
+            textureStream.step()
+
         # Draw the scene
-        drawScene(gl, programInfo, buffers, texture, squareRotation)
+        proxy.replay("drawScene", *sceneMatrices(squareRotation))
 
         squareRotation += deltaTime
-        proxy.flush()
-        time.sleep(0.01)
+        proxy.end_frame()
+        if proxy.next_frame_id % 300 == 0:
+            logger.info(
+                "%.1f fps, %.1f ms latency, %d dropped frames",
+                proxy.fps, proxy.frame_latency * 1000, proxy.dropped_frames)
 
 
 # main
 
-def main():
+def registerConstructors(proxy):
     import webgl
 
-    uri = "ws://localhost:8000/ws"
-    with TransportWebsocket(uri) as transport:
-        proxy = ServerProxy("browser", transport)
-        for k, v in webgl.INTERFACES.items():
-            class _Class(ObjectProxy, v):
-                pass
-            proxy.register_constructor(k, _Class)
+    for k, v in webgl.INTERFACES.items():
+        class _Class(ObjectProxy, v):
+            __slots__ = ()
+        proxy.register_constructor(k, _Class)
+
+    class WebGLContext(StateShadowingMixin, ObjectProxy, webgl.WebGLRenderingContext):
+        pass
 
-        class WebGLContext(
-            ObjectProxy,
-            webgl.WebGLRenderingContextBase,
-            webgl.WebGLRenderingContextOverloads
-        ):
-            pass
+    class WebGL2Context(StateShadowingMixin, ObjectProxy, webgl.WebGL2RenderingContext):
+        pass
 
-        proxy.register_constructor("WebGLContext", WebGLContext)
-        proxy.register_constructor("WebGLRenderingContext", WebGLContext)
+    proxy.register_constructor("WebGLContext", WebGLContext)
+    proxy.register_constructor("WebGLRenderingContext", WebGLContext)
+    proxy.register_constructor("WebGL2RenderingContext", WebGL2Context)
 
-        class CanvasObject(ObjectProxy, webgl.ProxyInterfaceBase):
-            def getContext(self, *args) -> Any:
-                return self._invoke_function("getContext", *args)
+    class CanvasObject(ObjectProxy, webgl.ProxyInterfaceBase):
+        def getContext(self, *args) -> Any:
+            return self._invoke_function("getContext", *args)
 
-        proxy.register_constructor("CanvasObject", CanvasObject)
+    proxy.register_constructor("CanvasObject", CanvasObject)
 
+
+def main():
+    import webgl
+
+    uri = "ws://localhost:8000/ws"
+    with TransportWebsocket(uri) as transport:
+        proxy = ServerProxy("browser", transport, allocate_ids=True, methods=webgl.METHODS,
+                            asset_cache=True, arguments=webgl.ARGUMENTS)
+        registerConstructors(proxy)
         test(proxy)
 
 
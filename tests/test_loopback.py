@@ -0,0 +1,147 @@
+# The script side against the Python Server of a mock page, in one
+# process. Every packet is encoded and decoded as on the wire, and the
+# server runs it as soon as the proxy sends it:
+#
+#     python -m pytest -q tests
+
+import gc
+import sys
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import mockgl  # noqa: E402
+import test  # noqa: E402
+import webgl  # noqa: E402
+from rpc import Placeholder, ServerProxy, decode_packet, encode_packet  # noqa: E402
+
+
+def wire(body):
+    return decode_packet(encode_packet({"to": "page", "body": body}, True))["body"]
+
+
+class ClientTransport:
+    binary = True
+    compress_threshold = None
+
+    def __init__(self):
+        self.server = None
+        self.inbox = deque()
+        self.messages_sent = 0
+
+    def connect(self, to_addr):
+        pass
+
+    def send(self, to_addr, body):
+        self.messages_sent += 1
+        self.server.onReceive("client", wire(body))
+        self.server.present_frames()
+
+    def recv(self):
+        return self.inbox.popleft()
+
+
+class ServerTransport:
+    binary = True
+
+    def __init__(self, client):
+        self.client = client
+
+    def send(self, to_addr, body):
+        self.client.inbox.append(wire(body))
+
+
+def connect(**kwargs):
+    transport = ClientTransport()
+    server = mockgl.make_server("page", ServerTransport(transport), frame_interval=None, keep_calls=True)
+    transport.server = server
+    proxy = ServerProxy("page", transport, allocate_ids=True, methods=webgl.METHODS,
+                        arguments=webgl.ARGUMENTS, **kwargs)
+    test.registerConstructors(proxy)
+    gl = proxy.get_root_object().getContext("webgl2")
+    return proxy, server, gl, server.root_object.context
+
+
+def calls(context, name):
+    return [args for method, args in context.calls if method == name]
+
+
+def test_replay_creates_objects():
+    proxy, server, gl, context = connect()
+    server.delete_on_release = True
+    proxy.begin_record("upload")
+    buffer = gl.createBuffer()
+    gl.bindBuffer(gl.ARRAY_BUFFER, buffer)
+    gl.bufferData(gl.ARRAY_BUFFER, Placeholder(0), gl.STATIC_DRAW)
+    proxy.end_record()
+    del buffer
+    gc.collect()
+    for i in range(3):
+        proxy.replay("upload", np.full(4, i, dtype=np.float32))
+    assert gl.getError() == 0
+
+    created = [args[1] for args in calls(context, "bindBuffer")]
+    assert len(created) == len(set(map(id, created))) == 3
+    # Each replay deletes the buffer the previous one created.
+    assert [args[0] for args in calls(context, "deleteBuffer")] == created[:2]
+    assert [args[1].data for args in calls(context, "bufferData")] == [
+        np.full(4, i, dtype=np.float32).tobytes() for i in range(3)]
+
+    # The last one goes with the list.
+    proxy.command_list_objects.clear()
+    gc.collect()
+    gl.getError()
+    assert [args[0] for args in calls(context, "deleteBuffer")] == created
+
+
+def test_evicted_assets_are_sent_again():
+    proxy, server, gl, context = connect(asset_cache=True)
+    server.max_asset_bytes = 3000
+    arrays = [np.full(256, i, dtype=np.float32) for i in range(4)]
+    for array in arrays:
+        gl.bufferData(gl.ARRAY_BUFFER, array, gl.STATIC_DRAW)
+    proxy.flush()
+    # Only the last two fit, so the first is needed again.
+    gl.bufferData(gl.ARRAY_BUFFER, arrays[0], gl.STATIC_DRAW)
+    gl.bufferData(gl.ARRAY_BUFFER, arrays[3], gl.STATIC_DRAW)
+    assert gl.getError() == 0
+    assert [bytes(args[1].data) for args in calls(context, "bufferData")] == [
+        array.tobytes() for array in arrays + [arrays[0], arrays[3]]]
+
+
+def test_release_follows_last_use():
+    proxy, server, gl, context = connect()
+    shader = gl.createShader(gl.VERTEX_SHADER)
+    gl.compileShader(shader)
+    object_id = shader.object_id
+    # The release goes out in the same batch, after the call.
+    del shader
+    gc.collect()
+    assert gl.getError() == 0
+    assert calls(context, "compileShader")[0][0] is not None
+    assert object_id not in server.liveObjects
+
+
+def test_batches_flush_by_call_count():
+    proxy, server, gl, context = connect(max_batch_calls=10)
+    sent = proxy.transport.messages_sent
+    for i in range(25):
+        gl.clearColor(i, 0.0, 0.0, 1.0)
+    assert proxy.transport.messages_sent - sent == 2
+    assert len(calls(context, "clearColor")) == 20
+    proxy.flush()
+    assert len(calls(context, "clearColor")) == 25
+
+
+def test_batches_flush_by_recorded_bytes():
+    proxy, server, gl, context = connect(max_batch_bytes=1000)
+    proxy.begin_record("upload")
+    gl.bufferData(gl.ARRAY_BUFFER, np.zeros(4096, dtype=np.uint8), gl.STATIC_DRAW)
+    sent = proxy.transport.messages_sent
+    proxy.end_record()
+    assert proxy.transport.messages_sent - sent == 1
+    assert "upload" in server.command_lists
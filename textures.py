@@ -0,0 +1,153 @@
+import numpy as np
+
+from rpc import AsyncServerProxy
+
+
+# Bytes per pixel of the formats and types that can be streamed.
+FORMAT_CHANNELS = {
+    0x1906: 1,  # ALPHA
+    0x1907: 3,  # RGB
+    0x1908: 4,  # RGBA
+    0x1909: 1,  # LUMINANCE
+    0x190A: 2,  # LUMINANCE_ALPHA
+}
+
+TILE_BYTES = 256 * 1024
+
+
+def _is_power_of_2(value):
+    return value & (value - 1) == 0
+
+
+def _downsample(pixels, scale):
+    # Box filter over scale x scale blocks.
+    height, width, channels = pixels.shape
+    scale = max(1, min(scale, height, width))
+    height, width = height // scale, width // scale
+    blocks = pixels[:height * scale, :width * scale].reshape(height, scale, width, scale, channels)
+    return blocks.mean(axis=(1, 3)).round().astype(pixels.dtype)
+
+
+class TextureStream:
+    # Uploads an image to a texture in tiles of at most tile_bytes, a
+    # few at a time, so that a large image doesn't hold back the frames
+    # sent around it:
+    #
+    #     stream = TextureStream(gl, texture, np.asarray(image))
+    #     while True:
+    #         proxy.begin_frame()
+    #         stream.step()
+    #         ...
+    #         proxy.end_frame()
+    #
+    # The texture first shows the image scaled down by each of the
+    # previews, from the smallest. Each finer version is streamed into
+    # a staging texture and copied over on the GPU once complete, so
+    # the texture stays usable, and can stay in recorded command lists,
+    # throughout. Pixels are a (height, width, channels) uint8 array.
+    #
+    # The stream sets UNPACK_FLIP_Y_WEBGL to false and UNPACK_ALIGNMENT
+    # to 1, and leaves the texture bound to the active unit and the
+    # default framebuffer bound. With an AsyncServerProxy, the proxy
+    # must allocate object ids, so that createTexture() returns the
+    # staging texture rather than a future.
+    def __init__(self, gl, texture, pixels, format=0x1908, flip_y=False,
+                 tile_bytes=TILE_BYTES, previews=(8,), mipmaps=True):
+        if isinstance(gl.proxy, AsyncServerProxy) and not gl.proxy.allocate_ids:
+            raise ValueError("TextureStream needs an AsyncServerProxy with allocate_ids")
+        pixels = np.asarray(pixels, dtype=np.uint8)
+        if pixels.ndim == 2:
+            pixels = pixels[:, :, np.newaxis]
+        if pixels.shape[2] != FORMAT_CHANNELS[format]:
+            raise ValueError(f"Expected {FORMAT_CHANNELS[format]} channels, got {pixels.shape[2]}")
+        if flip_y:
+            pixels = pixels[::-1]
+        self.gl = gl
+        self.texture = texture
+        self.pixels = pixels
+        self.format = format
+        self.tile_bytes = tile_bytes
+        # Previews are copied from a framebuffer, and only RGBA is
+        # sure to be renderable.
+        if format != 0x1908:
+            previews = ()
+        self.previews = sorted((scale for scale in previews if scale > 1), reverse=True)
+        self.mipmaps = mipmaps
+        self.uploaded_bytes = 0
+        self.done = False
+        self._uploads = self._upload()
+
+    def step(self, budget=None):
+        # Uploads tiles of up to budget bytes in total, at least one,
+        # and returns whether the texture is complete.
+        budget = self.tile_bytes if budget is None else budget
+        sent = 0
+        while not self.done and (sent == 0 or sent < budget):
+            size = next(self._uploads, None)
+            if size is None:
+                self.done = True
+            else:
+                sent += size
+        return self.done
+
+    def finish(self):
+        while not self.step():
+            pass
+
+    def _upload(self):
+        gl = self.gl
+        height, width = self.pixels.shape[:2]
+        gl.bindTexture(gl.TEXTURE_2D, self.texture)
+        # Previews may not be a power of 2.
+        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, gl.LINEAR)
+        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_S, gl.CLAMP_TO_EDGE)
+        gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_T, gl.CLAMP_TO_EDGE)
+
+        staging = framebuffer = None
+        for i, scale in enumerate(self.previews + [1]):
+            pixels = self.pixels if scale == 1 else _downsample(self.pixels, scale)
+            if i == 0:
+                yield from self._upload_level(self.texture, pixels)
+                continue
+            if staging is None:
+                staging = gl.createTexture()
+                framebuffer = gl.createFramebuffer()
+            yield from self._upload_level(staging, pixels)
+            gl.bindFramebuffer(gl.FRAMEBUFFER, framebuffer)
+            gl.framebufferTexture2D(gl.FRAMEBUFFER, gl.COLOR_ATTACHMENT0, gl.TEXTURE_2D, staging, 0)
+            gl.bindTexture(gl.TEXTURE_2D, self.texture)
+            gl.copyTexImage2D(gl.TEXTURE_2D, 0, self.format, 0, 0, pixels.shape[1], pixels.shape[0], 0)
+            gl.bindFramebuffer(gl.FRAMEBUFFER, None)
+
+        if staging is not None:
+            gl.deleteFramebuffer(framebuffer)
+            gl.deleteTexture(staging)
+        gl.bindTexture(gl.TEXTURE_2D, self.texture)
+        # WebGL1 only has mipmaps and repeat for powers of 2.
+        if _is_power_of_2(width) and _is_power_of_2(height):
+            gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_S, gl.REPEAT)
+            gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_WRAP_T, gl.REPEAT)
+            if self.mipmaps:
+                gl.generateMipmap(gl.TEXTURE_2D)
+                gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, gl.LINEAR_MIPMAP_LINEAR)
+
+    def _upload_level(self, texture, pixels):
+        # Allocates level 0 of the texture and fills it tile by tile.
+        gl = self.gl
+        height, width, channels = pixels.shape
+        gl.bindTexture(gl.TEXTURE_2D, texture)
+        gl.texImage2D(gl.TEXTURE_2D, 0, self.format, width, height, 0, self.format, gl.UNSIGNED_BYTE, None)
+        tile_width = max(1, min(width, self.tile_bytes // channels))
+        tile_height = max(1, min(height, self.tile_bytes // (tile_width * channels)))
+        for y in range(0, height, tile_height):
+            for x in range(0, width, tile_width):
+                tile = pixels[y:y + tile_height, x:x + tile_width]
+                # Other calls may have changed these in between.
+                gl.bindTexture(gl.TEXTURE_2D, texture)
+                gl.pixelStorei(gl.UNPACK_FLIP_Y_WEBGL, False)
+                gl.pixelStorei(gl.UNPACK_ALIGNMENT, 1)
+                gl.texSubImage2D(
+                    gl.TEXTURE_2D, 0, x, y, tile.shape[1], tile.shape[0],
+                    self.format, gl.UNSIGNED_BYTE, tile)
+                self.uploaded_bytes += tile.nbytes
+                yield tile.nbytes
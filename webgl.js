@@ -0,0 +1,230 @@
+// AUTOGENERATED FILE -- DO NOT EDIT -- See parse_idl.py
+"use strict";
+
+const WEBGL_METHODS = [
+    "getContextAttributes",
+    "isContextLost",
+    "getSupportedExtensions",
+    "getExtension",
+    "drawingBufferStorage",
+    "activeTexture",
+    "attachShader",
+    "bindAttribLocation",
+    "bindBuffer",
+    "bindFramebuffer",
+    "bindRenderbuffer",
+    "bindTexture",
+    "blendColor",
+    "blendEquation",
+    "blendEquationSeparate",
+    "blendFunc",
+    "blendFuncSeparate",
+    "checkFramebufferStatus",
+    "clear",
+    "clearColor",
+    "clearDepth",
+    "clearStencil",
+    "colorMask",
+    "compileShader",
+    "copyTexImage2D",
+    "copyTexSubImage2D",
+    "createBuffer",
+    "createFramebuffer",
+    "createProgram",
+    "createRenderbuffer",
+    "createShader",
+    "createTexture",
+    "cullFace",
+    "deleteBuffer",
+    "deleteFramebuffer",
+    "deleteProgram",
+    "deleteRenderbuffer",
+    "deleteShader",
+    "deleteTexture",
+    "depthFunc",
+    "depthMask",
+    "depthRange",
+    "detachShader",
+    "disable",
+    "disableVertexAttribArray",
+    "drawArrays",
+    "drawElements",
+    "enable",
+    "enableVertexAttribArray",
+    "finish",
+    "flush",
+    "framebufferRenderbuffer",
+    "framebufferTexture2D",
+    "frontFace",
+    "generateMipmap",
+    "getActiveAttrib",
+    "getActiveUniform",
+    "getAttachedShaders",
+    "getAttribLocation",
+    "getBufferParameter",
+    "getParameter",
+    "getError",
+    "getFramebufferAttachmentParameter",
+    "getProgramParameter",
+    "getProgramInfoLog",
+    "getRenderbufferParameter",
+    "getShaderParameter",
+    "getShaderPrecisionFormat",
+    "getShaderInfoLog",
+    "getShaderSource",
+    "getTexParameter",
+    "getUniform",
+    "getUniformLocation",
+    "getVertexAttrib",
+    "getVertexAttribOffset",
+    "hint",
+    "isBuffer",
+    "isEnabled",
+    "isFramebuffer",
+    "isProgram",
+    "isRenderbuffer",
+    "isShader",
+    "isTexture",
+    "lineWidth",
+    "linkProgram",
+    "pixelStorei",
+    "polygonOffset",
+    "renderbufferStorage",
+    "sampleCoverage",
+    "scissor",
+    "shaderSource",
+    "stencilFunc",
+    "stencilFuncSeparate",
+    "stencilMask",
+    "stencilMaskSeparate",
+    "stencilOp",
+    "stencilOpSeparate",
+    "texParameterf",
+    "texParameteri",
+    "uniform1f",
+    "uniform2f",
+    "uniform3f",
+    "uniform4f",
+    "uniform1i",
+    "uniform2i",
+    "uniform3i",
+    "uniform4i",
+    "useProgram",
+    "validateProgram",
+    "vertexAttrib1f",
+    "vertexAttrib2f",
+    "vertexAttrib3f",
+    "vertexAttrib4f",
+    "vertexAttrib1fv",
+    "vertexAttrib2fv",
+    "vertexAttrib3fv",
+    "vertexAttrib4fv",
+    "vertexAttribPointer",
+    "viewport",
+    "bufferData",
+    "bufferSubData",
+    "compressedTexImage2D",
+    "compressedTexSubImage2D",
+    "readPixels",
+    "texImage2D",
+    "texSubImage2D",
+    "uniform1fv",
+    "uniform2fv",
+    "uniform3fv",
+    "uniform4fv",
+    "uniform1iv",
+    "uniform2iv",
+    "uniform3iv",
+    "uniform4iv",
+    "uniformMatrix2fv",
+    "uniformMatrix3fv",
+    "uniformMatrix4fv",
+    "copyBufferSubData",
+    "getBufferSubData",
+    "blitFramebuffer",
+    "framebufferTextureLayer",
+    "invalidateFramebuffer",
+    "invalidateSubFramebuffer",
+    "readBuffer",
+    "getInternalformatParameter",
+    "renderbufferStorageMultisample",
+    "texStorage2D",
+    "texStorage3D",
+    "texImage3D",
+    "texSubImage3D",
+    "copyTexSubImage3D",
+    "compressedTexImage3D",
+    "compressedTexSubImage3D",
+    "getFragDataLocation",
+    "uniform1ui",
+    "uniform2ui",
+    "uniform3ui",
+    "uniform4ui",
+    "uniform1uiv",
+    "uniform2uiv",
+    "uniform3uiv",
+    "uniform4uiv",
+    "uniformMatrix3x2fv",
+    "uniformMatrix4x2fv",
+    "uniformMatrix2x3fv",
+    "uniformMatrix4x3fv",
+    "uniformMatrix2x4fv",
+    "uniformMatrix3x4fv",
+    "vertexAttribI4i",
+    "vertexAttribI4iv",
+    "vertexAttribI4ui",
+    "vertexAttribI4uiv",
+    "vertexAttribIPointer",
+    "vertexAttribDivisor",
+    "drawArraysInstanced",
+    "drawElementsInstanced",
+    "drawRangeElements",
+    "drawBuffers",
+    "clearBufferfv",
+    "clearBufferiv",
+    "clearBufferuiv",
+    "clearBufferfi",
+    "createQuery",
+    "deleteQuery",
+    "isQuery",
+    "beginQuery",
+    "endQuery",
+    "getQuery",
+    "getQueryParameter",
+    "createSampler",
+    "deleteSampler",
+    "isSampler",
+    "bindSampler",
+    "samplerParameteri",
+    "samplerParameterf",
+    "getSamplerParameter",
+    "fenceSync",
+    "isSync",
+    "deleteSync",
+    "clientWaitSync",
+    "waitSync",
+    "getSyncParameter",
+    "createTransformFeedback",
+    "deleteTransformFeedback",
+    "isTransformFeedback",
+    "bindTransformFeedback",
+    "beginTransformFeedback",
+    "endTransformFeedback",
+    "transformFeedbackVaryings",
+    "getTransformFeedbackVarying",
+    "pauseTransformFeedback",
+    "resumeTransformFeedback",
+    "bindBufferBase",
+    "bindBufferRange",
+    "getIndexedParameter",
+    "getUniformIndices",
+    "getActiveUniforms",
+    "getUniformBlockIndex",
+    "getActiveUniformBlockParameter",
+    "getActiveUniformBlockName",
+    "uniformBlockBinding",
+    "createVertexArray",
+    "deleteVertexArray",
+    "isVertexArray",
+    "bindVertexArray",
+];
@@ -3,8 +3,8 @@
 #
 # WebGL IDL definitions scraped from the Khronos specification:
 # https://www.khronos.org/registry/webgl/specs/latest/
-                 
-from typing import Any, Optional                 
+
+from typing import Any, Optional
 from abc import ABC, abstractmethod
 
 
@@ -17,6 +17,9 @@ def register(cls):
 
 
 class ProxyInterfaceBase(ABC):
+    # Interfaces hold no state, so that proxy classes can use __slots__.
+    __slots__ = ()
+
     @abstractmethod
     def _get_attribute(self, name) -> Any: NotImplemented
     @abstractmethod
@@ -25,50 +28,55 @@ class ProxyInterfaceBase(ABC):
     def _invoke_function(self, name, *args) -> Any: NotImplemented
     @abstractmethod
     def _invoke_procedure(self, name, *args) -> None: NotImplemented
+    @abstractmethod
+    def _append_procedure(self, name, args) -> None: NotImplemented
+    @abstractmethod
+    def _invoke_constructor(self, name, constructor, *args) -> Any: NotImplemented
 
 
 @register
 class WebGLObject(ProxyInterfaceBase):
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLBuffer(WebGLObject): 
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLFramebuffer(WebGLObject): 
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLProgram(WebGLObject): 
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLRenderbuffer(WebGLObject): 
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLShader(WebGLObject): 
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLTexture(WebGLObject): 
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLUniformLocation(ProxyInterfaceBase):
-    pass
+    __slots__ = ()
 
 
 @register
 class WebGLRenderingContextBase(ProxyInterfaceBase):
+    __slots__ = ()
     DEPTH_BUFFER_BIT = 0x00000100
     STENCIL_BUFFER_BIT = 0x00000400
     COLOR_BUFFER_BIT = 0x00004000
@@ -382,144 +390,1747 @@ class WebGLRenderingContextBase(ProxyInterfaceBase):
     def unpackColorSpace(self): return self._get_attribute("unpackColorSpace")
     @unpackColorSpace.setter
     def unpackColorSpace(self, value): self._set_attribute("unpackColorSpace", value)
-    def getContextAttributes(self, *args) -> Any: return self._invoke_function("getContextAttributes", *args)
-    def isContextLost(self, *args) -> Any: return self._invoke_function("isContextLost", *args)
-    def getSupportedExtensions(self, *args) -> Any: return self._invoke_function("getSupportedExtensions", *args)
-    def getExtension(self, *args) -> Any: return self._invoke_function("getExtension", *args)
-    def drawingBufferStorage(self, *args) -> None: self._invoke_procedure("drawingBufferStorage", *args)
-    def activeTexture(self, *args) -> None: self._invoke_procedure("activeTexture", *args)
-    def attachShader(self, *args) -> None: self._invoke_procedure("attachShader", *args)
-    def bindAttribLocation(self, *args) -> None: self._invoke_procedure("bindAttribLocation", *args)
-    def bindBuffer(self, *args) -> None: self._invoke_procedure("bindBuffer", *args)
-    def bindFramebuffer(self, *args) -> None: self._invoke_procedure("bindFramebuffer", *args)
-    def bindRenderbuffer(self, *args) -> None: self._invoke_procedure("bindRenderbuffer", *args)
-    def bindTexture(self, *args) -> None: self._invoke_procedure("bindTexture", *args)
-    def blendColor(self, *args) -> None: self._invoke_procedure("blendColor", *args)
-    def blendEquation(self, *args) -> None: self._invoke_procedure("blendEquation", *args)
-    def blendEquationSeparate(self, *args) -> None: self._invoke_procedure("blendEquationSeparate", *args)
-    def blendFunc(self, *args) -> None: self._invoke_procedure("blendFunc", *args)
-    def blendFuncSeparate(self, *args) -> None: self._invoke_procedure("blendFuncSeparate", *args)
-    def checkFramebufferStatus(self, *args) -> Any: return self._invoke_function("checkFramebufferStatus", *args)
-    def clear(self, *args) -> None: self._invoke_procedure("clear", *args)
-    def clearColor(self, *args) -> None: self._invoke_procedure("clearColor", *args)
-    def clearDepth(self, *args) -> None: self._invoke_procedure("clearDepth", *args)
-    def clearStencil(self, *args) -> None: self._invoke_procedure("clearStencil", *args)
-    def colorMask(self, *args) -> None: self._invoke_procedure("colorMask", *args)
-    def compileShader(self, *args) -> None: self._invoke_procedure("compileShader", *args)
-    def copyTexImage2D(self, *args) -> None: self._invoke_procedure("copyTexImage2D", *args)
-    def copyTexSubImage2D(self, *args) -> None: self._invoke_procedure("copyTexSubImage2D", *args)
-    def createBuffer(self, *args) -> Optional[WebGLBuffer]: return self._invoke_function("createBuffer", *args)
-    def createFramebuffer(self, *args) -> Optional[WebGLFramebuffer]: return self._invoke_function("createFramebuffer", *args)
-    def createProgram(self, *args) -> Optional[WebGLProgram]: return self._invoke_function("createProgram", *args)
-    def createRenderbuffer(self, *args) -> Optional[WebGLRenderbuffer]: return self._invoke_function("createRenderbuffer", *args)
-    def createShader(self, *args) -> Optional[WebGLShader]: return self._invoke_function("createShader", *args)
-    def createTexture(self, *args) -> Optional[WebGLTexture]: return self._invoke_function("createTexture", *args)
-    def cullFace(self, *args) -> None: self._invoke_procedure("cullFace", *args)
-    def deleteBuffer(self, *args) -> None: self._invoke_procedure("deleteBuffer", *args)
-    def deleteFramebuffer(self, *args) -> None: self._invoke_procedure("deleteFramebuffer", *args)
-    def deleteProgram(self, *args) -> None: self._invoke_procedure("deleteProgram", *args)
-    def deleteRenderbuffer(self, *args) -> None: self._invoke_procedure("deleteRenderbuffer", *args)
-    def deleteShader(self, *args) -> None: self._invoke_procedure("deleteShader", *args)
-    def deleteTexture(self, *args) -> None: self._invoke_procedure("deleteTexture", *args)
-    def depthFunc(self, *args) -> None: self._invoke_procedure("depthFunc", *args)
-    def depthMask(self, *args) -> None: self._invoke_procedure("depthMask", *args)
-    def depthRange(self, *args) -> None: self._invoke_procedure("depthRange", *args)
-    def detachShader(self, *args) -> None: self._invoke_procedure("detachShader", *args)
-    def disable(self, *args) -> None: self._invoke_procedure("disable", *args)
-    def disableVertexAttribArray(self, *args) -> None: self._invoke_procedure("disableVertexAttribArray", *args)
-    def drawArrays(self, *args) -> None: self._invoke_procedure("drawArrays", *args)
-    def drawElements(self, *args) -> None: self._invoke_procedure("drawElements", *args)
-    def enable(self, *args) -> None: self._invoke_procedure("enable", *args)
-    def enableVertexAttribArray(self, *args) -> None: self._invoke_procedure("enableVertexAttribArray", *args)
-    def finish(self, *args) -> None: self._invoke_procedure("finish", *args)
-    def flush(self, *args) -> None: self._invoke_procedure("flush", *args)
-    def framebufferRenderbuffer(self, *args) -> None: self._invoke_procedure("framebufferRenderbuffer", *args)
-    def framebufferTexture2D(self, *args) -> None: self._invoke_procedure("framebufferTexture2D", *args)
-    def frontFace(self, *args) -> None: self._invoke_procedure("frontFace", *args)
-    def generateMipmap(self, *args) -> None: self._invoke_procedure("generateMipmap", *args)
-    def getActiveAttrib(self, *args) -> Any: return self._invoke_function("getActiveAttrib", *args)
-    def getActiveUniform(self, *args) -> Any: return self._invoke_function("getActiveUniform", *args)
-    def getAttachedShaders(self, *args) -> Any: return self._invoke_function("getAttachedShaders", *args)
-    def getAttribLocation(self, *args) -> Any: return self._invoke_function("getAttribLocation", *args)
-    def getBufferParameter(self, *args) -> Any: return self._invoke_function("getBufferParameter", *args)
-    def getParameter(self, *args) -> Any: return self._invoke_function("getParameter", *args)
-    def getError(self, *args) -> Any: return self._invoke_function("getError", *args)
-    def getFramebufferAttachmentParameter(self, *args) -> Any: return self._invoke_function("getFramebufferAttachmentParameter", *args)
-    def getProgramParameter(self, *args) -> Any: return self._invoke_function("getProgramParameter", *args)
-    def getProgramInfoLog(self, *args) -> Any: return self._invoke_function("getProgramInfoLog", *args)
-    def getRenderbufferParameter(self, *args) -> Any: return self._invoke_function("getRenderbufferParameter", *args)
-    def getShaderParameter(self, *args) -> Any: return self._invoke_function("getShaderParameter", *args)
-    def getShaderPrecisionFormat(self, *args) -> Any: return self._invoke_function("getShaderPrecisionFormat", *args)
-    def getShaderInfoLog(self, *args) -> Any: return self._invoke_function("getShaderInfoLog", *args)
-    def getShaderSource(self, *args) -> Any: return self._invoke_function("getShaderSource", *args)
-    def getTexParameter(self, *args) -> Any: return self._invoke_function("getTexParameter", *args)
-    def getUniform(self, *args) -> Any: return self._invoke_function("getUniform", *args)
-    def getUniformLocation(self, *args) -> Optional[WebGLUniformLocation]: return self._invoke_function("getUniformLocation", *args)
-    def getVertexAttrib(self, *args) -> Any: return self._invoke_function("getVertexAttrib", *args)
-    def getVertexAttribOffset(self, *args) -> Any: return self._invoke_function("getVertexAttribOffset", *args)
-    def hint(self, *args) -> None: self._invoke_procedure("hint", *args)
-    def isBuffer(self, *args) -> Any: return self._invoke_function("isBuffer", *args)
-    def isEnabled(self, *args) -> Any: return self._invoke_function("isEnabled", *args)
-    def isFramebuffer(self, *args) -> Any: return self._invoke_function("isFramebuffer", *args)
-    def isProgram(self, *args) -> Any: return self._invoke_function("isProgram", *args)
-    def isRenderbuffer(self, *args) -> Any: return self._invoke_function("isRenderbuffer", *args)
-    def isShader(self, *args) -> Any: return self._invoke_function("isShader", *args)
-    def isTexture(self, *args) -> Any: return self._invoke_function("isTexture", *args)
-    def lineWidth(self, *args) -> None: self._invoke_procedure("lineWidth", *args)
-    def linkProgram(self, *args) -> None: self._invoke_procedure("linkProgram", *args)
-    def pixelStorei(self, *args) -> None: self._invoke_procedure("pixelStorei", *args)
-    def polygonOffset(self, *args) -> None: self._invoke_procedure("polygonOffset", *args)
-    def renderbufferStorage(self, *args) -> None: self._invoke_procedure("renderbufferStorage", *args)
-    def sampleCoverage(self, *args) -> None: self._invoke_procedure("sampleCoverage", *args)
-    def scissor(self, *args) -> None: self._invoke_procedure("scissor", *args)
-    def shaderSource(self, *args) -> None: self._invoke_procedure("shaderSource", *args)
-    def stencilFunc(self, *args) -> None: self._invoke_procedure("stencilFunc", *args)
-    def stencilFuncSeparate(self, *args) -> None: self._invoke_procedure("stencilFuncSeparate", *args)
-    def stencilMask(self, *args) -> None: self._invoke_procedure("stencilMask", *args)
-    def stencilMaskSeparate(self, *args) -> None: self._invoke_procedure("stencilMaskSeparate", *args)
-    def stencilOp(self, *args) -> None: self._invoke_procedure("stencilOp", *args)
-    def stencilOpSeparate(self, *args) -> None: self._invoke_procedure("stencilOpSeparate", *args)
-    def texParameterf(self, *args) -> None: self._invoke_procedure("texParameterf", *args)
-    def texParameteri(self, *args) -> None: self._invoke_procedure("texParameteri", *args)
-    def uniform1f(self, *args) -> None: self._invoke_procedure("uniform1f", *args)
-    def uniform2f(self, *args) -> None: self._invoke_procedure("uniform2f", *args)
-    def uniform3f(self, *args) -> None: self._invoke_procedure("uniform3f", *args)
-    def uniform4f(self, *args) -> None: self._invoke_procedure("uniform4f", *args)
-    def uniform1i(self, *args) -> None: self._invoke_procedure("uniform1i", *args)
-    def uniform2i(self, *args) -> None: self._invoke_procedure("uniform2i", *args)
-    def uniform3i(self, *args) -> None: self._invoke_procedure("uniform3i", *args)
-    def uniform4i(self, *args) -> None: self._invoke_procedure("uniform4i", *args)
-    def useProgram(self, *args) -> None: self._invoke_procedure("useProgram", *args)
-    def validateProgram(self, *args) -> None: self._invoke_procedure("validateProgram", *args)
-    def vertexAttrib1f(self, *args) -> None: self._invoke_procedure("vertexAttrib1f", *args)
-    def vertexAttrib2f(self, *args) -> None: self._invoke_procedure("vertexAttrib2f", *args)
-    def vertexAttrib3f(self, *args) -> None: self._invoke_procedure("vertexAttrib3f", *args)
-    def vertexAttrib4f(self, *args) -> None: self._invoke_procedure("vertexAttrib4f", *args)
-    def vertexAttrib1fv(self, *args) -> None: self._invoke_procedure("vertexAttrib1fv", *args)
-    def vertexAttrib2fv(self, *args) -> None: self._invoke_procedure("vertexAttrib2fv", *args)
-    def vertexAttrib3fv(self, *args) -> None: self._invoke_procedure("vertexAttrib3fv", *args)
-    def vertexAttrib4fv(self, *args) -> None: self._invoke_procedure("vertexAttrib4fv", *args)
-    def vertexAttribPointer(self, *args) -> None: self._invoke_procedure("vertexAttribPointer", *args)
-    def viewport(self, *args) -> None: self._invoke_procedure("viewport", *args)
+    def getContextAttributes(self) -> Any:
+        return self._invoke_function("getContextAttributes")
+    def isContextLost(self) -> Any:
+        return self._invoke_function("isContextLost")
+    def getSupportedExtensions(self) -> Any:
+        return self._invoke_function("getSupportedExtensions")
+    def getExtension(self, name: str) -> Any:
+        return self._invoke_function("getExtension", name)
+    def drawingBufferStorage(self, sizedFormat: int, width: int, height: int) -> None:
+        self._append_procedure("drawingBufferStorage", (sizedFormat, width, height))
+    def activeTexture(self, texture: int) -> None:
+        self._append_procedure("activeTexture", (texture,))
+    def attachShader(self, program: WebGLProgram, shader: WebGLShader) -> None:
+        self._append_procedure("attachShader", (program, shader))
+    def bindAttribLocation(self, program: WebGLProgram, index: int, name: str) -> None:
+        self._append_procedure("bindAttribLocation", (program, index, name))
+    def bindBuffer(self, target: int, buffer: Optional[WebGLBuffer]) -> None:
+        self._append_procedure("bindBuffer", (target, buffer))
+    def bindFramebuffer(self, target: int, framebuffer: Optional[WebGLFramebuffer]) -> None:
+        self._append_procedure("bindFramebuffer", (target, framebuffer))
+    def bindRenderbuffer(self, target: int, renderbuffer: Optional[WebGLRenderbuffer]) -> None:
+        self._append_procedure("bindRenderbuffer", (target, renderbuffer))
+    def bindTexture(self, target: int, texture: Optional[WebGLTexture]) -> None:
+        self._append_procedure("bindTexture", (target, texture))
+    def blendColor(self, red: float, green: float, blue: float, alpha: float) -> None:
+        self._append_procedure("blendColor", (red, green, blue, alpha))
+    def blendEquation(self, mode: int) -> None:
+        self._append_procedure("blendEquation", (mode,))
+    def blendEquationSeparate(self, modeRGB: int, modeAlpha: int) -> None:
+        self._append_procedure("blendEquationSeparate", (modeRGB, modeAlpha))
+    def blendFunc(self, sfactor: int, dfactor: int) -> None:
+        self._append_procedure("blendFunc", (sfactor, dfactor))
+    def blendFuncSeparate(self, srcRGB: int, dstRGB: int, srcAlpha: int, dstAlpha: int) -> None:
+        self._append_procedure("blendFuncSeparate", (srcRGB, dstRGB, srcAlpha, dstAlpha))
+    def checkFramebufferStatus(self, target: int) -> Any:
+        return self._invoke_function("checkFramebufferStatus", target)
+    def clear(self, mask: int) -> None:
+        self._append_procedure("clear", (mask,))
+    def clearColor(self, red: float, green: float, blue: float, alpha: float) -> None:
+        self._append_procedure("clearColor", (red, green, blue, alpha))
+    def clearDepth(self, depth: float) -> None:
+        self._append_procedure("clearDepth", (depth,))
+    def clearStencil(self, s: int) -> None:
+        self._append_procedure("clearStencil", (s,))
+    def colorMask(self, red: bool, green: bool, blue: bool, alpha: bool) -> None:
+        self._append_procedure("colorMask", (red, green, blue, alpha))
+    def compileShader(self, shader: WebGLShader) -> None:
+        self._append_procedure("compileShader", (shader,))
+    def copyTexImage2D(self, target: int, level: int, internalformat: int, x: int, y: int, width: int, height: int, border: int) -> None:
+        self._append_procedure("copyTexImage2D", (target, level, internalformat, x, y, width, height, border))
+    def copyTexSubImage2D(self, target: int, level: int, xoffset: int, yoffset: int, x: int, y: int, width: int, height: int) -> None:
+        self._append_procedure("copyTexSubImage2D", (target, level, xoffset, yoffset, x, y, width, height))
+    def createBuffer(self) -> Optional[WebGLBuffer]:
+        return self._invoke_constructor("createBuffer", "WebGLBuffer")
+    def createFramebuffer(self) -> Optional[WebGLFramebuffer]:
+        return self._invoke_constructor("createFramebuffer", "WebGLFramebuffer")
+    def createProgram(self) -> Optional[WebGLProgram]:
+        return self._invoke_constructor("createProgram", "WebGLProgram")
+    def createRenderbuffer(self) -> Optional[WebGLRenderbuffer]:
+        return self._invoke_constructor("createRenderbuffer", "WebGLRenderbuffer")
+    def createShader(self, type: int) -> Optional[WebGLShader]:
+        return self._invoke_constructor("createShader", "WebGLShader", type)
+    def createTexture(self) -> Optional[WebGLTexture]:
+        return self._invoke_constructor("createTexture", "WebGLTexture")
+    def cullFace(self, mode: int) -> None:
+        self._append_procedure("cullFace", (mode,))
+    def deleteBuffer(self, buffer: Optional[WebGLBuffer]) -> None:
+        self._append_procedure("deleteBuffer", (buffer,))
+    def deleteFramebuffer(self, framebuffer: Optional[WebGLFramebuffer]) -> None:
+        self._append_procedure("deleteFramebuffer", (framebuffer,))
+    def deleteProgram(self, program: Optional[WebGLProgram]) -> None:
+        self._append_procedure("deleteProgram", (program,))
+    def deleteRenderbuffer(self, renderbuffer: Optional[WebGLRenderbuffer]) -> None:
+        self._append_procedure("deleteRenderbuffer", (renderbuffer,))
+    def deleteShader(self, shader: Optional[WebGLShader]) -> None:
+        self._append_procedure("deleteShader", (shader,))
+    def deleteTexture(self, texture: Optional[WebGLTexture]) -> None:
+        self._append_procedure("deleteTexture", (texture,))
+    def depthFunc(self, func: int) -> None:
+        self._append_procedure("depthFunc", (func,))
+    def depthMask(self, flag: bool) -> None:
+        self._append_procedure("depthMask", (flag,))
+    def depthRange(self, zNear: float, zFar: float) -> None:
+        self._append_procedure("depthRange", (zNear, zFar))
+    def detachShader(self, program: WebGLProgram, shader: WebGLShader) -> None:
+        self._append_procedure("detachShader", (program, shader))
+    def disable(self, cap: int) -> None:
+        self._append_procedure("disable", (cap,))
+    def disableVertexAttribArray(self, index: int) -> None:
+        self._append_procedure("disableVertexAttribArray", (index,))
+    def drawArrays(self, mode: int, first: int, count: int) -> None:
+        self._append_procedure("drawArrays", (mode, first, count))
+    def drawElements(self, mode: int, count: int, type: int, offset: int) -> None:
+        self._append_procedure("drawElements", (mode, count, type, offset))
+    def enable(self, cap: int) -> None:
+        self._append_procedure("enable", (cap,))
+    def enableVertexAttribArray(self, index: int) -> None:
+        self._append_procedure("enableVertexAttribArray", (index,))
+    def finish(self) -> None:
+        self._append_procedure("finish", ())
+    def flush(self) -> None:
+        self._append_procedure("flush", ())
+    def framebufferRenderbuffer(self, target: int, attachment: int, renderbuffertarget: int, renderbuffer: Optional[WebGLRenderbuffer]) -> None:
+        self._append_procedure("framebufferRenderbuffer", (target, attachment, renderbuffertarget, renderbuffer))
+    def framebufferTexture2D(self, target: int, attachment: int, textarget: int, texture: Optional[WebGLTexture], level: int) -> None:
+        self._append_procedure("framebufferTexture2D", (target, attachment, textarget, texture, level))
+    def frontFace(self, mode: int) -> None:
+        self._append_procedure("frontFace", (mode,))
+    def generateMipmap(self, target: int) -> None:
+        self._append_procedure("generateMipmap", (target,))
+    def getActiveAttrib(self, program: WebGLProgram, index: int) -> Any:
+        return self._invoke_function("getActiveAttrib", program, index)
+    def getActiveUniform(self, program: WebGLProgram, index: int) -> Any:
+        return self._invoke_function("getActiveUniform", program, index)
+    def getAttachedShaders(self, program: WebGLProgram) -> Any:
+        return self._invoke_function("getAttachedShaders", program)
+    def getAttribLocation(self, program: WebGLProgram, name: str) -> Any:
+        return self._invoke_function("getAttribLocation", program, name)
+    def getBufferParameter(self, target: int, pname: int) -> Any:
+        return self._invoke_function("getBufferParameter", target, pname)
+    def getParameter(self, pname: int) -> Any:
+        return self._invoke_function("getParameter", pname)
+    def getError(self) -> Any:
+        return self._invoke_function("getError")
+    def getFramebufferAttachmentParameter(self, target: int, attachment: int, pname: int) -> Any:
+        return self._invoke_function("getFramebufferAttachmentParameter", target, attachment, pname)
+    def getProgramParameter(self, program: WebGLProgram, pname: int) -> Any:
+        return self._invoke_function("getProgramParameter", program, pname)
+    def getProgramInfoLog(self, program: WebGLProgram) -> Any:
+        return self._invoke_function("getProgramInfoLog", program)
+    def getRenderbufferParameter(self, target: int, pname: int) -> Any:
+        return self._invoke_function("getRenderbufferParameter", target, pname)
+    def getShaderParameter(self, shader: WebGLShader, pname: int) -> Any:
+        return self._invoke_function("getShaderParameter", shader, pname)
+    def getShaderPrecisionFormat(self, shadertype: int, precisiontype: int) -> Any:
+        return self._invoke_function("getShaderPrecisionFormat", shadertype, precisiontype)
+    def getShaderInfoLog(self, shader: WebGLShader) -> Any:
+        return self._invoke_function("getShaderInfoLog", shader)
+    def getShaderSource(self, shader: WebGLShader) -> Any:
+        return self._invoke_function("getShaderSource", shader)
+    def getTexParameter(self, target: int, pname: int) -> Any:
+        return self._invoke_function("getTexParameter", target, pname)
+    def getUniform(self, program: WebGLProgram, location: WebGLUniformLocation) -> Any:
+        return self._invoke_function("getUniform", program, location)
+    def getUniformLocation(self, program: WebGLProgram, name: str) -> Optional[WebGLUniformLocation]:
+        return self._invoke_function("getUniformLocation", program, name)
+    def getVertexAttrib(self, index: int, pname: int) -> Any:
+        return self._invoke_function("getVertexAttrib", index, pname)
+    def getVertexAttribOffset(self, index: int, pname: int) -> Any:
+        return self._invoke_function("getVertexAttribOffset", index, pname)
+    def hint(self, target: int, mode: int) -> None:
+        self._append_procedure("hint", (target, mode))
+    def isBuffer(self, buffer: Optional[WebGLBuffer]) -> Any:
+        return self._invoke_function("isBuffer", buffer)
+    def isEnabled(self, cap: int) -> Any:
+        return self._invoke_function("isEnabled", cap)
+    def isFramebuffer(self, framebuffer: Optional[WebGLFramebuffer]) -> Any:
+        return self._invoke_function("isFramebuffer", framebuffer)
+    def isProgram(self, program: Optional[WebGLProgram]) -> Any:
+        return self._invoke_function("isProgram", program)
+    def isRenderbuffer(self, renderbuffer: Optional[WebGLRenderbuffer]) -> Any:
+        return self._invoke_function("isRenderbuffer", renderbuffer)
+    def isShader(self, shader: Optional[WebGLShader]) -> Any:
+        return self._invoke_function("isShader", shader)
+    def isTexture(self, texture: Optional[WebGLTexture]) -> Any:
+        return self._invoke_function("isTexture", texture)
+    def lineWidth(self, width: float) -> None:
+        self._append_procedure("lineWidth", (width,))
+    def linkProgram(self, program: WebGLProgram) -> None:
+        self._append_procedure("linkProgram", (program,))
+    def pixelStorei(self, pname: int, param: int) -> None:
+        self._append_procedure("pixelStorei", (pname, param))
+    def polygonOffset(self, factor: float, units: float) -> None:
+        self._append_procedure("polygonOffset", (factor, units))
+    def renderbufferStorage(self, target: int, internalformat: int, width: int, height: int) -> None:
+        self._append_procedure("renderbufferStorage", (target, internalformat, width, height))
+    def sampleCoverage(self, value: float, invert: bool) -> None:
+        self._append_procedure("sampleCoverage", (value, invert))
+    def scissor(self, x: int, y: int, width: int, height: int) -> None:
+        self._append_procedure("scissor", (x, y, width, height))
+    def shaderSource(self, shader: WebGLShader, source: str) -> None:
+        self._append_procedure("shaderSource", (shader, source))
+    def stencilFunc(self, func: int, ref: int, mask: int) -> None:
+        self._append_procedure("stencilFunc", (func, ref, mask))
+    def stencilFuncSeparate(self, face: int, func: int, ref: int, mask: int) -> None:
+        self._append_procedure("stencilFuncSeparate", (face, func, ref, mask))
+    def stencilMask(self, mask: int) -> None:
+        self._append_procedure("stencilMask", (mask,))
+    def stencilMaskSeparate(self, face: int, mask: int) -> None:
+        self._append_procedure("stencilMaskSeparate", (face, mask))
+    def stencilOp(self, fail: int, zfail: int, zpass: int) -> None:
+        self._append_procedure("stencilOp", (fail, zfail, zpass))
+    def stencilOpSeparate(self, face: int, fail: int, zfail: int, zpass: int) -> None:
+        self._append_procedure("stencilOpSeparate", (face, fail, zfail, zpass))
+    def texParameterf(self, target: int, pname: int, param: float) -> None:
+        self._append_procedure("texParameterf", (target, pname, param))
+    def texParameteri(self, target: int, pname: int, param: int) -> None:
+        self._append_procedure("texParameteri", (target, pname, param))
+    def uniform1f(self, location: Optional[WebGLUniformLocation], x: float) -> None:
+        self._append_procedure("uniform1f", (location, x))
+    def uniform2f(self, location: Optional[WebGLUniformLocation], x: float, y: float) -> None:
+        self._append_procedure("uniform2f", (location, x, y))
+    def uniform3f(self, location: Optional[WebGLUniformLocation], x: float, y: float, z: float) -> None:
+        self._append_procedure("uniform3f", (location, x, y, z))
+    def uniform4f(self, location: Optional[WebGLUniformLocation], x: float, y: float, z: float, w: float) -> None:
+        self._append_procedure("uniform4f", (location, x, y, z, w))
+    def uniform1i(self, location: Optional[WebGLUniformLocation], x: int) -> None:
+        self._append_procedure("uniform1i", (location, x))
+    def uniform2i(self, location: Optional[WebGLUniformLocation], x: int, y: int) -> None:
+        self._append_procedure("uniform2i", (location, x, y))
+    def uniform3i(self, location: Optional[WebGLUniformLocation], x: int, y: int, z: int) -> None:
+        self._append_procedure("uniform3i", (location, x, y, z))
+    def uniform4i(self, location: Optional[WebGLUniformLocation], x: int, y: int, z: int, w: int) -> None:
+        self._append_procedure("uniform4i", (location, x, y, z, w))
+    def useProgram(self, program: Optional[WebGLProgram]) -> None:
+        self._append_procedure("useProgram", (program,))
+    def validateProgram(self, program: WebGLProgram) -> None:
+        self._append_procedure("validateProgram", (program,))
+    def vertexAttrib1f(self, index: int, x: float) -> None:
+        self._append_procedure("vertexAttrib1f", (index, x))
+    def vertexAttrib2f(self, index: int, x: float, y: float) -> None:
+        self._append_procedure("vertexAttrib2f", (index, x, y))
+    def vertexAttrib3f(self, index: int, x: float, y: float, z: float) -> None:
+        self._append_procedure("vertexAttrib3f", (index, x, y, z))
+    def vertexAttrib4f(self, index: int, x: float, y: float, z: float, w: float) -> None:
+        self._append_procedure("vertexAttrib4f", (index, x, y, z, w))
+    def vertexAttrib1fv(self, index: int, values: Any) -> None:
+        self._append_procedure("vertexAttrib1fv", (index, values))
+    def vertexAttrib2fv(self, index: int, values: Any) -> None:
+        self._append_procedure("vertexAttrib2fv", (index, values))
+    def vertexAttrib3fv(self, index: int, values: Any) -> None:
+        self._append_procedure("vertexAttrib3fv", (index, values))
+    def vertexAttrib4fv(self, index: int, values: Any) -> None:
+        self._append_procedure("vertexAttrib4fv", (index, values))
+    def vertexAttribPointer(self, index: int, size: int, type: int, normalized: bool, stride: int, offset: int) -> None:
+        self._append_procedure("vertexAttribPointer", (index, size, type, normalized, stride, offset))
+    def viewport(self, x: int, y: int, width: int, height: int) -> None:
+        self._append_procedure("viewport", (x, y, width, height))
 
 
 @register
 class WebGLRenderingContextOverloads(ProxyInterfaceBase):
-    def bufferData(self, *args) -> None: self._invoke_procedure("bufferData", *args)
-    def bufferSubData(self, *args) -> None: self._invoke_procedure("bufferSubData", *args)
-    def compressedTexImage2D(self, *args) -> None: self._invoke_procedure("compressedTexImage2D", *args)
-    def compressedTexSubImage2D(self, *args) -> None: self._invoke_procedure("compressedTexSubImage2D", *args)
-    def readPixels(self, *args) -> None: self._invoke_procedure("readPixels", *args)
-    def texImage2D(self, *args) -> None: self._invoke_procedure("texImage2D", *args)
-    def texSubImage2D(self, *args) -> None: self._invoke_procedure("texSubImage2D", *args)
-    def uniform1fv(self, *args) -> None: self._invoke_procedure("uniform1fv", *args)
-    def uniform2fv(self, *args) -> None: self._invoke_procedure("uniform2fv", *args)
-    def uniform3fv(self, *args) -> None: self._invoke_procedure("uniform3fv", *args)
-    def uniform4fv(self, *args) -> None: self._invoke_procedure("uniform4fv", *args)
-    def uniform1iv(self, *args) -> None: self._invoke_procedure("uniform1iv", *args)
-    def uniform2iv(self, *args) -> None: self._invoke_procedure("uniform2iv", *args)
-    def uniform3iv(self, *args) -> None: self._invoke_procedure("uniform3iv", *args)
-    def uniform4iv(self, *args) -> None: self._invoke_procedure("uniform4iv", *args)
-    def uniformMatrix2fv(self, *args) -> None: self._invoke_procedure("uniformMatrix2fv", *args)
-    def uniformMatrix3fv(self, *args) -> None: self._invoke_procedure("uniformMatrix3fv", *args)
-    def uniformMatrix4fv(self, *args) -> None: self._invoke_procedure("uniformMatrix4fv", *args)
+    __slots__ = ()
+    def bufferData(self, target: int, size_or_data: Any, usage: int) -> None:
+        self._append_procedure("bufferData", (target, size_or_data, usage))
+    def bufferSubData(self, target: int, offset: int, data: Any) -> None:
+        self._append_procedure("bufferSubData", (target, offset, data))
+    def compressedTexImage2D(self, target: int, level: int, internalformat: int, width: int, height: int, border: int, data: Any) -> None:
+        self._append_procedure("compressedTexImage2D", (target, level, internalformat, width, height, border, data))
+    def compressedTexSubImage2D(self, target: int, level: int, xoffset: int, yoffset: int, width: int, height: int, format: int, data: Any) -> None:
+        self._append_procedure("compressedTexSubImage2D", (target, level, xoffset, yoffset, width, height, format, data))
+    def readPixels(self, x: int, y: int, width: int, height: int, format: int, type: int, pixels: Any) -> None:
+        self._append_procedure("readPixels", (x, y, width, height, format, type, pixels))
+    def texImage2D(self, *args) -> None:
+        self._append_procedure("texImage2D", args)
+    def texSubImage2D(self, *args) -> None:
+        self._append_procedure("texSubImage2D", args)
+    def uniform1fv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform1fv", (location, v))
+    def uniform2fv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform2fv", (location, v))
+    def uniform3fv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform3fv", (location, v))
+    def uniform4fv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform4fv", (location, v))
+    def uniform1iv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform1iv", (location, v))
+    def uniform2iv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform2iv", (location, v))
+    def uniform3iv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform3iv", (location, v))
+    def uniform4iv(self, location: Optional[WebGLUniformLocation], v: Any) -> None:
+        self._append_procedure("uniform4iv", (location, v))
+    def uniformMatrix2fv(self, location: Optional[WebGLUniformLocation], transpose: bool, value: Any) -> None:
+        self._append_procedure("uniformMatrix2fv", (location, transpose, value))
+    def uniformMatrix3fv(self, location: Optional[WebGLUniformLocation], transpose: bool, value: Any) -> None:
+        self._append_procedure("uniformMatrix3fv", (location, transpose, value))
+    def uniformMatrix4fv(self, location: Optional[WebGLUniformLocation], transpose: bool, value: Any) -> None:
+        self._append_procedure("uniformMatrix4fv", (location, transpose, value))
+
+
+@register
+class WebGLRenderingContext(WebGLRenderingContextBase, WebGLRenderingContextOverloads):
+    __slots__ = ()
+
+
+@register
+class WebGLQuery(WebGLObject): 
+    __slots__ = ()
+
+
+@register
+class WebGLSampler(WebGLObject): 
+    __slots__ = ()
+
+
+@register
+class WebGLSync(WebGLObject): 
+    __slots__ = ()
+
+
+@register
+class WebGLTransformFeedback(WebGLObject): 
+    __slots__ = ()
+
+
+@register
+class WebGLVertexArrayObject(WebGLObject): 
+    __slots__ = ()
+
+
+@register
+class WebGL2RenderingContextBase(ProxyInterfaceBase):
+    __slots__ = ()
+    READ_BUFFER = 0x0C02
+    UNPACK_ROW_LENGTH = 0x0CF2
+    UNPACK_SKIP_ROWS = 0x0CF3
+    UNPACK_SKIP_PIXELS = 0x0CF4
+    PACK_ROW_LENGTH = 0x0D02
+    PACK_SKIP_ROWS = 0x0D03
+    PACK_SKIP_PIXELS = 0x0D04
+    COLOR = 0x1800
+    DEPTH = 0x1801
+    STENCIL = 0x1802
+    RED = 0x1903
+    RGB8 = 0x8051
+    RGB10_A2 = 0x8059
+    TEXTURE_BINDING_3D = 0x806A
+    UNPACK_SKIP_IMAGES = 0x806D
+    UNPACK_IMAGE_HEIGHT = 0x806E
+    TEXTURE_3D = 0x806F
+    TEXTURE_WRAP_R = 0x8072
+    MAX_3D_TEXTURE_SIZE = 0x8073
+    UNSIGNED_INT_2_10_10_10_REV = 0x8368
+    MAX_ELEMENTS_VERTICES = 0x80E8
+    MAX_ELEMENTS_INDICES = 0x80E9
+    TEXTURE_MIN_LOD = 0x813A
+    TEXTURE_MAX_LOD = 0x813B
+    TEXTURE_BASE_LEVEL = 0x813C
+    TEXTURE_MAX_LEVEL = 0x813D
+    MIN = 0x8007
+    MAX = 0x8008
+    DEPTH_COMPONENT24 = 0x81A6
+    MAX_TEXTURE_LOD_BIAS = 0x84FD
+    TEXTURE_COMPARE_MODE = 0x884C
+    TEXTURE_COMPARE_FUNC = 0x884D
+    CURRENT_QUERY = 0x8865
+    QUERY_RESULT = 0x8866
+    QUERY_RESULT_AVAILABLE = 0x8867
+    STREAM_READ = 0x88E1
+    STREAM_COPY = 0x88E2
+    STATIC_READ = 0x88E5
+    STATIC_COPY = 0x88E6
+    DYNAMIC_READ = 0x88E9
+    DYNAMIC_COPY = 0x88EA
+    MAX_DRAW_BUFFERS = 0x8824
+    DRAW_BUFFER0 = 0x8825
+    DRAW_BUFFER1 = 0x8826
+    DRAW_BUFFER2 = 0x8827
+    DRAW_BUFFER3 = 0x8828
+    DRAW_BUFFER4 = 0x8829
+    DRAW_BUFFER5 = 0x882A
+    DRAW_BUFFER6 = 0x882B
+    DRAW_BUFFER7 = 0x882C
+    DRAW_BUFFER8 = 0x882D
+    DRAW_BUFFER9 = 0x882E
+    DRAW_BUFFER10 = 0x882F
+    DRAW_BUFFER11 = 0x8830
+    DRAW_BUFFER12 = 0x8831
+    DRAW_BUFFER13 = 0x8832
+    DRAW_BUFFER14 = 0x8833
+    DRAW_BUFFER15 = 0x8834
+    MAX_FRAGMENT_UNIFORM_COMPONENTS = 0x8B49
+    MAX_VERTEX_UNIFORM_COMPONENTS = 0x8B4A
+    SAMPLER_3D = 0x8B5F
+    SAMPLER_2D_SHADOW = 0x8B62
+    FRAGMENT_SHADER_DERIVATIVE_HINT = 0x8B8B
+    PIXEL_PACK_BUFFER = 0x88EB
+    PIXEL_UNPACK_BUFFER = 0x88EC
+    PIXEL_PACK_BUFFER_BINDING = 0x88ED
+    PIXEL_UNPACK_BUFFER_BINDING = 0x88EF
+    FLOAT_MAT2x3 = 0x8B65
+    FLOAT_MAT2x4 = 0x8B66
+    FLOAT_MAT3x2 = 0x8B67
+    FLOAT_MAT3x4 = 0x8B68
+    FLOAT_MAT4x2 = 0x8B69
+    FLOAT_MAT4x3 = 0x8B6A
+    SRGB = 0x8C40
+    SRGB8 = 0x8C41
+    SRGB8_ALPHA8 = 0x8C43
+    COMPARE_REF_TO_TEXTURE = 0x884E
+    RGBA32F = 0x8814
+    RGB32F = 0x8815
+    RGBA16F = 0x881A
+    RGB16F = 0x881B
+    VERTEX_ATTRIB_ARRAY_INTEGER = 0x88FD
+    MAX_ARRAY_TEXTURE_LAYERS = 0x88FF
+    MIN_PROGRAM_TEXEL_OFFSET = 0x8904
+    MAX_PROGRAM_TEXEL_OFFSET = 0x8905
+    MAX_VARYING_COMPONENTS = 0x8B4B
+    TEXTURE_2D_ARRAY = 0x8C1A
+    TEXTURE_BINDING_2D_ARRAY = 0x8C1D
+    R11F_G11F_B10F = 0x8C3A
+    UNSIGNED_INT_10F_11F_11F_REV = 0x8C3B
+    RGB9_E5 = 0x8C3D
+    UNSIGNED_INT_5_9_9_9_REV = 0x8C3E
+    TRANSFORM_FEEDBACK_BUFFER_MODE = 0x8C7F
+    MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS = 0x8C80
+    TRANSFORM_FEEDBACK_VARYINGS = 0x8C83
+    TRANSFORM_FEEDBACK_BUFFER_START = 0x8C84
+    TRANSFORM_FEEDBACK_BUFFER_SIZE = 0x8C85
+    TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN = 0x8C88
+    RASTERIZER_DISCARD = 0x8C89
+    MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS = 0x8C8A
+    MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS = 0x8C8B
+    INTERLEAVED_ATTRIBS = 0x8C8C
+    SEPARATE_ATTRIBS = 0x8C8D
+    TRANSFORM_FEEDBACK_BUFFER = 0x8C8E
+    TRANSFORM_FEEDBACK_BUFFER_BINDING = 0x8C8F
+    RGBA32UI = 0x8D70
+    RGB32UI = 0x8D71
+    RGBA16UI = 0x8D76
+    RGB16UI = 0x8D77
+    RGBA8UI = 0x8D7C
+    RGB8UI = 0x8D7D
+    RGBA32I = 0x8D82
+    RGB32I = 0x8D83
+    RGBA16I = 0x8D88
+    RGB16I = 0x8D89
+    RGBA8I = 0x8D8E
+    RGB8I = 0x8D8F
+    RED_INTEGER = 0x8D94
+    RGB_INTEGER = 0x8D98
+    RGBA_INTEGER = 0x8D99
+    SAMPLER_2D_ARRAY = 0x8DC1
+    SAMPLER_2D_ARRAY_SHADOW = 0x8DC4
+    SAMPLER_CUBE_SHADOW = 0x8DC5
+    UNSIGNED_INT_VEC2 = 0x8DC6
+    UNSIGNED_INT_VEC3 = 0x8DC7
+    UNSIGNED_INT_VEC4 = 0x8DC8
+    INT_SAMPLER_2D = 0x8DCA
+    INT_SAMPLER_3D = 0x8DCB
+    INT_SAMPLER_CUBE = 0x8DCC
+    INT_SAMPLER_2D_ARRAY = 0x8DCF
+    UNSIGNED_INT_SAMPLER_2D = 0x8DD2
+    UNSIGNED_INT_SAMPLER_3D = 0x8DD3
+    UNSIGNED_INT_SAMPLER_CUBE = 0x8DD4
+    UNSIGNED_INT_SAMPLER_2D_ARRAY = 0x8DD7
+    DEPTH_COMPONENT32F = 0x8CAC
+    DEPTH32F_STENCIL8 = 0x8CAD
+    FLOAT_32_UNSIGNED_INT_24_8_REV = 0x8DAD
+    FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING = 0x8210
+    FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE = 0x8211
+    FRAMEBUFFER_ATTACHMENT_RED_SIZE = 0x8212
+    FRAMEBUFFER_ATTACHMENT_GREEN_SIZE = 0x8213
+    FRAMEBUFFER_ATTACHMENT_BLUE_SIZE = 0x8214
+    FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE = 0x8215
+    FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE = 0x8216
+    FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE = 0x8217
+    FRAMEBUFFER_DEFAULT = 0x8218
+    UNSIGNED_INT_24_8 = 0x84FA
+    DEPTH24_STENCIL8 = 0x88F0
+    UNSIGNED_NORMALIZED = 0x8C17
+    DRAW_FRAMEBUFFER_BINDING = 0x8CA6
+    READ_FRAMEBUFFER = 0x8CA8
+    DRAW_FRAMEBUFFER = 0x8CA9
+    READ_FRAMEBUFFER_BINDING = 0x8CAA
+    RENDERBUFFER_SAMPLES = 0x8CAB
+    FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER = 0x8CD4
+    MAX_COLOR_ATTACHMENTS = 0x8CDF
+    COLOR_ATTACHMENT1 = 0x8CE1
+    COLOR_ATTACHMENT2 = 0x8CE2
+    COLOR_ATTACHMENT3 = 0x8CE3
+    COLOR_ATTACHMENT4 = 0x8CE4
+    COLOR_ATTACHMENT5 = 0x8CE5
+    COLOR_ATTACHMENT6 = 0x8CE6
+    COLOR_ATTACHMENT7 = 0x8CE7
+    COLOR_ATTACHMENT8 = 0x8CE8
+    COLOR_ATTACHMENT9 = 0x8CE9
+    COLOR_ATTACHMENT10 = 0x8CEA
+    COLOR_ATTACHMENT11 = 0x8CEB
+    COLOR_ATTACHMENT12 = 0x8CEC
+    COLOR_ATTACHMENT13 = 0x8CED
+    COLOR_ATTACHMENT14 = 0x8CEE
+    COLOR_ATTACHMENT15 = 0x8CEF
+    FRAMEBUFFER_INCOMPLETE_MULTISAMPLE = 0x8D56
+    MAX_SAMPLES = 0x8D57
+    HALF_FLOAT = 0x140B
+    RG = 0x8227
+    RG_INTEGER = 0x8228
+    R8 = 0x8229
+    RG8 = 0x822B
+    R16F = 0x822D
+    R32F = 0x822E
+    RG16F = 0x822F
+    RG32F = 0x8230
+    R8I = 0x8231
+    R8UI = 0x8232
+    R16I = 0x8233
+    R16UI = 0x8234
+    R32I = 0x8235
+    R32UI = 0x8236
+    RG8I = 0x8237
+    RG8UI = 0x8238
+    RG16I = 0x8239
+    RG16UI = 0x823A
+    RG32I = 0x823B
+    RG32UI = 0x823C
+    VERTEX_ARRAY_BINDING = 0x85B5
+    R8_SNORM = 0x8F94
+    RG8_SNORM = 0x8F95
+    RGB8_SNORM = 0x8F96
+    RGBA8_SNORM = 0x8F97
+    SIGNED_NORMALIZED = 0x8F9C
+    COPY_READ_BUFFER = 0x8F36
+    COPY_WRITE_BUFFER = 0x8F37
+    COPY_READ_BUFFER_BINDING = 0x8F36
+    COPY_WRITE_BUFFER_BINDING = 0x8F37
+    UNIFORM_BUFFER = 0x8A11
+    UNIFORM_BUFFER_BINDING = 0x8A28
+    UNIFORM_BUFFER_START = 0x8A29
+    UNIFORM_BUFFER_SIZE = 0x8A2A
+    MAX_VERTEX_UNIFORM_BLOCKS = 0x8A2B
+    MAX_FRAGMENT_UNIFORM_BLOCKS = 0x8A2D
+    MAX_COMBINED_UNIFORM_BLOCKS = 0x8A2E
+    MAX_UNIFORM_BUFFER_BINDINGS = 0x8A2F
+    MAX_UNIFORM_BLOCK_SIZE = 0x8A30
+    MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS = 0x8A31
+    MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS = 0x8A33
+    UNIFORM_BUFFER_OFFSET_ALIGNMENT = 0x8A34
+    ACTIVE_UNIFORM_BLOCKS = 0x8A36
+    UNIFORM_TYPE = 0x8A37
+    UNIFORM_SIZE = 0x8A38
+    UNIFORM_BLOCK_INDEX = 0x8A3A
+    UNIFORM_OFFSET = 0x8A3B
+    UNIFORM_ARRAY_STRIDE = 0x8A3C
+    UNIFORM_MATRIX_STRIDE = 0x8A3D
+    UNIFORM_IS_ROW_MAJOR = 0x8A3E
+    UNIFORM_BLOCK_BINDING = 0x8A3F
+    UNIFORM_BLOCK_DATA_SIZE = 0x8A40
+    UNIFORM_BLOCK_ACTIVE_UNIFORMS = 0x8A42
+    UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES = 0x8A43
+    UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER = 0x8A44
+    UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER = 0x8A46
+    INVALID_INDEX = 0xFFFFFFFF
+    MAX_VERTEX_OUTPUT_COMPONENTS = 0x9122
+    MAX_FRAGMENT_INPUT_COMPONENTS = 0x9125
+    MAX_SERVER_WAIT_TIMEOUT = 0x9111
+    OBJECT_TYPE = 0x9112
+    SYNC_CONDITION = 0x9113
+    SYNC_STATUS = 0x9114
+    SYNC_FLAGS = 0x9115
+    SYNC_FENCE = 0x9116
+    SYNC_GPU_COMMANDS_COMPLETE = 0x9117
+    UNSIGNALED = 0x9118
+    SIGNALED = 0x9119
+    ALREADY_SIGNALED = 0x911A
+    TIMEOUT_EXPIRED = 0x911B
+    CONDITION_SATISFIED = 0x911C
+    WAIT_FAILED = 0x911D
+    SYNC_FLUSH_COMMANDS_BIT = 0x00000001
+    VERTEX_ATTRIB_ARRAY_DIVISOR = 0x88FE
+    ANY_SAMPLES_PASSED = 0x8C2F
+    ANY_SAMPLES_PASSED_CONSERVATIVE = 0x8D6A
+    SAMPLER_BINDING = 0x8919
+    RGB10_A2UI = 0x906F
+    INT_2_10_10_10_REV = 0x8D9F
+    TRANSFORM_FEEDBACK = 0x8E22
+    TRANSFORM_FEEDBACK_PAUSED = 0x8E23
+    TRANSFORM_FEEDBACK_ACTIVE = 0x8E24
+    TRANSFORM_FEEDBACK_BINDING = 0x8E25
+    TEXTURE_IMMUTABLE_FORMAT = 0x912F
+    MAX_ELEMENT_INDEX = 0x8D6B
+    TEXTURE_IMMUTABLE_LEVELS = 0x82DF
+    TIMEOUT_IGNORED = -1
+    MAX_CLIENT_WAIT_TIMEOUT_WEBGL = 0x9247
+    def copyBufferSubData(self, readTarget: int, writeTarget: int, readOffset: int, writeOffset: int, size: int) -> None:
+        self._append_procedure("copyBufferSubData", (readTarget, writeTarget, readOffset, writeOffset, size))
+    def getBufferSubData(self, target: int, srcByteOffset: int, dstBuffer: Any, dstOffset: int = 0, length: int = 0) -> None:
+        self._append_procedure("getBufferSubData", (target, srcByteOffset, dstBuffer, dstOffset, length))
+    def blitFramebuffer(self, srcX0: int, srcY0: int, srcX1: int, srcY1: int, dstX0: int, dstY0: int, dstX1: int, dstY1: int, mask: int, filter: int) -> None:
+        self._append_procedure("blitFramebuffer", (srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter))
+    def framebufferTextureLayer(self, target: int, attachment: int, texture: Optional[WebGLTexture], level: int, layer: int) -> None:
+        self._append_procedure("framebufferTextureLayer", (target, attachment, texture, level, layer))
+    def invalidateFramebuffer(self, target: int, attachments: Any) -> None:
+        self._append_procedure("invalidateFramebuffer", (target, attachments))
+    def invalidateSubFramebuffer(self, target: int, attachments: Any, x: int, y: int, width: int, height: int) -> None:
+        self._append_procedure("invalidateSubFramebuffer", (target, attachments, x, y, width, height))
+    def readBuffer(self, src: int) -> None:
+        self._append_procedure("readBuffer", (src,))
+    def getInternalformatParameter(self, target: int, internalformat: int, pname: int) -> Any:
+        return self._invoke_function("getInternalformatParameter", target, internalformat, pname)
+    def renderbufferStorageMultisample(self, target: int, samples: int, internalformat: int, width: int, height: int) -> None:
+        self._append_procedure("renderbufferStorageMultisample", (target, samples, internalformat, width, height))
+    def texStorage2D(self, target: int, levels: int, internalformat: int, width: int, height: int) -> None:
+        self._append_procedure("texStorage2D", (target, levels, internalformat, width, height))
+    def texStorage3D(self, target: int, levels: int, internalformat: int, width: int, height: int, depth: int) -> None:
+        self._append_procedure("texStorage3D", (target, levels, internalformat, width, height, depth))
+    def texImage3D(self, *args) -> None:
+        self._append_procedure("texImage3D", args)
+    def texSubImage3D(self, *args) -> None:
+        self._append_procedure("texSubImage3D", args)
+    def copyTexSubImage3D(self, target: int, level: int, xoffset: int, yoffset: int, zoffset: int, x: int, y: int, width: int, height: int) -> None:
+        self._append_procedure("copyTexSubImage3D", (target, level, xoffset, yoffset, zoffset, x, y, width, height))
+    def compressedTexImage3D(self, *args) -> None:
+        self._append_procedure("compressedTexImage3D", args)
+    def compressedTexSubImage3D(self, *args) -> None:
+        self._append_procedure("compressedTexSubImage3D", args)
+    def getFragDataLocation(self, program: WebGLProgram, name: str) -> Any:
+        return self._invoke_function("getFragDataLocation", program, name)
+    def uniform1ui(self, location: Optional[WebGLUniformLocation], v0: int) -> None:
+        self._append_procedure("uniform1ui", (location, v0))
+    def uniform2ui(self, location: Optional[WebGLUniformLocation], v0: int, v1: int) -> None:
+        self._append_procedure("uniform2ui", (location, v0, v1))
+    def uniform3ui(self, location: Optional[WebGLUniformLocation], v0: int, v1: int, v2: int) -> None:
+        self._append_procedure("uniform3ui", (location, v0, v1, v2))
+    def uniform4ui(self, location: Optional[WebGLUniformLocation], v0: int, v1: int, v2: int, v3: int) -> None:
+        self._append_procedure("uniform4ui", (location, v0, v1, v2, v3))
+    def uniform1uiv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform1uiv", (location, data, srcOffset, srcLength))
+    def uniform2uiv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform2uiv", (location, data, srcOffset, srcLength))
+    def uniform3uiv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform3uiv", (location, data, srcOffset, srcLength))
+    def uniform4uiv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform4uiv", (location, data, srcOffset, srcLength))
+    def uniformMatrix3x2fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix3x2fv", (location, transpose, data, srcOffset, srcLength))
+    def uniformMatrix4x2fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix4x2fv", (location, transpose, data, srcOffset, srcLength))
+    def uniformMatrix2x3fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix2x3fv", (location, transpose, data, srcOffset, srcLength))
+    def uniformMatrix4x3fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix4x3fv", (location, transpose, data, srcOffset, srcLength))
+    def uniformMatrix2x4fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix2x4fv", (location, transpose, data, srcOffset, srcLength))
+    def uniformMatrix3x4fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix3x4fv", (location, transpose, data, srcOffset, srcLength))
+    def vertexAttribI4i(self, index: int, x: int, y: int, z: int, w: int) -> None:
+        self._append_procedure("vertexAttribI4i", (index, x, y, z, w))
+    def vertexAttribI4iv(self, index: int, values: Any) -> None:
+        self._append_procedure("vertexAttribI4iv", (index, values))
+    def vertexAttribI4ui(self, index: int, x: int, y: int, z: int, w: int) -> None:
+        self._append_procedure("vertexAttribI4ui", (index, x, y, z, w))
+    def vertexAttribI4uiv(self, index: int, values: Any) -> None:
+        self._append_procedure("vertexAttribI4uiv", (index, values))
+    def vertexAttribIPointer(self, index: int, size: int, type: int, stride: int, offset: int) -> None:
+        self._append_procedure("vertexAttribIPointer", (index, size, type, stride, offset))
+    def vertexAttribDivisor(self, index: int, divisor: int) -> None:
+        self._append_procedure("vertexAttribDivisor", (index, divisor))
+    def drawArraysInstanced(self, mode: int, first: int, count: int, instanceCount: int) -> None:
+        self._append_procedure("drawArraysInstanced", (mode, first, count, instanceCount))
+    def drawElementsInstanced(self, mode: int, count: int, type: int, offset: int, instanceCount: int) -> None:
+        self._append_procedure("drawElementsInstanced", (mode, count, type, offset, instanceCount))
+    def drawRangeElements(self, mode: int, start: int, end: int, count: int, type: int, offset: int) -> None:
+        self._append_procedure("drawRangeElements", (mode, start, end, count, type, offset))
+    def drawBuffers(self, buffers: Any) -> None:
+        self._append_procedure("drawBuffers", (buffers,))
+    def clearBufferfv(self, buffer: int, drawbuffer: int, values: Any, srcOffset: int = 0) -> None:
+        self._append_procedure("clearBufferfv", (buffer, drawbuffer, values, srcOffset))
+    def clearBufferiv(self, buffer: int, drawbuffer: int, values: Any, srcOffset: int = 0) -> None:
+        self._append_procedure("clearBufferiv", (buffer, drawbuffer, values, srcOffset))
+    def clearBufferuiv(self, buffer: int, drawbuffer: int, values: Any, srcOffset: int = 0) -> None:
+        self._append_procedure("clearBufferuiv", (buffer, drawbuffer, values, srcOffset))
+    def clearBufferfi(self, buffer: int, drawbuffer: int, depth: float, stencil: int) -> None:
+        self._append_procedure("clearBufferfi", (buffer, drawbuffer, depth, stencil))
+    def createQuery(self) -> WebGLQuery:
+        return self._invoke_constructor("createQuery", "WebGLQuery")
+    def deleteQuery(self, query: Optional[WebGLQuery]) -> None:
+        self._append_procedure("deleteQuery", (query,))
+    def isQuery(self, query: Optional[WebGLQuery]) -> Any:
+        return self._invoke_function("isQuery", query)
+    def beginQuery(self, target: int, query: WebGLQuery) -> None:
+        self._append_procedure("beginQuery", (target, query))
+    def endQuery(self, target: int) -> None:
+        self._append_procedure("endQuery", (target,))
+    def getQuery(self, target: int, pname: int) -> Optional[WebGLQuery]:
+        return self._invoke_function("getQuery", target, pname)
+    def getQueryParameter(self, query: WebGLQuery, pname: int) -> Any:
+        return self._invoke_function("getQueryParameter", query, pname)
+    def createSampler(self) -> WebGLSampler:
+        return self._invoke_constructor("createSampler", "WebGLSampler")
+    def deleteSampler(self, sampler: Optional[WebGLSampler]) -> None:
+        self._append_procedure("deleteSampler", (sampler,))
+    def isSampler(self, sampler: Optional[WebGLSampler]) -> Any:
+        return self._invoke_function("isSampler", sampler)
+    def bindSampler(self, unit: int, sampler: Optional[WebGLSampler]) -> None:
+        self._append_procedure("bindSampler", (unit, sampler))
+    def samplerParameteri(self, sampler: WebGLSampler, pname: int, param: int) -> None:
+        self._append_procedure("samplerParameteri", (sampler, pname, param))
+    def samplerParameterf(self, sampler: WebGLSampler, pname: int, param: float) -> None:
+        self._append_procedure("samplerParameterf", (sampler, pname, param))
+    def getSamplerParameter(self, sampler: WebGLSampler, pname: int) -> Any:
+        return self._invoke_function("getSamplerParameter", sampler, pname)
+    def fenceSync(self, condition: int, flags: int) -> Optional[WebGLSync]:
+        return self._invoke_function("fenceSync", condition, flags)
+    def isSync(self, sync: Optional[WebGLSync]) -> Any:
+        return self._invoke_function("isSync", sync)
+    def deleteSync(self, sync: Optional[WebGLSync]) -> None:
+        self._append_procedure("deleteSync", (sync,))
+    def clientWaitSync(self, sync: WebGLSync, flags: int, timeout: int) -> Any:
+        return self._invoke_function("clientWaitSync", sync, flags, timeout)
+    def waitSync(self, sync: WebGLSync, flags: int, timeout: int) -> None:
+        self._append_procedure("waitSync", (sync, flags, timeout))
+    def getSyncParameter(self, sync: WebGLSync, pname: int) -> Any:
+        return self._invoke_function("getSyncParameter", sync, pname)
+    def createTransformFeedback(self) -> WebGLTransformFeedback:
+        return self._invoke_constructor("createTransformFeedback", "WebGLTransformFeedback")
+    def deleteTransformFeedback(self, tf: Optional[WebGLTransformFeedback]) -> None:
+        self._append_procedure("deleteTransformFeedback", (tf,))
+    def isTransformFeedback(self, tf: Optional[WebGLTransformFeedback]) -> Any:
+        return self._invoke_function("isTransformFeedback", tf)
+    def bindTransformFeedback(self, target: int, tf: Optional[WebGLTransformFeedback]) -> None:
+        self._append_procedure("bindTransformFeedback", (target, tf))
+    def beginTransformFeedback(self, primitiveMode: int) -> None:
+        self._append_procedure("beginTransformFeedback", (primitiveMode,))
+    def endTransformFeedback(self) -> None:
+        self._append_procedure("endTransformFeedback", ())
+    def transformFeedbackVaryings(self, program: WebGLProgram, varyings: Any, bufferMode: int) -> None:
+        self._append_procedure("transformFeedbackVaryings", (program, varyings, bufferMode))
+    def getTransformFeedbackVarying(self, program: WebGLProgram, index: int) -> Any:
+        return self._invoke_function("getTransformFeedbackVarying", program, index)
+    def pauseTransformFeedback(self) -> None:
+        self._append_procedure("pauseTransformFeedback", ())
+    def resumeTransformFeedback(self) -> None:
+        self._append_procedure("resumeTransformFeedback", ())
+    def bindBufferBase(self, target: int, index: int, buffer: Optional[WebGLBuffer]) -> None:
+        self._append_procedure("bindBufferBase", (target, index, buffer))
+    def bindBufferRange(self, target: int, index: int, buffer: Optional[WebGLBuffer], offset: int, size: int) -> None:
+        self._append_procedure("bindBufferRange", (target, index, buffer, offset, size))
+    def getIndexedParameter(self, target: int, index: int) -> Any:
+        return self._invoke_function("getIndexedParameter", target, index)
+    def getUniformIndices(self, program: WebGLProgram, uniformNames: Any) -> Any:
+        return self._invoke_function("getUniformIndices", program, uniformNames)
+    def getActiveUniforms(self, program: WebGLProgram, uniformIndices: Any, pname: int) -> Any:
+        return self._invoke_function("getActiveUniforms", program, uniformIndices, pname)
+    def getUniformBlockIndex(self, program: WebGLProgram, uniformBlockName: str) -> Any:
+        return self._invoke_function("getUniformBlockIndex", program, uniformBlockName)
+    def getActiveUniformBlockParameter(self, program: WebGLProgram, uniformBlockIndex: int, pname: int) -> Any:
+        return self._invoke_function("getActiveUniformBlockParameter", program, uniformBlockIndex, pname)
+    def getActiveUniformBlockName(self, program: WebGLProgram, uniformBlockIndex: int) -> Any:
+        return self._invoke_function("getActiveUniformBlockName", program, uniformBlockIndex)
+    def uniformBlockBinding(self, program: WebGLProgram, uniformBlockIndex: int, uniformBlockBinding: int) -> None:
+        self._append_procedure("uniformBlockBinding", (program, uniformBlockIndex, uniformBlockBinding))
+    def createVertexArray(self) -> WebGLVertexArrayObject:
+        return self._invoke_constructor("createVertexArray", "WebGLVertexArrayObject")
+    def deleteVertexArray(self, vertexArray: Optional[WebGLVertexArrayObject]) -> None:
+        self._append_procedure("deleteVertexArray", (vertexArray,))
+    def isVertexArray(self, vertexArray: Optional[WebGLVertexArrayObject]) -> Any:
+        return self._invoke_function("isVertexArray", vertexArray)
+    def bindVertexArray(self, array: Optional[WebGLVertexArrayObject]) -> None:
+        self._append_procedure("bindVertexArray", (array,))
+
+
+@register
+class WebGL2RenderingContextOverloads(ProxyInterfaceBase):
+    __slots__ = ()
+    def bufferData(self, *args) -> None:
+        self._append_procedure("bufferData", args)
+    def bufferSubData(self, *args) -> None:
+        self._append_procedure("bufferSubData", args)
+    def texImage2D(self, *args) -> None:
+        self._append_procedure("texImage2D", args)
+    def texSubImage2D(self, *args) -> None:
+        self._append_procedure("texSubImage2D", args)
+    def compressedTexImage2D(self, *args) -> None:
+        self._append_procedure("compressedTexImage2D", args)
+    def compressedTexSubImage2D(self, *args) -> None:
+        self._append_procedure("compressedTexSubImage2D", args)
+    def uniform1fv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform1fv", (location, data, srcOffset, srcLength))
+    def uniform2fv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform2fv", (location, data, srcOffset, srcLength))
+    def uniform3fv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform3fv", (location, data, srcOffset, srcLength))
+    def uniform4fv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform4fv", (location, data, srcOffset, srcLength))
+    def uniform1iv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform1iv", (location, data, srcOffset, srcLength))
+    def uniform2iv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform2iv", (location, data, srcOffset, srcLength))
+    def uniform3iv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform3iv", (location, data, srcOffset, srcLength))
+    def uniform4iv(self, location: Optional[WebGLUniformLocation], data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniform4iv", (location, data, srcOffset, srcLength))
+    def uniformMatrix2fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix2fv", (location, transpose, data, srcOffset, srcLength))
+    def uniformMatrix3fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix3fv", (location, transpose, data, srcOffset, srcLength))
+    def uniformMatrix4fv(self, location: Optional[WebGLUniformLocation], transpose: bool, data: Any, srcOffset: int = 0, srcLength: int = 0) -> None:
+        self._append_procedure("uniformMatrix4fv", (location, transpose, data, srcOffset, srcLength))
+    def readPixels(self, *args) -> None:
+        self._append_procedure("readPixels", args)
+
+
+@register
+class WebGL2RenderingContext(WebGLRenderingContextBase, WebGL2RenderingContextBase, WebGL2RenderingContextOverloads):
+    __slots__ = ()
+
+
+METHODS = [
+    "getContextAttributes",
+    "isContextLost",
+    "getSupportedExtensions",
+    "getExtension",
+    "drawingBufferStorage",
+    "activeTexture",
+    "attachShader",
+    "bindAttribLocation",
+    "bindBuffer",
+    "bindFramebuffer",
+    "bindRenderbuffer",
+    "bindTexture",
+    "blendColor",
+    "blendEquation",
+    "blendEquationSeparate",
+    "blendFunc",
+    "blendFuncSeparate",
+    "checkFramebufferStatus",
+    "clear",
+    "clearColor",
+    "clearDepth",
+    "clearStencil",
+    "colorMask",
+    "compileShader",
+    "copyTexImage2D",
+    "copyTexSubImage2D",
+    "createBuffer",
+    "createFramebuffer",
+    "createProgram",
+    "createRenderbuffer",
+    "createShader",
+    "createTexture",
+    "cullFace",
+    "deleteBuffer",
+    "deleteFramebuffer",
+    "deleteProgram",
+    "deleteRenderbuffer",
+    "deleteShader",
+    "deleteTexture",
+    "depthFunc",
+    "depthMask",
+    "depthRange",
+    "detachShader",
+    "disable",
+    "disableVertexAttribArray",
+    "drawArrays",
+    "drawElements",
+    "enable",
+    "enableVertexAttribArray",
+    "finish",
+    "flush",
+    "framebufferRenderbuffer",
+    "framebufferTexture2D",
+    "frontFace",
+    "generateMipmap",
+    "getActiveAttrib",
+    "getActiveUniform",
+    "getAttachedShaders",
+    "getAttribLocation",
+    "getBufferParameter",
+    "getParameter",
+    "getError",
+    "getFramebufferAttachmentParameter",
+    "getProgramParameter",
+    "getProgramInfoLog",
+    "getRenderbufferParameter",
+    "getShaderParameter",
+    "getShaderPrecisionFormat",
+    "getShaderInfoLog",
+    "getShaderSource",
+    "getTexParameter",
+    "getUniform",
+    "getUniformLocation",
+    "getVertexAttrib",
+    "getVertexAttribOffset",
+    "hint",
+    "isBuffer",
+    "isEnabled",
+    "isFramebuffer",
+    "isProgram",
+    "isRenderbuffer",
+    "isShader",
+    "isTexture",
+    "lineWidth",
+    "linkProgram",
+    "pixelStorei",
+    "polygonOffset",
+    "renderbufferStorage",
+    "sampleCoverage",
+    "scissor",
+    "shaderSource",
+    "stencilFunc",
+    "stencilFuncSeparate",
+    "stencilMask",
+    "stencilMaskSeparate",
+    "stencilOp",
+    "stencilOpSeparate",
+    "texParameterf",
+    "texParameteri",
+    "uniform1f",
+    "uniform2f",
+    "uniform3f",
+    "uniform4f",
+    "uniform1i",
+    "uniform2i",
+    "uniform3i",
+    "uniform4i",
+    "useProgram",
+    "validateProgram",
+    "vertexAttrib1f",
+    "vertexAttrib2f",
+    "vertexAttrib3f",
+    "vertexAttrib4f",
+    "vertexAttrib1fv",
+    "vertexAttrib2fv",
+    "vertexAttrib3fv",
+    "vertexAttrib4fv",
+    "vertexAttribPointer",
+    "viewport",
+    "bufferData",
+    "bufferSubData",
+    "compressedTexImage2D",
+    "compressedTexSubImage2D",
+    "readPixels",
+    "texImage2D",
+    "texSubImage2D",
+    "uniform1fv",
+    "uniform2fv",
+    "uniform3fv",
+    "uniform4fv",
+    "uniform1iv",
+    "uniform2iv",
+    "uniform3iv",
+    "uniform4iv",
+    "uniformMatrix2fv",
+    "uniformMatrix3fv",
+    "uniformMatrix4fv",
+    "copyBufferSubData",
+    "getBufferSubData",
+    "blitFramebuffer",
+    "framebufferTextureLayer",
+    "invalidateFramebuffer",
+    "invalidateSubFramebuffer",
+    "readBuffer",
+    "getInternalformatParameter",
+    "renderbufferStorageMultisample",
+    "texStorage2D",
+    "texStorage3D",
+    "texImage3D",
+    "texSubImage3D",
+    "copyTexSubImage3D",
+    "compressedTexImage3D",
+    "compressedTexSubImage3D",
+    "getFragDataLocation",
+    "uniform1ui",
+    "uniform2ui",
+    "uniform3ui",
+    "uniform4ui",
+    "uniform1uiv",
+    "uniform2uiv",
+    "uniform3uiv",
+    "uniform4uiv",
+    "uniformMatrix3x2fv",
+    "uniformMatrix4x2fv",
+    "uniformMatrix2x3fv",
+    "uniformMatrix4x3fv",
+    "uniformMatrix2x4fv",
+    "uniformMatrix3x4fv",
+    "vertexAttribI4i",
+    "vertexAttribI4iv",
+    "vertexAttribI4ui",
+    "vertexAttribI4uiv",
+    "vertexAttribIPointer",
+    "vertexAttribDivisor",
+    "drawArraysInstanced",
+    "drawElementsInstanced",
+    "drawRangeElements",
+    "drawBuffers",
+    "clearBufferfv",
+    "clearBufferiv",
+    "clearBufferuiv",
+    "clearBufferfi",
+    "createQuery",
+    "deleteQuery",
+    "isQuery",
+    "beginQuery",
+    "endQuery",
+    "getQuery",
+    "getQueryParameter",
+    "createSampler",
+    "deleteSampler",
+    "isSampler",
+    "bindSampler",
+    "samplerParameteri",
+    "samplerParameterf",
+    "getSamplerParameter",
+    "fenceSync",
+    "isSync",
+    "deleteSync",
+    "clientWaitSync",
+    "waitSync",
+    "getSyncParameter",
+    "createTransformFeedback",
+    "deleteTransformFeedback",
+    "isTransformFeedback",
+    "bindTransformFeedback",
+    "beginTransformFeedback",
+    "endTransformFeedback",
+    "transformFeedbackVaryings",
+    "getTransformFeedbackVarying",
+    "pauseTransformFeedback",
+    "resumeTransformFeedback",
+    "bindBufferBase",
+    "bindBufferRange",
+    "getIndexedParameter",
+    "getUniformIndices",
+    "getActiveUniforms",
+    "getUniformBlockIndex",
+    "getActiveUniformBlockParameter",
+    "getActiveUniformBlockName",
+    "uniformBlockBinding",
+    "createVertexArray",
+    "deleteVertexArray",
+    "isVertexArray",
+    "bindVertexArray",
+]
+
+
+ARGUMENTS = {
+    "getContextAttributes": (
+        (),
+    ),
+    "isContextLost": (
+        (),
+    ),
+    "getSupportedExtensions": (
+        (),
+    ),
+    "getExtension": (
+        (('name', 'DOMString', False),),
+    ),
+    "drawingBufferStorage": (
+        (('sizedFormat', 'GLenum', False), ('width', 'unsigned long', False), ('height', 'unsigned long', False)),
+    ),
+    "activeTexture": (
+        (('texture', 'GLenum', False),),
+    ),
+    "attachShader": (
+        (('program', 'WebGLProgram', False), ('shader', 'WebGLShader', False)),
+    ),
+    "bindAttribLocation": (
+        (('program', 'WebGLProgram', False), ('index', 'GLuint', False), ('name', 'DOMString', False)),
+    ),
+    "bindBuffer": (
+        (('target', 'GLenum', False), ('buffer', 'WebGLBuffer?', False)),
+    ),
+    "bindFramebuffer": (
+        (('target', 'GLenum', False), ('framebuffer', 'WebGLFramebuffer?', False)),
+    ),
+    "bindRenderbuffer": (
+        (('target', 'GLenum', False), ('renderbuffer', 'WebGLRenderbuffer?', False)),
+    ),
+    "bindTexture": (
+        (('target', 'GLenum', False), ('texture', 'WebGLTexture?', False)),
+    ),
+    "blendColor": (
+        (('red', 'GLclampf', False), ('green', 'GLclampf', False), ('blue', 'GLclampf', False), ('alpha', 'GLclampf', False)),
+    ),
+    "blendEquation": (
+        (('mode', 'GLenum', False),),
+    ),
+    "blendEquationSeparate": (
+        (('modeRGB', 'GLenum', False), ('modeAlpha', 'GLenum', False)),
+    ),
+    "blendFunc": (
+        (('sfactor', 'GLenum', False), ('dfactor', 'GLenum', False)),
+    ),
+    "blendFuncSeparate": (
+        (('srcRGB', 'GLenum', False), ('dstRGB', 'GLenum', False), ('srcAlpha', 'GLenum', False), ('dstAlpha', 'GLenum', False)),
+    ),
+    "checkFramebufferStatus": (
+        (('target', 'GLenum', False),),
+    ),
+    "clear": (
+        (('mask', 'GLbitfield', False),),
+    ),
+    "clearColor": (
+        (('red', 'GLclampf', False), ('green', 'GLclampf', False), ('blue', 'GLclampf', False), ('alpha', 'GLclampf', False)),
+    ),
+    "clearDepth": (
+        (('depth', 'GLclampf', False),),
+    ),
+    "clearStencil": (
+        (('s', 'GLint', False),),
+    ),
+    "colorMask": (
+        (('red', 'GLboolean', False), ('green', 'GLboolean', False), ('blue', 'GLboolean', False), ('alpha', 'GLboolean', False)),
+    ),
+    "compileShader": (
+        (('shader', 'WebGLShader', False),),
+    ),
+    "copyTexImage2D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLenum', False), ('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False)),
+    ),
+    "copyTexSubImage2D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "createBuffer": (
+        (),
+    ),
+    "createFramebuffer": (
+        (),
+    ),
+    "createProgram": (
+        (),
+    ),
+    "createRenderbuffer": (
+        (),
+    ),
+    "createShader": (
+        (('type', 'GLenum', False),),
+    ),
+    "createTexture": (
+        (),
+    ),
+    "cullFace": (
+        (('mode', 'GLenum', False),),
+    ),
+    "deleteBuffer": (
+        (('buffer', 'WebGLBuffer?', False),),
+    ),
+    "deleteFramebuffer": (
+        (('framebuffer', 'WebGLFramebuffer?', False),),
+    ),
+    "deleteProgram": (
+        (('program', 'WebGLProgram?', False),),
+    ),
+    "deleteRenderbuffer": (
+        (('renderbuffer', 'WebGLRenderbuffer?', False),),
+    ),
+    "deleteShader": (
+        (('shader', 'WebGLShader?', False),),
+    ),
+    "deleteTexture": (
+        (('texture', 'WebGLTexture?', False),),
+    ),
+    "depthFunc": (
+        (('func', 'GLenum', False),),
+    ),
+    "depthMask": (
+        (('flag', 'GLboolean', False),),
+    ),
+    "depthRange": (
+        (('zNear', 'GLclampf', False), ('zFar', 'GLclampf', False)),
+    ),
+    "detachShader": (
+        (('program', 'WebGLProgram', False), ('shader', 'WebGLShader', False)),
+    ),
+    "disable": (
+        (('cap', 'GLenum', False),),
+    ),
+    "disableVertexAttribArray": (
+        (('index', 'GLuint', False),),
+    ),
+    "drawArrays": (
+        (('mode', 'GLenum', False), ('first', 'GLint', False), ('count', 'GLsizei', False)),
+    ),
+    "drawElements": (
+        (('mode', 'GLenum', False), ('count', 'GLsizei', False), ('type', 'GLenum', False), ('offset', 'GLintptr', False)),
+    ),
+    "enable": (
+        (('cap', 'GLenum', False),),
+    ),
+    "enableVertexAttribArray": (
+        (('index', 'GLuint', False),),
+    ),
+    "finish": (
+        (),
+    ),
+    "flush": (
+        (),
+    ),
+    "framebufferRenderbuffer": (
+        (('target', 'GLenum', False), ('attachment', 'GLenum', False), ('renderbuffertarget', 'GLenum', False), ('renderbuffer', 'WebGLRenderbuffer?', False)),
+    ),
+    "framebufferTexture2D": (
+        (('target', 'GLenum', False), ('attachment', 'GLenum', False), ('textarget', 'GLenum', False), ('texture', 'WebGLTexture?', False), ('level', 'GLint', False)),
+    ),
+    "frontFace": (
+        (('mode', 'GLenum', False),),
+    ),
+    "generateMipmap": (
+        (('target', 'GLenum', False),),
+    ),
+    "getActiveAttrib": (
+        (('program', 'WebGLProgram', False), ('index', 'GLuint', False)),
+    ),
+    "getActiveUniform": (
+        (('program', 'WebGLProgram', False), ('index', 'GLuint', False)),
+    ),
+    "getAttachedShaders": (
+        (('program', 'WebGLProgram', False),),
+    ),
+    "getAttribLocation": (
+        (('program', 'WebGLProgram', False), ('name', 'DOMString', False)),
+    ),
+    "getBufferParameter": (
+        (('target', 'GLenum', False), ('pname', 'GLenum', False)),
+    ),
+    "getParameter": (
+        (('pname', 'GLenum', False),),
+    ),
+    "getError": (
+        (),
+    ),
+    "getFramebufferAttachmentParameter": (
+        (('target', 'GLenum', False), ('attachment', 'GLenum', False), ('pname', 'GLenum', False)),
+    ),
+    "getProgramParameter": (
+        (('program', 'WebGLProgram', False), ('pname', 'GLenum', False)),
+    ),
+    "getProgramInfoLog": (
+        (('program', 'WebGLProgram', False),),
+    ),
+    "getRenderbufferParameter": (
+        (('target', 'GLenum', False), ('pname', 'GLenum', False)),
+    ),
+    "getShaderParameter": (
+        (('shader', 'WebGLShader', False), ('pname', 'GLenum', False)),
+    ),
+    "getShaderPrecisionFormat": (
+        (('shadertype', 'GLenum', False), ('precisiontype', 'GLenum', False)),
+    ),
+    "getShaderInfoLog": (
+        (('shader', 'WebGLShader', False),),
+    ),
+    "getShaderSource": (
+        (('shader', 'WebGLShader', False),),
+    ),
+    "getTexParameter": (
+        (('target', 'GLenum', False), ('pname', 'GLenum', False)),
+    ),
+    "getUniform": (
+        (('program', 'WebGLProgram', False), ('location', 'WebGLUniformLocation', False)),
+    ),
+    "getUniformLocation": (
+        (('program', 'WebGLProgram', False), ('name', 'DOMString', False)),
+    ),
+    "getVertexAttrib": (
+        (('index', 'GLuint', False), ('pname', 'GLenum', False)),
+    ),
+    "getVertexAttribOffset": (
+        (('index', 'GLuint', False), ('pname', 'GLenum', False)),
+    ),
+    "hint": (
+        (('target', 'GLenum', False), ('mode', 'GLenum', False)),
+    ),
+    "isBuffer": (
+        (('buffer', 'WebGLBuffer?', False),),
+    ),
+    "isEnabled": (
+        (('cap', 'GLenum', False),),
+    ),
+    "isFramebuffer": (
+        (('framebuffer', 'WebGLFramebuffer?', False),),
+    ),
+    "isProgram": (
+        (('program', 'WebGLProgram?', False),),
+    ),
+    "isRenderbuffer": (
+        (('renderbuffer', 'WebGLRenderbuffer?', False),),
+    ),
+    "isShader": (
+        (('shader', 'WebGLShader?', False),),
+    ),
+    "isTexture": (
+        (('texture', 'WebGLTexture?', False),),
+    ),
+    "lineWidth": (
+        (('width', 'GLfloat', False),),
+    ),
+    "linkProgram": (
+        (('program', 'WebGLProgram', False),),
+    ),
+    "pixelStorei": (
+        (('pname', 'GLenum', False), ('param', 'GLint', False)),
+    ),
+    "polygonOffset": (
+        (('factor', 'GLfloat', False), ('units', 'GLfloat', False)),
+    ),
+    "renderbufferStorage": (
+        (('target', 'GLenum', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "sampleCoverage": (
+        (('value', 'GLclampf', False), ('invert', 'GLboolean', False)),
+    ),
+    "scissor": (
+        (('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "shaderSource": (
+        (('shader', 'WebGLShader', False), ('source', 'DOMString', False)),
+    ),
+    "stencilFunc": (
+        (('func', 'GLenum', False), ('ref', 'GLint', False), ('mask', 'GLuint', False)),
+    ),
+    "stencilFuncSeparate": (
+        (('face', 'GLenum', False), ('func', 'GLenum', False), ('ref', 'GLint', False), ('mask', 'GLuint', False)),
+    ),
+    "stencilMask": (
+        (('mask', 'GLuint', False),),
+    ),
+    "stencilMaskSeparate": (
+        (('face', 'GLenum', False), ('mask', 'GLuint', False)),
+    ),
+    "stencilOp": (
+        (('fail', 'GLenum', False), ('zfail', 'GLenum', False), ('zpass', 'GLenum', False)),
+    ),
+    "stencilOpSeparate": (
+        (('face', 'GLenum', False), ('fail', 'GLenum', False), ('zfail', 'GLenum', False), ('zpass', 'GLenum', False)),
+    ),
+    "texParameterf": (
+        (('target', 'GLenum', False), ('pname', 'GLenum', False), ('param', 'GLfloat', False)),
+    ),
+    "texParameteri": (
+        (('target', 'GLenum', False), ('pname', 'GLenum', False), ('param', 'GLint', False)),
+    ),
+    "uniform1f": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLfloat', False)),
+    ),
+    "uniform2f": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLfloat', False), ('y', 'GLfloat', False)),
+    ),
+    "uniform3f": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLfloat', False), ('y', 'GLfloat', False), ('z', 'GLfloat', False)),
+    ),
+    "uniform4f": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLfloat', False), ('y', 'GLfloat', False), ('z', 'GLfloat', False), ('w', 'GLfloat', False)),
+    ),
+    "uniform1i": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLint', False)),
+    ),
+    "uniform2i": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLint', False), ('y', 'GLint', False)),
+    ),
+    "uniform3i": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLint', False), ('y', 'GLint', False), ('z', 'GLint', False)),
+    ),
+    "uniform4i": (
+        (('location', 'WebGLUniformLocation?', False), ('x', 'GLint', False), ('y', 'GLint', False), ('z', 'GLint', False), ('w', 'GLint', False)),
+    ),
+    "useProgram": (
+        (('program', 'WebGLProgram?', False),),
+    ),
+    "validateProgram": (
+        (('program', 'WebGLProgram', False),),
+    ),
+    "vertexAttrib1f": (
+        (('index', 'GLuint', False), ('x', 'GLfloat', False)),
+    ),
+    "vertexAttrib2f": (
+        (('index', 'GLuint', False), ('x', 'GLfloat', False), ('y', 'GLfloat', False)),
+    ),
+    "vertexAttrib3f": (
+        (('index', 'GLuint', False), ('x', 'GLfloat', False), ('y', 'GLfloat', False), ('z', 'GLfloat', False)),
+    ),
+    "vertexAttrib4f": (
+        (('index', 'GLuint', False), ('x', 'GLfloat', False), ('y', 'GLfloat', False), ('z', 'GLfloat', False), ('w', 'GLfloat', False)),
+    ),
+    "vertexAttrib1fv": (
+        (('index', 'GLuint', False), ('values', 'Float32List', False)),
+    ),
+    "vertexAttrib2fv": (
+        (('index', 'GLuint', False), ('values', 'Float32List', False)),
+    ),
+    "vertexAttrib3fv": (
+        (('index', 'GLuint', False), ('values', 'Float32List', False)),
+    ),
+    "vertexAttrib4fv": (
+        (('index', 'GLuint', False), ('values', 'Float32List', False)),
+    ),
+    "vertexAttribPointer": (
+        (('index', 'GLuint', False), ('size', 'GLint', False), ('type', 'GLenum', False), ('normalized', 'GLboolean', False), ('stride', 'GLsizei', False), ('offset', 'GLintptr', False)),
+    ),
+    "viewport": (
+        (('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "bufferData": (
+        (('target', 'GLenum', False), ('size', 'GLsizeiptr', False), ('usage', 'GLenum', False)),
+        (('target', 'GLenum', False), ('data', 'AllowSharedBufferSource?', False), ('usage', 'GLenum', False)),
+        (('target', 'GLenum', False), ('srcData', 'AllowSharedBufferSource?', False), ('usage', 'GLenum', False)),
+        (('target', 'GLenum', False), ('srcData', 'ArrayBufferView', False), ('usage', 'GLenum', False), ('srcOffset', 'unsigned long long', False), ('length', 'GLuint', True)),
+    ),
+    "bufferSubData": (
+        (('target', 'GLenum', False), ('offset', 'GLintptr', False), ('data', 'AllowSharedBufferSource', False)),
+        (('target', 'GLenum', False), ('dstByteOffset', 'GLintptr', False), ('srcData', 'AllowSharedBufferSource', False)),
+        (('target', 'GLenum', False), ('dstByteOffset', 'GLintptr', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', False), ('length', 'GLuint', True)),
+    ),
+    "compressedTexImage2D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False), ('data', 'ArrayBufferView', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False), ('imageSize', 'GLsizei', False), ('offset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', True), ('srcLengthOverride', 'GLuint', True)),
+    ),
+    "compressedTexSubImage2D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('data', 'ArrayBufferView', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('imageSize', 'GLsizei', False), ('offset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', True), ('srcLengthOverride', 'GLuint', True)),
+    ),
+    "readPixels": (
+        (('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('pixels', 'ArrayBufferView?', False)),
+        (('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('dstData', 'ArrayBufferView?', False)),
+        (('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('offset', 'GLintptr', False)),
+        (('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('dstData', 'ArrayBufferView', False), ('dstOffset', 'unsigned long long', False)),
+    ),
+    "texImage2D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('pixels', 'ArrayBufferView?', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('source', 'TexImageSource', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('pboOffset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('source', 'TexImageSource', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', False)),
+    ),
+    "texSubImage2D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('pixels', 'ArrayBufferView?', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('source', 'TexImageSource', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('pboOffset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('source', 'TexImageSource', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', False)),
+    ),
+    "uniform1fv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Float32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform2fv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Float32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform3fv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Float32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform4fv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Float32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform1iv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Int32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Int32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform2iv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Int32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Int32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform3iv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Int32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Int32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform4iv": (
+        (('location', 'WebGLUniformLocation?', False), ('v', 'Int32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Int32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix2fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('value', 'Float32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix3fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('value', 'Float32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix4fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('value', 'Float32List', False)),
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "copyBufferSubData": (
+        (('readTarget', 'GLenum', False), ('writeTarget', 'GLenum', False), ('readOffset', 'GLintptr', False), ('writeOffset', 'GLintptr', False), ('size', 'GLsizeiptr', False)),
+    ),
+    "getBufferSubData": (
+        (('target', 'GLenum', False), ('srcByteOffset', 'GLintptr', False), ('dstBuffer', 'ArrayBufferView', False), ('dstOffset', 'unsigned long long', True), ('length', 'GLuint', True)),
+    ),
+    "blitFramebuffer": (
+        (('srcX0', 'GLint', False), ('srcY0', 'GLint', False), ('srcX1', 'GLint', False), ('srcY1', 'GLint', False), ('dstX0', 'GLint', False), ('dstY0', 'GLint', False), ('dstX1', 'GLint', False), ('dstY1', 'GLint', False), ('mask', 'GLbitfield', False), ('filter', 'GLenum', False)),
+    ),
+    "framebufferTextureLayer": (
+        (('target', 'GLenum', False), ('attachment', 'GLenum', False), ('texture', 'WebGLTexture?', False), ('level', 'GLint', False), ('layer', 'GLint', False)),
+    ),
+    "invalidateFramebuffer": (
+        (('target', 'GLenum', False), ('attachments', 'sequence<GLenum>', False)),
+    ),
+    "invalidateSubFramebuffer": (
+        (('target', 'GLenum', False), ('attachments', 'sequence<GLenum>', False), ('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "readBuffer": (
+        (('src', 'GLenum', False),),
+    ),
+    "getInternalformatParameter": (
+        (('target', 'GLenum', False), ('internalformat', 'GLenum', False), ('pname', 'GLenum', False)),
+    ),
+    "renderbufferStorageMultisample": (
+        (('target', 'GLenum', False), ('samples', 'GLsizei', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "texStorage2D": (
+        (('target', 'GLenum', False), ('levels', 'GLsizei', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "texStorage3D": (
+        (('target', 'GLenum', False), ('levels', 'GLsizei', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False)),
+    ),
+    "texImage3D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('pboOffset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('source', 'TexImageSource', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('srcData', 'ArrayBufferView?', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('border', 'GLint', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', False)),
+    ),
+    "texSubImage3D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('zoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('pboOffset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('zoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('source', 'TexImageSource', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('zoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('format', 'GLenum', False), ('type', 'GLenum', False), ('srcData', 'ArrayBufferView?', False), ('srcOffset', 'unsigned long long', True)),
+    ),
+    "copyTexSubImage3D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('zoffset', 'GLint', False), ('x', 'GLint', False), ('y', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False)),
+    ),
+    "compressedTexImage3D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('border', 'GLint', False), ('imageSize', 'GLsizei', False), ('offset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('internalformat', 'GLenum', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('border', 'GLint', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', True), ('srcLengthOverride', 'GLuint', True)),
+    ),
+    "compressedTexSubImage3D": (
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('zoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('format', 'GLenum', False), ('imageSize', 'GLsizei', False), ('offset', 'GLintptr', False)),
+        (('target', 'GLenum', False), ('level', 'GLint', False), ('xoffset', 'GLint', False), ('yoffset', 'GLint', False), ('zoffset', 'GLint', False), ('width', 'GLsizei', False), ('height', 'GLsizei', False), ('depth', 'GLsizei', False), ('format', 'GLenum', False), ('srcData', 'ArrayBufferView', False), ('srcOffset', 'unsigned long long', True), ('srcLengthOverride', 'GLuint', True)),
+    ),
+    "getFragDataLocation": (
+        (('program', 'WebGLProgram', False), ('name', 'DOMString', False)),
+    ),
+    "uniform1ui": (
+        (('location', 'WebGLUniformLocation?', False), ('v0', 'GLuint', False)),
+    ),
+    "uniform2ui": (
+        (('location', 'WebGLUniformLocation?', False), ('v0', 'GLuint', False), ('v1', 'GLuint', False)),
+    ),
+    "uniform3ui": (
+        (('location', 'WebGLUniformLocation?', False), ('v0', 'GLuint', False), ('v1', 'GLuint', False), ('v2', 'GLuint', False)),
+    ),
+    "uniform4ui": (
+        (('location', 'WebGLUniformLocation?', False), ('v0', 'GLuint', False), ('v1', 'GLuint', False), ('v2', 'GLuint', False), ('v3', 'GLuint', False)),
+    ),
+    "uniform1uiv": (
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Uint32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform2uiv": (
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Uint32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform3uiv": (
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Uint32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniform4uiv": (
+        (('location', 'WebGLUniformLocation?', False), ('data', 'Uint32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix3x2fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix4x2fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix2x3fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix4x3fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix2x4fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "uniformMatrix3x4fv": (
+        (('location', 'WebGLUniformLocation?', False), ('transpose', 'GLboolean', False), ('data', 'Float32List', False), ('srcOffset', 'unsigned long long', True), ('srcLength', 'GLuint', True)),
+    ),
+    "vertexAttribI4i": (
+        (('index', 'GLuint', False), ('x', 'GLint', False), ('y', 'GLint', False), ('z', 'GLint', False), ('w', 'GLint', False)),
+    ),
+    "vertexAttribI4iv": (
+        (('index', 'GLuint', False), ('values', 'Int32List', False)),
+    ),
+    "vertexAttribI4ui": (
+        (('index', 'GLuint', False), ('x', 'GLuint', False), ('y', 'GLuint', False), ('z', 'GLuint', False), ('w', 'GLuint', False)),
+    ),
+    "vertexAttribI4uiv": (
+        (('index', 'GLuint', False), ('values', 'Uint32List', False)),
+    ),
+    "vertexAttribIPointer": (
+        (('index', 'GLuint', False), ('size', 'GLint', False), ('type', 'GLenum', False), ('stride', 'GLsizei', False), ('offset', 'GLintptr', False)),
+    ),
+    "vertexAttribDivisor": (
+        (('index', 'GLuint', False), ('divisor', 'GLuint', False)),
+    ),
+    "drawArraysInstanced": (
+        (('mode', 'GLenum', False), ('first', 'GLint', False), ('count', 'GLsizei', False), ('instanceCount', 'GLsizei', False)),
+    ),
+    "drawElementsInstanced": (
+        (('mode', 'GLenum', False), ('count', 'GLsizei', False), ('type', 'GLenum', False), ('offset', 'GLintptr', False), ('instanceCount', 'GLsizei', False)),
+    ),
+    "drawRangeElements": (
+        (('mode', 'GLenum', False), ('start', 'GLuint', False), ('end', 'GLuint', False), ('count', 'GLsizei', False), ('type', 'GLenum', False), ('offset', 'GLintptr', False)),
+    ),
+    "drawBuffers": (
+        (('buffers', 'sequence<GLenum>', False),),
+    ),
+    "clearBufferfv": (
+        (('buffer', 'GLenum', False), ('drawbuffer', 'GLint', False), ('values', 'Float32List', False), ('srcOffset', 'unsigned long long', True)),
+    ),
+    "clearBufferiv": (
+        (('buffer', 'GLenum', False), ('drawbuffer', 'GLint', False), ('values', 'Int32List', False), ('srcOffset', 'unsigned long long', True)),
+    ),
+    "clearBufferuiv": (
+        (('buffer', 'GLenum', False), ('drawbuffer', 'GLint', False), ('values', 'Uint32List', False), ('srcOffset', 'unsigned long long', True)),
+    ),
+    "clearBufferfi": (
+        (('buffer', 'GLenum', False), ('drawbuffer', 'GLint', False), ('depth', 'GLfloat', False), ('stencil', 'GLint', False)),
+    ),
+    "createQuery": (
+        (),
+    ),
+    "deleteQuery": (
+        (('query', 'WebGLQuery?', False),),
+    ),
+    "isQuery": (
+        (('query', 'WebGLQuery?', False),),
+    ),
+    "beginQuery": (
+        (('target', 'GLenum', False), ('query', 'WebGLQuery', False)),
+    ),
+    "endQuery": (
+        (('target', 'GLenum', False),),
+    ),
+    "getQuery": (
+        (('target', 'GLenum', False), ('pname', 'GLenum', False)),
+    ),
+    "getQueryParameter": (
+        (('query', 'WebGLQuery', False), ('pname', 'GLenum', False)),
+    ),
+    "createSampler": (
+        (),
+    ),
+    "deleteSampler": (
+        (('sampler', 'WebGLSampler?', False),),
+    ),
+    "isSampler": (
+        (('sampler', 'WebGLSampler?', False),),
+    ),
+    "bindSampler": (
+        (('unit', 'GLuint', False), ('sampler', 'WebGLSampler?', False)),
+    ),
+    "samplerParameteri": (
+        (('sampler', 'WebGLSampler', False), ('pname', 'GLenum', False), ('param', 'GLint', False)),
+    ),
+    "samplerParameterf": (
+        (('sampler', 'WebGLSampler', False), ('pname', 'GLenum', False), ('param', 'GLfloat', False)),
+    ),
+    "getSamplerParameter": (
+        (('sampler', 'WebGLSampler', False), ('pname', 'GLenum', False)),
+    ),
+    "fenceSync": (
+        (('condition', 'GLenum', False), ('flags', 'GLbitfield', False)),
+    ),
+    "isSync": (
+        (('sync', 'WebGLSync?', False),),
+    ),
+    "deleteSync": (
+        (('sync', 'WebGLSync?', False),),
+    ),
+    "clientWaitSync": (
+        (('sync', 'WebGLSync', False), ('flags', 'GLbitfield', False), ('timeout', 'GLuint64', False)),
+    ),
+    "waitSync": (
+        (('sync', 'WebGLSync', False), ('flags', 'GLbitfield', False), ('timeout', 'GLint64', False)),
+    ),
+    "getSyncParameter": (
+        (('sync', 'WebGLSync', False), ('pname', 'GLenum', False)),
+    ),
+    "createTransformFeedback": (
+        (),
+    ),
+    "deleteTransformFeedback": (
+        (('tf', 'WebGLTransformFeedback?', False),),
+    ),
+    "isTransformFeedback": (
+        (('tf', 'WebGLTransformFeedback?', False),),
+    ),
+    "bindTransformFeedback": (
+        (('target', 'GLenum', False), ('tf', 'WebGLTransformFeedback?', False)),
+    ),
+    "beginTransformFeedback": (
+        (('primitiveMode', 'GLenum', False),),
+    ),
+    "endTransformFeedback": (
+        (),
+    ),
+    "transformFeedbackVaryings": (
+        (('program', 'WebGLProgram', False), ('varyings', 'sequence<DOMString>', False), ('bufferMode', 'GLenum', False)),
+    ),
+    "getTransformFeedbackVarying": (
+        (('program', 'WebGLProgram', False), ('index', 'GLuint', False)),
+    ),
+    "pauseTransformFeedback": (
+        (),
+    ),
+    "resumeTransformFeedback": (
+        (),
+    ),
+    "bindBufferBase": (
+        (('target', 'GLenum', False), ('index', 'GLuint', False), ('buffer', 'WebGLBuffer?', False)),
+    ),
+    "bindBufferRange": (
+        (('target', 'GLenum', False), ('index', 'GLuint', False), ('buffer', 'WebGLBuffer?', False), ('offset', 'GLintptr', False), ('size', 'GLsizeiptr', False)),
+    ),
+    "getIndexedParameter": (
+        (('target', 'GLenum', False), ('index', 'GLuint', False)),
+    ),
+    "getUniformIndices": (
+        (('program', 'WebGLProgram', False), ('uniformNames', 'sequence<DOMString>', False)),
+    ),
+    "getActiveUniforms": (
+        (('program', 'WebGLProgram', False), ('uniformIndices', 'sequence<GLuint>', False), ('pname', 'GLenum', False)),
+    ),
+    "getUniformBlockIndex": (
+        (('program', 'WebGLProgram', False), ('uniformBlockName', 'DOMString', False)),
+    ),
+    "getActiveUniformBlockParameter": (
+        (('program', 'WebGLProgram', False), ('uniformBlockIndex', 'GLuint', False), ('pname', 'GLenum', False)),
+    ),
+    "getActiveUniformBlockName": (
+        (('program', 'WebGLProgram', False), ('uniformBlockIndex', 'GLuint', False)),
+    ),
+    "uniformBlockBinding": (
+        (('program', 'WebGLProgram', False), ('uniformBlockIndex', 'GLuint', False), ('uniformBlockBinding', 'GLuint', False)),
+    ),
+    "createVertexArray": (
+        (),
+    ),
+    "deleteVertexArray": (
+        (('vertexArray', 'WebGLVertexArrayObject?', False),),
+    ),
+    "isVertexArray": (
+        (('vertexArray', 'WebGLVertexArrayObject?', False),),
+    ),
+    "bindVertexArray": (
+        (('array', 'WebGLVertexArrayObject?', False),),
+    ),
+}